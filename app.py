@@ -3,10 +3,30 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import random
 import time
 import base64
+import io
+import os
+import tempfile
+
+from src.cost_forecast import project_monthly_spend
+from src.inference_profile import LATENCY_PERCENTILES, profile_inference
+from src.data_generator import generate_sample_data, load_hardware_configs
+from src.providers import get_baseline_provider, load_provider_registry
+from src.report import CHAMPION_METRICS, generate_report
+from src.run_context import RunContext
+from src.run_diff import changed_rows, diff_runs
+from src.scaling import compare_provider_scaling
+from src.sensitivity import analyze_sensitivity, flip_thresholds
+from src.shared_results import SharedResultsRegistry
+from src.spot import compare_spot_pricing
+from src.visualizations import (
+    create_cost_per_hour_chart, create_latency_curve_chart, create_leaderboard,
+    create_platform_comparison_chart, create_radar_chart, create_small_multiples_chart
+)
+from src.utils import get_resource_price_table, get_winner, join_names
+from src.what_if import COST_COLUMNS, changed_rates, hourly_rates_with, reprice_results
+from src.workloads import get_workload_spec, load_workload_registry
 
 # Set page configuration
 st.set_page_config(
@@ -151,78 +171,6 @@ def retro_header(text, level=1):
     else:
         st.markdown(f'<h3 class="retro-header">{text}</h3>', unsafe_allow_html=True)
 
-# Generate sample data
-def generate_sample_data():
-    # Cloud providers
-    providers = ["FlexAI", "AWS", "GCP", "Azure"]
-    
-    # Workload types
-    workloads = [
-        "LLM Fine-Tuning (Llama 3 8B)",
-        "Batch Inference (Stable Diffusion XL)",
-        "CV Model Training (ResNet-50)"
-    ]
-    
-    # Generate random but sensible data
-    data = []
-    
-    # Make FlexAI generally better but not always the best
-    # to keep things realistic
-    for workload in workloads:
-        base_time = 0
-        base_cost = 0
-        
-        if "LLM" in workload:
-            base_time = 120  # minutes
-            base_cost = 25  # dollars
-        elif "Inference" in workload:
-            base_time = 45  # minutes
-            base_cost = 12  # dollars
-        else:  # CV Model
-            base_time = 180  # minutes
-            base_cost = 35  # dollars
-        
-        for provider in providers:
-            # Randomize with some bias
-            if provider == "FlexAI":
-                time_factor = random.uniform(0.7, 0.9)  # FlexAI is generally faster
-                cost_factor = random.uniform(0.6, 0.8)  # FlexAI is generally cheaper
-            else:
-                time_factor = random.uniform(0.9, 1.3)
-                cost_factor = random.uniform(0.9, 1.4)
-            
-            execution_time = base_time * time_factor
-            cost = base_cost * cost_factor
-            
-            # Calculate throughput based on workload
-            if "LLM" in workload:
-                throughput = 5000 / execution_time  # tokens per second
-                throughput_unit = "tokens/sec"
-            elif "Inference" in workload:
-                throughput = 1000 / execution_time  # images per minute
-                throughput_unit = "images/min"
-            else:  # CV Model
-                throughput = 50000 / execution_time  # images per hour
-                throughput_unit = "images/hour"
-            
-            # Generate GPU utilization
-            gpu_util = random.uniform(60, 95)
-            memory_usage = random.uniform(70, 98)
-            
-            data.append({
-                "Provider": provider,
-                "Workload": workload,
-                "Execution Time (min)": round(execution_time, 2),
-                "Cost ($)": round(cost, 2),
-                "Throughput": round(throughput, 2),
-                "Throughput Unit": throughput_unit,
-                "GPU Utilization (%)": round(gpu_util, 1),
-                "Memory Usage (%)": round(memory_usage, 1),
-                "Cost-Performance Ratio": round(cost / throughput, 4)
-            })
-    
-    return pd.DataFrame(data)
-
 # Simulate a loading animation for benchmark execution
 def simulate_benchmark_run():
     progress_bar = st.progress(0)
@@ -248,233 +196,667 @@ def simulate_benchmark_run():
     time.sleep(0.5)
     return True
 
-# Create a pixel art style visualization for provider comparison
-def create_platform_comparison_chart(df, workload, metric):
-    filtered_df = df[df["Workload"] == workload]
-    
-    # For execution time and cost, lower is better
-    if metric in ["Execution Time (min)", "Cost ($)"]:
-        best_provider = filtered_df.loc[filtered_df[metric].idxmin()]["Provider"]
-        # The chart will be sorted in ascending order
-        filtered_df = filtered_df.sort_values(by=metric)
-        color_scale = "Bluered_r"  # Reversed so blue (better) is for lower values
-    else:
-        # For throughput, higher is better
-        best_provider = filtered_df.loc[filtered_df[metric].idxmax()]["Provider"]
-        # The chart will be sorted in descending order
-        filtered_df = filtered_df.sort_values(by=metric, ascending=False)
-        color_scale = "Bluered"  # Blue (better) is for higher values
-    
-    # Create a discrete color map that highlights the best provider
-    colors = ["#0066cc" if provider == best_provider else "#ff66b2" 
-              for provider in filtered_df["Provider"]]
-    
-    # Create the bar chart
-    fig = px.bar(
-        filtered_df,
-        x="Provider",
-        y=metric,
-        color="Provider",
-        color_discrete_sequence=colors,
-        title=f"{metric} Comparison for {workload}"
+# Results shared by every session of this server process
+@st.cache_resource
+def get_results_registry():
+    registry = SharedResultsRegistry()
+    # Pre-generate some data for first load
+    registry.publish("default", generate_sample_data(), pinned=True)
+    return registry
+
+# Figures and tables derived from the results are cached per data version:
+# the dataset version (see DatasetHandle.version) and the what-if rate
+# changes, so reruns that leave the results unchanged reuse them. The
+# results are passed as `_df` so they are not hashed on every call. Figures
+# are shared read-only between sessions.
+def metric_version(data_version, metric):
+    # Prices only change cost columns: figures of other metrics are keyed by
+    # the dataset version alone and stay cached while prices are edited
+    results_version, _ = data_version
+    return data_version if metric in COST_COLUMNS else (results_version, ())
+
+@st.cache_resource(max_entries=64)
+def cached_repriced_results(data_version, _df):
+    _, rate_changes = data_version
+    return reprice_results(_df, rate_changes)
+
+@st.cache_resource(max_entries=256)
+def cached_comparison_chart(data_version, _df, workload, metric):
+    return create_platform_comparison_chart(_df, workload, metric)
+
+@st.cache_resource(max_entries=256)
+def cached_radar_chart(data_version, _df, workload):
+    return create_radar_chart(_df, workload)
+
+@st.cache_resource(max_entries=256)
+def cached_cost_per_hour_chart(data_version, _df, workload):
+    return create_cost_per_hour_chart(_df, workload)
+
+@st.cache_resource(max_entries=64)
+def cached_small_multiples_chart(data_version, _df):
+    return create_small_multiples_chart(_df)
+
+@st.cache_data(max_entries=256)
+def cached_cost_breakdown(data_version, _df, workload):
+    filtered_data = _df[_df["Workload"] == workload]
+    cost_table = filtered_data[["Provider", "Cost ($)", "Execution Time (min)", "Cost per Minute ($)"]]
+    cost_table = cost_table.sort_values(by="Cost per Minute ($)")
+    
+    # Format the table
+    formatted_table = cost_table.assign(**{
+        "Cost ($)": cost_table["Cost ($)"].map("${:.2f}".format),
+        "Cost per Minute ($)": cost_table["Cost per Minute ($)"].map("${:.4f}".format)
+    })
+    return formatted_table.rename(columns={
+        "Provider": "CLOUD PROVIDER",
+        "Cost ($)": "TOTAL COST",
+        "Execution Time (min)": "RUNTIME (MIN)",
+        "Cost per Minute ($)": "COST PER MINUTE"
+    })
+
+@st.cache_data(max_entries=256)
+def cached_leaderboard(data_version, _df, workload, metric, label):
+    leaderboard = create_leaderboard(_df, workload, metric)
+    return leaderboard.rename(columns={
+        "Rank": "RANK",
+        "Provider": "PROVIDER",
+        metric: label
+    })
+
+@st.cache_data(max_entries=256)
+def cached_overall_champion(data_version, _df, workload):
+    # Same points as the report and the sensitivity analysis
+    winner, rankings = get_winner(_df, workload, CHAMPION_METRICS)
+    
+    # Create a points table
+    points_df = pd.DataFrame(
+        list(rankings.items()), columns=["Provider", "Points"]
+    ).sort_values(by="Points", ascending=False, kind="stable")
+    points_df["Rank"] = range(1, len(points_df) + 1)
+    points_df = points_df[["Rank", "Provider", "Points"]]
+    
+    return winner, rankings[winner], points_df
+
+@st.cache_data(max_entries=128)
+def cached_champion_stability(data_version, _df, workload, range_pct):
+    win_shares, _ = analyze_sensitivity(_df, workload, rel_range=range_pct / 100, seed=0)
+    thresholds = flip_thresholds(_df, workload).dropna().head(5)
+    
+    win_shares = win_shares.assign(**{
+        "Win Share (%)": win_shares["Win Share (%)"].map("{:.1f}%".format)
+    })[["Provider", "Win Share (%)"]]
+    thresholds = thresholds.assign(**{
+        "Flip At (%)": thresholds["Flip At (%)"].map("{:+.1f}%".format)
+    })
+    return win_shares.rename(columns={
+        "Provider": "PROVIDER",
+        "Win Share (%)": "WIN SHARE"
+    }), thresholds.rename(columns={
+        "Provider": "PROVIDER",
+        "Metric": "METRIC",
+        "Flip At (%)": "CHANGE",
+        "New Champion": "NEW CHAMPION"
+    })
+
+@st.cache_data(max_entries=16)
+def cached_results_csv(data_version, _df):
+    return _df.to_csv(index=False).encode()
+
+@st.cache_data(max_entries=16)
+def cached_run_diff(data_version, _df, baseline_csv):
+    return diff_runs(pd.read_csv(io.BytesIO(baseline_csv)), _df)
+
+@st.cache_data(max_entries=256)
+def cached_diff_table(data_version, baseline_csv, _diff, workload, only_changes):
+    workload_diff = _diff[_diff["Workload"] == workload]
+    if only_changes:
+        workload_diff = changed_rows(workload_diff)
+    
+    # Added and removed rows have no value on one side
+    def formatter(pattern):
+        return lambda value: "—" if pd.isna(value) else pattern.format(value)
+    
+    def rank(before, after):
+        if pd.isna(before) or pd.isna(after):
+            return "—"
+        return f"#{before:.0f} → #{after:.0f}"
+    
+    diff_table = workload_diff[["Provider", "GPU", "Metric", "Status"]].copy()
+    for column in ["Before", "After", "Delta"]:
+        diff_table[column] = workload_diff[column].map(formatter("{:,.4g}"))
+    diff_table["Delta (%)"] = workload_diff["Delta (%)"].map(formatter("{:+.1f}%"))
+    diff_table["Significant"] = workload_diff["Significant"].map({True: "✔", False: ""})
+    diff_table["Rank"] = [
+        rank(before, after)
+        for before, after in zip(workload_diff["Rank Before"], workload_diff["Rank After"])
+    ]
+    return diff_table.rename(columns={
+        "Provider": "PROVIDER",
+        "GPU": "GPU",
+        "Metric": "METRIC",
+        "Status": "STATUS",
+        "Before": "BEFORE",
+        "After": "NOW",
+        "Delta": "DELTA",
+        "Delta (%)": "DELTA (%)",
+        "Significant": "SIGNIFICANT",
+        "Rank": "RANK"
+    })
+
+# Simulation panels only depend on their inputs, not on the results
+@st.cache_data(max_entries=128)
+def cached_scaling_limits(workload, gpu_by_provider, min_efficiency):
+    scaling_limits = compare_provider_scaling(
+        workload, min_efficiency=min_efficiency, gpu_by_provider=gpu_by_provider
+    )
+    scaling_table = scaling_limits[[
+        "Provider", "GPU", "GPUs", "Nodes", "Execution Time (min)", "Cost ($)", "Scaling Efficiency"
+    ]].copy()
+    scaling_table["Execution Time (min)"] = scaling_table["Execution Time (min)"].map("{:.1f}".format)
+    scaling_table["Cost ($)"] = scaling_table["Cost ($)"].map("${:.2f}".format)
+    scaling_table["Scaling Efficiency"] = scaling_table["Scaling Efficiency"].map("{:.0%}".format)
+    return scaling_table.rename(columns={
+        "Provider": "CLOUD PROVIDER",
+        "GPU": "GPU",
+        "GPUs": "MAX EFFICIENT GPUS",
+        "Nodes": "NODES",
+        "Execution Time (min)": "RUNTIME (MIN)",
+        "Cost ($)": "COST",
+        "Scaling Efficiency": "EFFICIENCY"
+    })
+
+@st.cache_data(max_entries=128)
+def cached_monthly_projection(workload, jobs_per_day, gpu_by_provider, rate_changes):
+    projection = project_monthly_spend(
+        [{"Workload": workload, "Jobs per Day": jobs_per_day}],
+        gpu_by_provider=gpu_by_provider,
+        hourly_rates=hourly_rates_with(rate_changes)
+    )
+    projection = projection.sort_values(by="P50 Monthly Spend ($)")
+    
+    # Format the bands for display
+    formatted_projection = projection[[
+        "Provider", "P5 Monthly Spend ($)", "P50 Monthly Spend ($)",
+        "P95 Monthly Spend ($)", "P50 Savings ($)"
+    ]].copy()
+    for column in formatted_projection.columns[1:]:
+        formatted_projection[column] = formatted_projection[column].map("${:,.2f}".format)
+    return formatted_projection.rename(columns={
+        "Provider": "CLOUD PROVIDER",
+        "P5 Monthly Spend ($)": "LOW (P5)",
+        "P50 Monthly Spend ($)": "EXPECTED (P50)",
+        "P95 Monthly Spend ($)": "HIGH (P95)",
+        "P50 Savings ($)": f"{get_baseline_provider().upper()} SAVINGS (P50)"
+    })
+
+# Fixed seed: the same settings always show the same curves
+@st.cache_resource(max_entries=64)
+def cached_latency_curve_chart(workload, gpu_by_provider, batch_size, concurrency, percentile):
+    profile = profile_inference(
+        workload,
+        gpu_by_provider,
+        batch_sizes=(batch_size,),
+        concurrency=concurrency,
+        n_requests=2000,
+        context=RunContext(0)
+    )
+    return create_latency_curve_chart(profile, percentile)
+
+@st.cache_data(max_entries=128)
+def cached_spot_comparison(workload, gpu_by_provider, checkpoint_interval, rate_changes):
+    spot_comparison = compare_spot_pricing(
+        workload,
+        gpu_by_provider,
+        hourly_rates=hourly_rates_with(rate_changes),
+        checkpoint_interval_min=checkpoint_interval
+    ).sort_values(by="Spot Cost ($)")
+    
+    formatted_spot = spot_comparison.copy()
+    for column in ["On-Demand Cost ($)", "Spot Cost ($)", "P95 Spot Cost ($)"]:
+        formatted_spot[column] = formatted_spot[column].map("${:.2f}".format)
+    for column in ["On-Demand Time (min)", "Spot Time (min)", "P95 Spot Time (min)"]:
+        formatted_spot[column] = formatted_spot[column].map("{:.1f}".format)
+    formatted_spot["Interruptions"] = formatted_spot["Interruptions"].map("{:.2f}".format)
+    return formatted_spot.rename(columns={
+        "Provider": "CLOUD PROVIDER",
+        "On-Demand Cost ($)": "ON-DEMAND COST",
+        "Spot Cost ($)": "SPOT COST",
+        "P95 Spot Cost ($)": "SPOT COST (P95)",
+        "On-Demand Time (min)": "ON-DEMAND (MIN)",
+        "Spot Time (min)": "SPOT (MIN)",
+        "P95 Spot Time (min)": "SPOT (MIN, P95)",
+        "Interruptions": "AVG. INTERRUPTIONS"
+    })
+
+# Panels with their own controls are fragments: moving a control reruns the
+# panel only, not the rest of the page
+@st.fragment
+def scaling_panel(workload, gpu_by_provider):
+    # Multi-GPU scaling limits
+    st.markdown("### Multi-GPU Scaling")
+    
+    min_efficiency = st.slider(
+        "MIN. SCALING EFFICIENCY:",
+        min_value=0.1,
+        max_value=0.9,
+        value=0.5,
+        step=0.05,
+        key="min_scaling_efficiency"
     )
     
-    # Update layout for retro gaming style with light pink theme
-    fig.update_layout(
-        font_family="Space Mono, monospace",
-        font_color="#0a0a20",
-        title_font_family="VT323, monospace",
-        title_font_color="#0066cc",
-        title_font_size=24,
-        plot_bgcolor="#ffe6f2",
-        paper_bgcolor="#ffe6f2",
-        xaxis=dict(
-            title_font_family="Space Mono, monospace",
-            title_font_color="#0a0a20",
-            tickfont_family="Space Mono, monospace",
-            tickfont_color="#0a0a20",
-            gridcolor="#ffb3d9",
-            gridwidth=0.5,
-            zeroline=False
-        ),
-        yaxis=dict(
-            title_font_family="Space Mono, monospace",
-            title_font_color="#0a0a20",
-            tickfont_family="Space Mono, monospace",
-            tickfont_color="#0a0a20",
-            gridcolor="#ffb3d9",
-            gridwidth=0.5,
-            zeroline=False
-        ),
-        showlegend=False
+    st.table(cached_scaling_limits(workload, gpu_by_provider, min_efficiency))
+
+@st.fragment
+def budget_projection_panel(workload, gpu_by_provider, rate_changes):
+    # Monthly budget projection
+    st.markdown("### Monthly Budget Projection")
+    
+    jobs_per_day = st.number_input(
+        "JOBS PER DAY:",
+        min_value=1,
+        max_value=1000,
+        value=10,
+        key="jobs_per_day"
     )
     
-    # Add pixel-style border
-    fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper",
-                yref="paper",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=1,
-                line=dict(
-                    color="#ff66b2",
-                    width=3,
-                )
-            )
-        ]
+    st.table(cached_monthly_projection(workload, jobs_per_day, gpu_by_provider, rate_changes))
+
+@st.fragment
+def spot_panel(workload, gpu_by_provider, rate_changes):
+    # Spot/preemptible capacity
+    st.markdown("### Spot vs On-Demand")
+    
+    checkpoint_interval = st.slider(
+        "CHECKPOINT EVERY (MIN):",
+        min_value=5,
+        max_value=120,
+        value=30,
+        step=5,
+        key="checkpoint_interval"
     )
     
-    # Add text labels on top of bars
-    fig.update_traces(
-        texttemplate='%{y}', 
-        textposition='outside',
-        textfont=dict(
-            family="VT323, monospace",
-            size=18,
-            color="#0066cc"
+    st.table(cached_spot_comparison(workload, gpu_by_provider, checkpoint_interval, rate_changes))
+
+@st.fragment
+def inference_latency_panel(workload, gpu_by_provider):
+    # Request latency percentiles of a served model under growing load
+    st.markdown("### ⏱ Serving Latency")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        batch_size = st.select_slider(
+            "MAX BATCH SIZE:",
+            options=[1, 2, 4, 8, 16, 32],
+            value=8,
+            key="inference_batch_size"
+        )
+    with col2:
+        concurrency = st.number_input(
+            "MODEL REPLICAS:",
+            min_value=1,
+            max_value=8,
+            value=1,
+            key="inference_concurrency"
         )
+    with col3:
+        percentile = st.radio(
+            "PERCENTILE:",
+            LATENCY_PERCENTILES,
+            index=len(LATENCY_PERCENTILES) - 1,
+            format_func="P{}".format,
+            horizontal=True,
+            key="inference_percentile"
+        )
+    
+    fig = cached_latency_curve_chart(workload, gpu_by_provider, batch_size, concurrency, percentile)
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def champion_stability_panel(benchmark_data, data_version, workload):
+    # How often the champion keeps its title when the results move a little
+    st.markdown("### 🎲 Champion Stability")
+    
+    range_pct = st.slider(
+        "PERTURB METRICS AND PRICES BY UP TO (±%):",
+        min_value=1,
+        max_value=25,
+        value=5,
+        key="sensitivity_range"
+    )
+    
+    win_shares, thresholds = cached_champion_stability(
+        data_version, benchmark_data, workload, range_pct
     )
     
-    return fig
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("WINS OUT OF 100,000 PERTURBED RUNS")
+        st.table(win_shares)
+    with col2:
+        st.markdown("SMALLEST SINGLE CHANGES THAT FLIP THE CHAMPION")
+        st.table(thresholds)
 
-# Create a radar chart comparing all metrics
-def create_radar_chart(df, workload):
-    filtered_df = df[df["Workload"] == workload]
+def render_performance_tab(benchmark_data, data_version, selected_workload, gpu_by_provider):
+    retro_header("Performance Metrics", level=2)
+    
+    # Performance metrics section
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig1 = cached_comparison_chart(
+            metric_version(data_version, "Execution Time (min)"),
+            benchmark_data,
+            selected_workload,
+            "Execution Time (min)"
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+    
+    with col2:
+        fig2 = cached_comparison_chart(
+            metric_version(data_version, "Throughput"),
+            benchmark_data,
+            selected_workload,
+            "Throughput"
+        )
+        st.plotly_chart(fig2, use_container_width=True)
     
-    # Normalize the metrics for the radar chart
-    metrics = ["Execution Time (min)", "Cost ($)", "Throughput", 
-               "GPU Utilization (%)", "Memory Usage (%)"]
+    # Radar chart for all metrics
+    st.markdown("### Overall Performance Comparison")
+    radar_fig = cached_radar_chart(data_version, benchmark_data, selected_workload)
+    st.plotly_chart(radar_fig, use_container_width=True)
     
-    # Create a copy to avoid modifying the original dataframe
-    radar_df = filtered_df.copy()
+    # Every workload and metric in one figure
+    st.markdown("### All Workloads at a Glance")
+    small_multiples_fig = cached_small_multiples_chart(data_version, benchmark_data)
+    st.plotly_chart(small_multiples_fig, use_container_width=True)
     
-    # For each metric, normalize to a 0-1 scale
-    # For time and cost, lower is better, so we invert those
-    for metric in metrics:
-        if metric in ["Execution Time (min)", "Cost ($)"]:
-            min_val = radar_df[metric].min()
-            max_val = radar_df[metric].max()
-            radar_df[f"{metric} (normalized)"] = 1 - ((radar_df[metric] - min_val) / (max_val - min_val) if max_val > min_val else 0)
-        else:
-            min_val = radar_df[metric].min()
-            max_val = radar_df[metric].max()
-            radar_df[f"{metric} (normalized)"] = (radar_df[metric] - min_val) / (max_val - min_val) if max_val > min_val else 0
+    # Additional performance metrics
+    filtered_data = benchmark_data[
+        benchmark_data["Workload"] == selected_workload
+    ]
+    
+    # Display gpu utilization and memory usage
+    st.markdown("### Resource Utilization")
+    
+    # Four cards per row, however many providers are registered
+    for i, provider in enumerate(filtered_data["Provider"]):
+        if i % 4 == 0:
+            columns = st.columns(4)
+        provider_data = filtered_data[filtered_data["Provider"] == provider]
+        
+        with columns[i % 4]:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-label">{provider} GPU Util.</div>
+                <div class="metric-value">{provider_data["GPU Utilization (%)"].values[0]}%</div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-label">{provider} Memory</div>
+                <div class="metric-value">{provider_data["Memory Usage (%)"].values[0]}%</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    scaling_panel(selected_workload, gpu_by_provider)
+    
+    if "Inference" in get_workload_spec(selected_workload):
+        inference_latency_panel(selected_workload, gpu_by_provider)
+
+def render_cost_tab(benchmark_data, data_version, selected_workload, gpu_by_provider):
+    retro_header("Cost Analysis", level=2)
+    
+    # Cost metrics section
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig3 = cached_comparison_chart(
+            metric_version(data_version, "Cost ($)"),
+            benchmark_data,
+            selected_workload,
+            "Cost ($)"
+        )
+        st.plotly_chart(fig3, use_container_width=True)
+    
+    with col2:
+        fig4 = cached_cost_per_hour_chart(data_version, benchmark_data, selected_workload)
+        st.plotly_chart(fig4, use_container_width=True)
     
-    # Create the radar chart
-    fig = go.Figure()
+    # Cost savings calculation
+    baseline = get_baseline_provider()
+    filtered_data = benchmark_data[
+        benchmark_data["Workload"] == selected_workload
+    ]
+    baseline_data = filtered_data[filtered_data["Provider"] == baseline]
+    competitors = [provider for provider in filtered_data["Provider"] if provider != baseline]
+    
+    if not baseline_data.empty:
+        st.markdown(f"### Estimated Cost Savings with {baseline}")
+        baseline_cost = baseline_data["Cost ($)"].values[0]
+    else:
+        # Results without the baseline have nothing to compare against
+        competitors = []
+    
+    # Three cards per row, however many providers are registered
+    for i, provider in enumerate(competitors):
+        if i % 3 == 0:
+            columns = st.columns(3)
+        provider_data = filtered_data[filtered_data["Provider"] == provider]
+        provider_cost = provider_data["Cost ($)"].values[0]
+        savings = provider_cost - baseline_cost
+        savings_pct = (savings / provider_cost) * 100
+        
+        with columns[i % 3]:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-label">vs {provider}</div>
+                <div class="metric-value">${savings:.2f}</div>
+                <div class="metric-label">({savings_pct:.1f}% savings)</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Cost comparison table
+    st.markdown("### Detailed Cost Breakdown")
+    st.table(cached_cost_breakdown(data_version, benchmark_data, selected_workload))
+    
+    budget_projection_panel(selected_workload, gpu_by_provider, data_version[1])
+    spot_panel(selected_workload, gpu_by_provider, data_version[1])
+
+def render_leaderboard_tab(benchmark_data, data_version, selected_workload):
+    retro_header("Performance Leaderboard", level=2)
+    
+    throughput_unit = benchmark_data[
+        benchmark_data["Workload"] == selected_workload
+    ]["Throughput Unit"].iloc[0]
     
-    colors = ["#0066cc", "#ff66b2", "#33cc33", "#cc6600"]
+    # Create leaderboards for different metrics
+    col1, col2 = st.columns(2)
     
-    for i, provider in enumerate(radar_df["Provider"]):
-        provider_data = radar_df[radar_df["Provider"] == provider]
+    with col1:
+        st.markdown("### 🚀 Speed Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "Execution Time (min)"), benchmark_data, selected_workload,
+            "Execution Time (min)", "TIME (MIN)"
+        ))
         
-        fig.add_trace(go.Scatterpolar(
-            r=[
-                provider_data[f"Execution Time (min) (normalized)"].values[0],
-                provider_data[f"Cost ($) (normalized)"].values[0],
-                provider_data[f"Throughput (normalized)"].values[0],
-                provider_data[f"GPU Utilization (%) (normalized)"].values[0],
-                provider_data[f"Memory Usage (%) (normalized)"].values[0],
-                provider_data[f"Execution Time (min) (normalized)"].values[0],  # Close the loop
-            ],
-            theta=[
-                "Speed",
-                "Cost",
-                "Throughput",
-                "GPU Utilization",
-                "Memory Efficiency",
-                "Speed"  # Close the loop
-            ],
-            name=provider,
-            line=dict(color=colors[i], width=3),
-            fill='toself',
-            fillcolor='rgba(0, 102, 204, 0.2)' if i == 0 else 
-                      'rgba(255, 102, 178, 0.2)' if i == 1 else
-                      'rgba(51, 204, 51, 0.2)' if i == 2 else
-                      'rgba(204, 102, 0, 0.2)'  # Proper rgba format
+        st.markdown("### 💡 Throughput Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "Throughput"), benchmark_data, selected_workload,
+            "Throughput", f"THROUGHPUT ({throughput_unit})"
         ))
     
-    # Update layout for light pink theme
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 1],
-                showticklabels=False,
-                gridcolor="#ffb3d9",
-                gridwidth=0.5
-            ),
-            angularaxis=dict(
-                gridcolor="#ffb3d9",
-                gridwidth=0.5
-            ),
-            bgcolor="#ffe6f2"
-        ),
-        font_family="Space Mono, monospace",
-        font_color="#0a0a20",
-        title=dict(
-            text=f"Performance Radar for {workload}",
-            font=dict(
-                family="VT323, monospace",
-                size=24,
-                color="#0066cc"
-            )
-        ),
-        paper_bgcolor="#ffe6f2",
-        plot_bgcolor="#ffe6f2",
-        showlegend=True,
-        legend=dict(
-            font=dict(
-                family="Space Mono, monospace",
-                size=12,
-                color="#0a0a20"
-            )
-        )
+    with col2:
+        st.markdown("### 💰 Cost Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "Cost ($)"), benchmark_data, selected_workload,
+            "Cost ($)", "COST ($)"
+        ))
+        
+        # Display cost-performance ratio
+        st.markdown("### 🏅 Cost-Performance Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "Cost-Performance Ratio"), benchmark_data, selected_workload,
+            "Cost-Performance Ratio", "COST/PERFORMANCE"
+        ))
+    
+    # Energy efficiency, next to cost efficiency
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### ⚡ Energy Efficiency Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "Throughput per Watt"), benchmark_data, selected_workload,
+            "Throughput per Watt", f"THROUGHPUT/WATT ({throughput_unit})"
+        ))
+    
+    with col2:
+        st.markdown("### 🌱 Carbon Champions")
+        st.table(cached_leaderboard(
+            metric_version(data_version, "CO2e (kg)"), benchmark_data, selected_workload,
+            "CO2e (kg)", "CO2E (KG)"
+        ))
+    
+    # Overall winner determination
+    st.markdown("### 👑 OVERALL CHAMPION")
+    
+    winner, winner_points, points_df = cached_overall_champion(
+        data_version, benchmark_data, selected_workload
     )
     
-    # Add pixel-style border
-    fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper",
-                yref="paper",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=1,
-                line=dict(
-                    color="#ff66b2",
-                    width=3,
-                )
-            )
-        ]
+    # Display the winner
+    st.markdown(f"""
+    <div style="text-align: center; margin: 20px 0;">
+        <div style="font-family: 'VT323', monospace; font-size: 36px; color: #0066cc;">
+            👑 {winner} 👑
+        </div>
+        <div style="font-family: 'Space Mono', monospace; font-size: 18px; color: #0a0a20;">
+            BENCHMARK CHAMPION
+        </div>
+        <div style="font-family: 'Space Mono', monospace; font-size: 14px; color: #0a0a20; margin-top: 10px;">
+            with {winner_points} total points
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Display the points table
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        points_df = points_df.rename(columns={
+            "Rank": "POSITION",
+            "Provider": "PROVIDER",
+            "Points": "TOTAL POINTS"
+        })
+        st.table(points_df)
+    
+    champion_stability_panel(benchmark_data, data_version, selected_workload)
+
+def render_compare_tab(benchmark_data, data_version, selected_workload):
+    retro_header("Run Comparison", level=2)
+    
+    st.markdown("Save these results, then upload them next time to see what changed between the two runs.")
+    st.download_button(
+        "⬇ SAVE RESULTS (CSV)",
+        cached_results_csv(data_version, benchmark_data),
+        file_name="benchmark_results.csv",
+        mime="text/csv"
     )
     
-    return fig
+    baseline_file = st.file_uploader("EARLIER RUN (CSV):", type="csv", key="compare_baseline")
+    if baseline_file is None:
+        return
+    
+    baseline_csv = baseline_file.getvalue()
+    try:
+        diff = cached_run_diff(data_version, benchmark_data, baseline_csv)
+    except (KeyError, ValueError) as e:
+        st.error(f"Cannot compare with this file: {e}")
+        return
+    
+    # Headline counts over every workload
+    col1, col2, col3 = st.columns(3)
+    for col, label, count in [
+        (col1, "Significant Changes", diff["Significant"].sum()),
+        (col2, "Rank Changes", (diff["Rank Change"].fillna(0) != 0).sum()),
+        (col3, "Added / Removed", diff[diff["Status"] != "Matched"][
+            ["Provider", "Workload", "GPU"]
+        ].drop_duplicates().shape[0])
+    ]:
+        with col:
+            st.markdown(f"""
+            <div class="metric-container">
+                <div class="metric-label">{label}</div>
+                <div class="metric-value">{count}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    only_changes = st.checkbox("ONLY SHOW CHANGES", value=True, key="compare_only_changes")
+    st.markdown(f"### {selected_workload}")
+    st.table(cached_diff_table(data_version, baseline_csv, diff, selected_workload, only_changes))
+    
+    st.download_button(
+        "⬇ DOWNLOAD DIFF (CSV)",
+        diff.to_csv(index=False).encode(),
+        file_name="run_diff.csv",
+        mime="text/csv"
+    )
 
-# Create leaderboard-style table
-def create_leaderboard(df, workload, metric):
-    filtered_df = df[df["Workload"] == workload]
+def what_if_pricing():
+    # Hourly rates the results are shown at, list prices until edited
+    with st.expander("💲 WHAT-IF PRICING"):
+        st.markdown("Edit hourly rates to see every cost, savings figure and ranking at those prices.")
+        
+        list_prices = get_resource_price_table()[["Provider", "GPU", "Hourly Rate"]]
+        edited_prices = st.data_editor(
+            list_prices,
+            key="what_if_prices",
+            hide_index=True,
+            disabled=["Provider", "GPU"],
+            column_config={
+                "Hourly Rate": st.column_config.NumberColumn(
+                    "HOURLY RATE ($)", min_value=0.01, step=0.01, format="$%.2f"
+                )
+            }
+        )
+        rate_changes = changed_rates(edited_prices, list_prices)
+        
+        if rate_changes:
+            st.button(
+                "↺ RESET TO LIST PRICES",
+                on_click=lambda: st.session_state.pop("what_if_prices", None)
+            )
     
-    # Determine sorting order based on metric
-    ascending = True if metric in ["Execution Time (min)", "Cost ($)"] else False
+    return rate_changes
+
+# Only the open tab runs: switching tabs reruns this fragment, which renders
+# the newly opened tab and nothing else. Editing prices also reruns just this
+# fragment: only cost columns are recomputed and only cost figures rebuilt.
+@st.fragment
+def results_tabs(benchmark_data, results_version, selected_workload, gpu_by_provider):
+    data_version = (results_version, what_if_pricing())
+    benchmark_data = cached_repriced_results(data_version, benchmark_data)
+    
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["📊 PERFORMANCE", "💰 COST", "🏆 LEADERBOARD", "🔀 COMPARE"],
+        key="results_tab",
+        on_change="rerun"
+    )
     
-    # Sort and rank
-    sorted_df = filtered_df.sort_values(by=metric, ascending=ascending)
-    sorted_df["Rank"] = range(1, len(sorted_df) + 1)
+    if tab1.open:
+        with tab1:
+            render_performance_tab(benchmark_data, data_version, selected_workload, gpu_by_provider)
     
-    # Select columns to display
-    display_df = sorted_df[["Rank", "Provider", metric]]
+    if tab2.open:
+        with tab2:
+            render_cost_tab(benchmark_data, data_version, selected_workload, gpu_by_provider)
     
-    # Format for display
-    display_df["Rank"] = display_df["Rank"].apply(lambda x: f"{x}")
+    if tab3.open:
+        with tab3:
+            render_leaderboard_tab(benchmark_data, data_version, selected_workload)
     
-    return display_df
+    if tab4.open:
+        with tab4:
+            render_compare_tab(benchmark_data, data_version, selected_workload)
 
 # Main application
 def main():
@@ -497,21 +879,14 @@ def main():
     # Sidebar controls
     selected_workload = st.sidebar.selectbox(
         "SELECT WORKLOAD:",
-        [
-            "LLM Fine-Tuning (Llama 3 8B)",
-            "Batch Inference (Stable Diffusion XL)",
-            "CV Model Training (ResNet-50)"
-        ]
+        list(load_workload_registry())
     )
     
     # Hardware configuration (for demonstration)
     st.sidebar.markdown("<p style='text-align: center; color: #0a0a20;'>HARDWARE CONFIGURATION</p>", unsafe_allow_html=True)
     
     gpu_options = {
-        "AWS": ["NVIDIA A100", "NVIDIA T4", "NVIDIA V100"],
-        "GCP": ["NVIDIA A100", "NVIDIA T4", "NVIDIA L4"],
-        "Azure": ["NVIDIA A100", "NVIDIA T4", "NVIDIA K80"],
-        "FlexAI": ["NVIDIA A100", "NVIDIA H100", "NVIDIA T4"]
+        provider: config["GPUs"] for provider, config in load_hardware_configs().items()
     }
     
     # Hardware configuration for each provider
@@ -522,13 +897,55 @@ def main():
             key=f"gpu_{provider}"
         )
     
+    # Every session reads the shared results until it runs its own benchmark
+    if 'benchmark_handle' not in st.session_state:
+        st.session_state.benchmark_handle = get_results_registry().acquire("default")
+    
+    # A run id from an earlier run regenerates its results
+    replay_run_id = st.sidebar.text_input("REPLAY RUN ID:", key="replay_run_id").strip()
+    
     # Run benchmark button
     if st.sidebar.button("▶ RUN BENCHMARK"):
-        with st.spinner("Executing benchmark..."):
-            success = simulate_benchmark_run()
-            if success:
-                st.session_state.benchmark_run = True
-                st.session_state.benchmark_data = generate_sample_data()
+        try:
+            context = RunContext.from_run_id(replay_run_id) if replay_run_id else RunContext()
+        except ValueError:
+            st.sidebar.error(f"Invalid run id: {replay_run_id}")
+        else:
+            with st.spinner("Executing benchmark..."):
+                success = simulate_benchmark_run()
+                if success:
+                    st.session_state.benchmark_run = True
+                    st.session_state.run_id = context.run_id
+                    st.session_state.benchmark_handle.replace(generate_sample_data({
+                        provider: st.session_state[f"gpu_{provider}"] for provider in gpu_options
+                    }, context))
+                    st.session_state.pop("benchmark_report", None)
+    
+    if "run_id" in st.session_state:
+        st.sidebar.caption(f"RUN ID: {st.session_state.run_id}")
+    
+    benchmark_data = st.session_state.benchmark_handle.data
+    
+    # Shareable report of the current run
+    if st.session_state.get("benchmark_run"):
+        if st.sidebar.button("📄 BUILD REPORT"):
+            with st.spinner("Building report..."):
+                with tempfile.TemporaryDirectory() as report_dir:
+                    report_path = generate_report(
+                        benchmark_data,
+                        os.path.join(report_dir, "flexai_benchmark_report.html"),
+                        workers=1
+                    )
+                    with open(report_path, "rb") as f:
+                        st.session_state.benchmark_report = f.read()
+        
+        if "benchmark_report" in st.session_state:
+            st.sidebar.download_button(
+                "⬇ DOWNLOAD REPORT",
+                st.session_state.benchmark_report,
+                file_name="flexai_benchmark_report.html",
+                mime="text/html"
+            )
     
     # Credits
     st.sidebar.markdown("---")
@@ -548,335 +965,25 @@ def main():
     if 'benchmark_run' not in st.session_state:
         st.session_state.benchmark_run = False
     
-    if 'benchmark_data' not in st.session_state:
-        # Pre-generate some data for first load
-        st.session_state.benchmark_data = generate_sample_data()
-    
     # Display benchmark results
     if st.session_state.benchmark_run:
-        # Tabs for different views
-        tab1, tab2, tab3 = st.tabs(["📊 PERFORMANCE", "💰 COST", "🏆 LEADERBOARD"])
-        
-        with tab1:
-            retro_header("Performance Metrics", level=2)
-            
-            # Performance metrics section
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig1 = create_platform_comparison_chart(
-                    st.session_state.benchmark_data, 
-                    selected_workload, 
-                    "Execution Time (min)"
-                )
-                st.plotly_chart(fig1, use_container_width=True)
-            
-            with col2:
-                fig2 = create_platform_comparison_chart(
-                    st.session_state.benchmark_data, 
-                    selected_workload, 
-                    "Throughput"
-                )
-                st.plotly_chart(fig2, use_container_width=True)
-            
-            # Radar chart for all metrics
-            st.markdown("### Overall Performance Comparison")
-            radar_fig = create_radar_chart(st.session_state.benchmark_data, selected_workload)
-            st.plotly_chart(radar_fig, use_container_width=True)
-            
-            # Additional performance metrics
-            filtered_data = st.session_state.benchmark_data[
-                st.session_state.benchmark_data["Workload"] == selected_workload
-            ]
-            
-            # Display gpu utilization and memory usage
-            st.markdown("### Resource Utilization")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            for i, provider in enumerate(filtered_data["Provider"]):
-                provider_data = filtered_data[filtered_data["Provider"] == provider]
-                col = [col1, col2, col3, col4][i]
-                
-                with col:
-                    st.markdown(f"""
-                    <div class="metric-container">
-                        <div class="metric-label">{provider} GPU Util.</div>
-                        <div class="metric-value">{provider_data["GPU Utilization (%)"].values[0]}%</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown(f"""
-                    <div class="metric-container">
-                        <div class="metric-label">{provider} Memory</div>
-                        <div class="metric-value">{provider_data["Memory Usage (%)"].values[0]}%</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
-        with tab2:
-            retro_header("Cost Analysis", level=2)
-            
-            # Cost metrics section
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig3 = create_platform_comparison_chart(
-                    st.session_state.benchmark_data, 
-                    selected_workload, 
-                    "Cost ($)"
-                )
-                st.plotly_chart(fig3, use_container_width=True)
-            
-            # Calculate cost efficiency metrics
-            filtered_data = st.session_state.benchmark_data[
-                st.session_state.benchmark_data["Workload"] == selected_workload
-            ]
-            
-            # Add cost efficiency calculation
-            filtered_data["Cost per Hour ($)"] = filtered_data["Cost ($)"] / (filtered_data["Execution Time (min)"] / 60)
-            
-            with col2:
-                # Create bar chart for cost per hour
-                fig4 = px.bar(
-                    filtered_data.sort_values(by="Cost per Hour ($)"),
-                    x="Provider", 
-                    y="Cost per Hour ($)",
-                    color="Provider",
-                    color_discrete_sequence=["#0066cc", "#ff66b2", "#33cc33", "#cc6600"],
-                    title="Hourly Cost Comparison"
-                )
-                
-                # Update layout for retro gaming style with light pink theme
-                fig4.update_layout(
-                    font_family="Space Mono, monospace",
-                    font_color="#0a0a20",
-                    title_font_family="VT323, monospace",
-                    title_font_color="#0066cc",
-                    title_font_size=24,
-                    plot_bgcolor="#ffe6f2",
-                    paper_bgcolor="#ffe6f2",
-                    xaxis=dict(
-                        title_font_family="Space Mono, monospace",
-                        title_font_color="#0a0a20",
-                        tickfont_family="Space Mono, monospace",
-                        tickfont_color="#0a0a20",
-                        gridcolor="#ffb3d9",
-                        gridwidth=0.5,
-                    ),
-                    yaxis=dict(
-                        title_font_family="Space Mono, monospace",
-                        title_font_color="#0a0a20",
-                        tickfont_family="Space Mono, monospace",
-                        tickfont_color="#0a0a20",
-                        gridcolor="#ffb3d9",
-                        gridwidth=0.5,
-                    ),
-                    showlegend=False
-                )
-                
-                # Add text labels on top of bars
-                fig4.update_traces(
-                    texttemplate='$%{y:.2f}', 
-                    textposition='outside',
-                    textfont=dict(
-                        family="VT323, monospace",
-                        size=18,
-                        color="#0066cc"
-                    )
-                )
-                
-                st.plotly_chart(fig4, use_container_width=True)
-            
-            # Cost savings calculation
-            st.markdown("### Estimated Cost Savings with FlexAI")
-            
-            flexai_cost = filtered_data[filtered_data["Provider"] == "FlexAI"]["Cost ($)"].values[0]
-            
-            col1, col2, col3 = st.columns(3)
-            
-            for i, provider in enumerate(["AWS", "GCP", "Azure"]):
-                provider_data = filtered_data[filtered_data["Provider"] == provider]
-                provider_cost = provider_data["Cost ($)"].values[0]
-                savings = provider_cost - flexai_cost
-                savings_pct = (savings / provider_cost) * 100
-                
-                col = [col1, col2, col3][i]
-                
-                with col:
-                    st.markdown(f"""
-                    <div class="metric-container">
-                        <div class="metric-label">vs {provider}</div>
-                        <div class="metric-value">${savings:.2f}</div>
-                        <div class="metric-label">({savings_pct:.1f}% savings)</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Cost comparison table
-            st.markdown("### Detailed Cost Breakdown")
-            cost_table = filtered_data[["Provider", "Cost ($)", "Execution Time (min)"]]
-            cost_table["Cost per Minute"] = cost_table["Cost ($)"] / cost_table["Execution Time (min)"]
-            cost_table = cost_table.sort_values(by="Cost per Minute")
-            
-            # Format the table
-            formatted_table = cost_table.copy()
-            formatted_table["Cost ($)"] = formatted_table["Cost ($)"].map("${:.2f}".format)
-            formatted_table["Cost per Minute"] = formatted_table["Cost per Minute"].map("${:.4f}".format)
-            formatted_table = formatted_table.rename(columns={
-                "Provider": "CLOUD PROVIDER",
-                "Cost ($)": "TOTAL COST",
-                "Execution Time (min)": "RUNTIME (MIN)",
-                "Cost per Minute": "COST PER MINUTE"
-            })
-            
-            st.table(formatted_table)
-            
-        with tab3:
-            retro_header("Performance Leaderboard", level=2)
-            
-            # Create leaderboards for different metrics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### 🚀 Speed Champions")
-                time_leaderboard = create_leaderboard(
-                    st.session_state.benchmark_data,
-                    selected_workload,
-                    "Execution Time (min)"
-                )
-                time_leaderboard = time_leaderboard.rename(columns={
-                    "Rank": "RANK",
-                    "Provider": "PROVIDER",
-                    "Execution Time (min)": "TIME (MIN)"
-                })
-                st.table(time_leaderboard)
-                
-                st.markdown("### 💡 Throughput Champions")
-                throughput_leaderboard = create_leaderboard(
-                    st.session_state.benchmark_data,
-                    selected_workload,
-                    "Throughput"
-                )
-                throughput_unit = st.session_state.benchmark_data[
-                    st.session_state.benchmark_data["Workload"] == selected_workload
-                ]["Throughput Unit"].iloc[0]
-                throughput_leaderboard = throughput_leaderboard.rename(columns={
-                    "Rank": "RANK",
-                    "Provider": "PROVIDER",
-                    "Throughput": f"THROUGHPUT ({throughput_unit})"
-                })
-                st.table(throughput_leaderboard)
-            
-            with col2:
-                st.markdown("### 💰 Cost Champions")
-                cost_leaderboard = create_leaderboard(
-                    st.session_state.benchmark_data,
-                    selected_workload,
-                    "Cost ($)"
-                )
-                cost_leaderboard = cost_leaderboard.rename(columns={
-                    "Rank": "RANK",
-                    "Provider": "PROVIDER",
-                    "Cost ($)": "COST ($)"
-                })
-                st.table(cost_leaderboard)
-                
-                # Calculate and display cost-performance ratio
-                st.markdown("### 🏅 Cost-Performance Champions")
-                
-                # Create cost-performance DataFrame
-                filtered_data = st.session_state.benchmark_data[
-                    st.session_state.benchmark_data["Workload"] == selected_workload
-                ]
-                
-                if "Cost-Performance Ratio" not in filtered_data.columns:
-                    filtered_data["Cost-Performance Ratio"] = filtered_data["Cost ($)"] / filtered_data["Throughput"]
-                
-                cp_leaderboard = create_leaderboard(
-                    filtered_data,
-                    selected_workload,
-                    "Cost-Performance Ratio"
-                )
-                cp_leaderboard = cp_leaderboard.rename(columns={
-                    "Rank": "RANK",
-                    "Provider": "PROVIDER",
-                    "Cost-Performance Ratio": "COST/PERFORMANCE"
-                })
-                st.table(cp_leaderboard)
-            
-            # Overall winner determination
-            st.markdown("### 👑 OVERALL CHAMPION")
-            
-            # Count first places across all metrics
-            filtered_data = st.session_state.benchmark_data[
-                st.session_state.benchmark_data["Workload"] == selected_workload
-            ]
-            
-            # Get rankings for each metric
-            metrics = ["Execution Time (min)", "Cost ($)", "Throughput", "GPU Utilization (%)", "Memory Usage (%)"]
-            rankings = {}
-            
-            for metric in metrics:
-                # Determine if lower is better
-                ascending = True if metric in ["Execution Time (min)", "Cost ($)"] else False
-                
-                # Get sorted providers
-                sorted_providers = filtered_data.sort_values(by=metric, ascending=ascending)["Provider"].tolist()
-                
-                # Assign points (4 for 1st, 3 for 2nd, etc.)
-                for i, provider in enumerate(sorted_providers):
-                    if provider not in rankings:
-                        rankings[provider] = 0
-                    
-                    # Add points (reverse order)
-                    rankings[provider] += len(sorted_providers) - i
-            
-            # Determine the winner
-            winner = max(rankings.items(), key=lambda x: x[1])[0]
-            
-            # Create a points table
-            points_data = []
-            for provider, points in rankings.items():
-                points_data.append({
-                    "Provider": provider,
-                    "Points": points
-                })
-            
-            points_df = pd.DataFrame(points_data).sort_values(by="Points", ascending=False)
-            points_df["Rank"] = range(1, len(points_df) + 1)
-            points_df = points_df[["Rank", "Provider", "Points"]]
-            
-            # Display the winner
-            st.markdown(f"""
-            <div style="text-align: center; margin: 20px 0;">
-                <div style="font-family: 'VT323', monospace; font-size: 36px; color: #0066cc;">
-                    👑 {winner} 👑
-                </div>
-                <div style="font-family: 'Space Mono', monospace; font-size: 18px; color: #0a0a20;">
-                    BENCHMARK CHAMPION
-                </div>
-                <div style="font-family: 'Space Mono', monospace; font-size: 14px; color: #0a0a20; margin-top: 10px;">
-                    with {rankings[winner]} total points
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Display the points table
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                points_df = points_df.rename(columns={
-                    "Rank": "POSITION",
-                    "Provider": "PROVIDER",
-                    "Points": "TOTAL POINTS"
-                })
-                st.table(points_df)
+        results_tabs(
+            benchmark_data,
+            st.session_state.benchmark_handle.version,
+            selected_workload,
+            {provider: st.session_state[f"gpu_{provider}"] for provider in gpu_options.keys()}
+        )
     else:
         # Initial state - no benchmark run yet
-        st.markdown("""
+        baseline = get_baseline_provider()
+        competitors = [provider for provider in load_provider_registry() if provider != baseline]
+        st.markdown(f"""
         <div style="text-align: center; margin: 50px 0;">
             <div style="font-family: 'VT323', monospace; font-size: 24px; color: #0066cc;">
                 SELECT A WORKLOAD AND CLICK "RUN BENCHMARK" TO BEGIN
             </div>
             <div style="font-family: 'Space Mono', monospace; font-size: 16px; color: #0a0a20; margin-top: 10px;">
-                The benchmark will compare FlexAI against AWS, GCP, and Azure
+                The benchmark will compare {baseline} against {join_names(competitors)}
             </div>
         </div>
         """, unsafe_allow_html=True)
@@ -0,0 +1,139 @@
+import math
+from statistics import NormalDist
+
+import pandas as pd
+
+from .data_generator import PROVIDERS, generate_benchmark_row
+from .derived_metrics import derive_row
+from .run_context import RunContext
+from .workloads import load_workload_registry
+
+def t_critical_value(confidence, dof):
+    """
+    Two-sided Student t critical value
+
+    Uses the Cornish-Fisher expansion around the normal quantile, which is
+    accurate to about 1% from 3 degrees of freedom.
+
+    Args:
+        confidence (float): Confidence level (e.g., 0.95)
+        dof (int): Degrees of freedom
+
+    Returns:
+        float: Critical value of the t distribution
+    """
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    return (z
+            + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2))
+
+def confidence_interval(values, confidence=0.95):
+    """
+    Confidence interval of the mean of a sample
+
+    Args:
+        values (list): Sample values
+        confidence (float): Confidence level
+
+    Returns:
+        tuple: (mean, half width of the interval)
+    """
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, math.inf
+
+    variance = sum((value - mean) ** 2 for value in values) / (n - 1)
+    return mean, t_critical_value(confidence, n - 1) * math.sqrt(variance / n)
+
+def run_adaptive_trials(providers=None, workloads=None, metric="Execution Time (min)",
+                        trial_fn=generate_benchmark_row, min_trials=3, max_trials=30,
+                        rel_precision=0.05, confidence=0.95, context=None):
+    """
+    Run repeated benchmark trials, stopping each configuration adaptively
+
+    Trials run in rounds, one per active (provider, workload) pair. After
+    each round a pair stops once it has at least `min_trials` trials and
+    either the confidence interval of its mean metric is within
+    `rel_precision` of the mean, or the interval no longer overlaps the
+    intervals of the providers ranked just above and below it for that
+    workload. A pair that reaches `max_trials` stops regardless.
+
+    Args:
+        providers (list, optional): Providers to benchmark, defaults to all
+        workloads (list, optional): Workloads to benchmark, defaults to all
+        metric (str): Metric the stopping rule is applied to
+        trial_fn (callable): Called with (provider, workload) and the
+            trial's random stream as `rng`, returns a result row like
+            generate_benchmark_row
+        min_trials (int): Trials run before a pair may stop
+        max_trials (int): Maximum trials per pair
+        rel_precision (float): Target half width of the interval, relative
+            to the mean
+        confidence (float): Confidence level of the intervals
+        context (RunContext, optional): Random state of the run, a new run
+            by default; every trial draws from its own stream
+
+    Returns:
+        tuple: (DataFrame of every trial, DataFrame summarizing each pair)
+    """
+    providers = providers or PROVIDERS
+    workloads = workloads or list(load_workload_registry())
+    context = context or RunContext()
+
+    trials = []
+    values = {(workload, provider): [] for workload in workloads for provider in providers}
+    stop_reasons = {}
+
+    while len(stop_reasons) < len(values):
+        for (workload, provider), samples in values.items():
+            if (workload, provider) in stop_reasons:
+                continue
+            trial = len(samples) + 1
+            rng = context.stream(provider, workload, trial)
+            row = derive_row(trial_fn(provider, workload, rng=rng))
+            row["Trial"] = trial
+            trials.append(row)
+            samples.append(row[metric])
+
+        for workload in workloads:
+            intervals = {
+                provider: confidence_interval(values[(workload, provider)], confidence)
+                for provider in providers
+            }
+            ranked = sorted(providers, key=lambda provider: intervals[provider][0])
+
+            for i, provider in enumerate(ranked):
+                key = (workload, provider)
+                n = len(values[key])
+                if key in stop_reasons or n < min_trials:
+                    continue
+
+                mean, half_width = intervals[provider]
+                neighbors = ranked[max(i - 1, 0):i] + ranked[i + 1:i + 2]
+                separated = all(
+                    abs(mean - intervals[other][0]) > half_width + intervals[other][1]
+                    for other in neighbors
+                )
+
+                if half_width <= rel_precision * abs(mean):
+                    stop_reasons[key] = "precision reached"
+                elif separated:
+                    stop_reasons[key] = "ranking settled"
+                elif n >= max_trials:
+                    stop_reasons[key] = "max trials"
+
+    summary = []
+    for (workload, provider), samples in values.items():
+        mean, half_width = confidence_interval(samples, confidence)
+        summary.append({
+            "Provider": provider,
+            "Workload": workload,
+            "Trials": len(samples),
+            f"Mean {metric}": mean,
+            "CI Low": mean - half_width,
+            "CI High": mean + half_width,
+            "Stop Reason": stop_reasons[(workload, provider)]
+        })
+
+    return pd.DataFrame(trials), pd.DataFrame(summary)
@@ -0,0 +1,427 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import secrets
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from .data_generator import generate_sample_data
+from .providers import get_baseline_provider
+from .report import CHAMPION_METRICS
+from .run_context import RunContext
+from .shared_results import SharedResultsRegistry
+from .utils import calculate_savings, get_resource_price_table, get_winner
+
+# Idle seconds before a keep-alive connection is closed
+KEEP_ALIVE_TIMEOUT = 15
+
+# Rows serialized per chunk of a streamed result set
+STREAM_CHUNK_ROWS = 5000
+
+# Small JSON responses kept in memory, keyed by ETag
+RESPONSE_CACHE_SIZE = 256
+
+# Dataset that is always served and never evicted
+DEFAULT_DATASET = "default"
+
+# Datasets clients may create with POST /runs besides the default one; the
+# least recently run is unpinned past this many, so clients cannot pin
+# datasets until memory runs out
+MAX_CLIENT_DATASETS = 16
+
+# Longest dataset key accepted from a client
+MAX_DATASET_KEY_LENGTH = 64
+
+class APIError(Exception):
+    """An error reported to the client with an HTTP status and a JSON body"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header lists an entity tag or is a wildcard"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+def _json_bytes(payload):
+    """Encode a JSON payload, converting numpy scalars"""
+    return json.dumps(payload, default=lambda value: value.item()).encode()
+
+class BenchmarkAPI:
+    """
+    JSON endpoints over the benchmark results and pricing
+
+    Results are datasets of a SharedResultsRegistry, so the API can share
+    them with a dashboard running in the same process. Every response
+    derived from a dataset carries an ETag built from the dataset version:
+    a client sending it back in If-None-Match gets a 304 until the dataset
+    is published again, and small responses are served from memory.
+
+    Endpoints:
+        GET /health
+        POST /runs: run the benchmark, body {"dataset": "default"}; an
+            optional "run_id" of an earlier run regenerates its results.
+            Only the MAX_CLIENT_DATASETS most recently run datasets besides
+            the default one are kept
+        GET /results?dataset=&workload=&provider=: streamed result rows
+        GET /pricing?provider=&gpu=: get_resource_price_table rows
+        GET /winner?dataset=&workload=&metrics=: get_winner, metrics
+            comma-separated
+        GET /savings?dataset=&workload=&baseline=: calculate_savings of
+            every provider against the baseline, or
+            GET /savings?base_cost=&comparison_cost= for two costs
+
+    Args:
+        registry (SharedResultsRegistry, optional): Results to serve, a
+            registry with a freshly generated "default" dataset by default
+    """
+
+    def __init__(self, registry=None):
+        if registry is None:
+            registry = SharedResultsRegistry()
+            registry.publish(DEFAULT_DATASET, generate_sample_data(), pinned=True)
+        self.registry = registry
+        self._cache = OrderedDict()  # ETag -> response body
+        self._client_datasets = OrderedDict()  # Keys run by clients, oldest first
+        self._client_lock = threading.Lock()  # Runs publish from worker threads
+        # Dataset versions restart with the process, ETags must not
+        self._instance = secrets.token_hex(4)
+        self._routes = {
+            ("GET", "/health"): self._health,
+            ("POST", "/runs"): self._run,
+            ("GET", "/results"): self._results,
+            ("GET", "/pricing"): self._pricing,
+            ("GET", "/winner"): self._winner,
+            ("GET", "/savings"): self._savings
+        }
+
+        # The price table never changes while the service runs
+        self._price_table = get_resource_price_table()
+        self._price_version = hashlib.sha1(self._price_table.to_json().encode()).hexdigest()[:12]
+
+    def _dataset(self, query):
+        """The requested dataset and its version"""
+        key = query.get("dataset", DEFAULT_DATASET)
+        try:
+            # Version first: if the dataset is republished in between, the
+            # response is newer than its ETag, never older
+            version = self.registry.version(key)
+            return self.registry.get(key), version
+        except KeyError:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Unknown dataset: {key}")
+
+    def _etag(self, version, path, query):
+        """ETag of a response, changing with the data version and the query"""
+        request = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(query.items()))
+        return f'"{self._instance}-{version}-{hashlib.sha1(request.encode()).hexdigest()[:12]}"'
+
+    def _cached(self, etag, build):
+        """Build a small response body once per ETag"""
+        def cached_build():
+            if etag not in self._cache:
+                self._cache[etag] = build()
+                if len(self._cache) > RESPONSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.move_to_end(etag)
+            return self._cache[etag]
+        return etag, cached_build
+
+    def _workload_rows(self, df, query):
+        """Rows of the requested workload"""
+        workload = query.get("workload")
+        if workload is None:
+            raise APIError(HTTPStatus.BAD_REQUEST, "Missing query parameter: workload")
+        rows = df[df["Workload"] == workload]
+        if len(rows) == 0:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Unknown workload: {workload}")
+        return rows
+
+    # Route handlers take the query and the parsed JSON body and return the
+    # response ETag (None if not cacheable) and a function building the body:
+    # bytes, or an iterator of byte chunks to stream. The body is only built
+    # if the client's cached copy is stale.
+
+    def _health(self, query, body):
+        return None, lambda: _json_bytes({"status": "ok"})
+
+    def _publish_run(self, key, df):
+        """Publish a client's run, unpinning the least recently run dataset"""
+        with self._client_lock:
+            self.registry.publish(key, df, pinned=True)
+            if key == DEFAULT_DATASET:
+                return
+            self._client_datasets[key] = None
+            self._client_datasets.move_to_end(key)
+            if len(self._client_datasets) > MAX_CLIENT_DATASETS:
+                oldest, _ = self._client_datasets.popitem(last=False)
+                self.registry.unpin(oldest)
+
+    def _run(self, query, body):
+        key = body.get("dataset", DEFAULT_DATASET)
+        if not isinstance(key, str) or not 0 < len(key) <= MAX_DATASET_KEY_LENGTH:
+            raise APIError(
+                HTTPStatus.BAD_REQUEST,
+                f"dataset must be a string of 1 to {MAX_DATASET_KEY_LENGTH} characters"
+            )
+        try:
+            context = RunContext.from_run_id(body["run_id"]) if "run_id" in body else RunContext()
+        except (TypeError, ValueError):
+            raise APIError(HTTPStatus.BAD_REQUEST, "run_id must be a hexadecimal string")
+
+        def build():
+            df = generate_sample_data(context=context)
+            self._publish_run(key, df)
+            return _json_bytes({
+                "dataset": key,
+                "version": self.registry.version(key),
+                "run_id": context.run_id,
+                "rows": len(df)
+            })
+        return None, build
+
+    def _results(self, query, body):
+        df, version = self._dataset(query)
+
+        def build():
+            rows = df
+            for column in ["Workload", "Provider"]:
+                if column.lower() in query:
+                    rows = rows[rows[column] == query[column.lower()]]
+
+            # A JSON array written a few thousand rows at a time
+            yield b"["
+            for start in range(0, len(rows), STREAM_CHUNK_ROWS):
+                chunk = rows.iloc[start:start + STREAM_CHUNK_ROWS].to_json(orient="records")
+                yield (b"," if start else b"") + chunk[1:-1].encode()
+            yield b"]"
+        return self._etag(version, "/results", query), build
+
+    def _pricing(self, query, body):
+        def build():
+            rows = self._price_table
+            for column, parameter in [("Provider", "provider"), ("GPU", "gpu")]:
+                if parameter in query:
+                    rows = rows[rows[column] == query[parameter]]
+            return rows.to_json(orient="records").encode()
+        return self._cached(self._etag(self._price_version, "/pricing", query), build)
+
+    def _winner(self, query, body):
+        df, version = self._dataset(query)
+        rows = self._workload_rows(df, query)
+        metrics = query["metrics"].split(",") if "metrics" in query else CHAMPION_METRICS
+
+        unknown = [metric for metric in metrics if metric not in df.columns]
+        if unknown:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Unknown metrics: {', '.join(unknown)}")
+
+        def build():
+            winner, rankings = get_winner(rows, query["workload"], metrics)
+            return _json_bytes({
+                "workload": query["workload"],
+                "winner": winner,
+                "rankings": rankings
+            })
+        return self._cached(self._etag(version, "/winner", query), build)
+
+    def _savings(self, query, body):
+        if "base_cost" in query and "comparison_cost" in query:
+            try:
+                base_cost = float(query["base_cost"])
+                comparison_cost = float(query["comparison_cost"])
+            except ValueError:
+                raise APIError(HTTPStatus.BAD_REQUEST, "Costs must be numbers")
+            savings, savings_pct = calculate_savings(base_cost, comparison_cost)
+            return None, lambda: _json_bytes({"savings": savings, "savings_pct": savings_pct})
+
+        df, version = self._dataset(query)
+        rows = self._workload_rows(df, query)
+        baseline = query.get("baseline") or get_baseline_provider()
+        baseline_rows = rows[rows["Provider"] == baseline]
+        if len(baseline_rows) == 0:
+            raise APIError(HTTPStatus.NOT_FOUND, f"No results for baseline provider: {baseline}")
+
+        def build():
+            baseline_cost = baseline_rows["Cost ($)"].iloc[0]
+            savings = []
+            for provider, provider_cost in zip(rows["Provider"], rows["Cost ($)"]):
+                if provider == baseline:
+                    continue
+                amount, pct = calculate_savings(baseline_cost, provider_cost)
+                savings.append({"provider": provider, "savings": amount, "savings_pct": pct})
+            return _json_bytes({
+                "workload": query["workload"],
+                "baseline": baseline,
+                "savings": savings
+            })
+        return self._cached(self._etag(version, "/savings", query), build)
+
+    def route(self, method, target, body=b""):
+        """
+        Resolve a request to its ETag and body builder
+
+        Args:
+            method (str): HTTP method
+            target (str): Request path with query string
+            body (bytes): Request body, JSON if not empty
+
+        Returns:
+            tuple: (ETag or None, function building the response body)
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        handler = self._routes.get((method, url.path))
+        if handler is None:
+            if any(path == url.path for _, path in self._routes):
+                raise APIError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {url.path}")
+            raise APIError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: {url.path}")
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            raise APIError(HTTPStatus.BAD_REQUEST, "Request body must be JSON")
+        if not isinstance(payload, dict):
+            raise APIError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+
+        return handler(query, payload)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve HTTP/1.1 requests on a connection until it closes
+
+        Connections are kept alive between requests unless the client asks
+        otherwise, and closed after KEEP_ALIVE_TIMEOUT idle seconds.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        asyncio.TimeoutError, ConnectionError):
+                    break
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ")
+                except ValueError:
+                    await self._send(writer, HTTPStatus.BAD_REQUEST, _json_bytes({"error": "Bad request"}))
+                    break
+
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    content_length = int(headers.get("content-length", 0))
+                    if content_length < 0:
+                        raise ValueError(content_length)
+                except ValueError:
+                    # Without a length the next request cannot be found, so close
+                    await self._send(writer, HTTPStatus.BAD_REQUEST,
+                                     _json_bytes({"error": "Invalid Content-Length"}), keep_alive=False)
+                    break
+                try:
+                    body = await reader.readexactly(content_length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    etag, build = self.route(method, target, body)
+                    if etag is not None and _etag_matches(headers.get("if-none-match", ""), etag):
+                        await self._send(writer, HTTPStatus.NOT_MODIFIED, None, etag, keep_alive)
+                    elif method == "POST":
+                        # Running a benchmark is slow, keep the event loop free
+                        content = await loop.run_in_executor(None, build)
+                        await self._send(writer, HTTPStatus.CREATED, content, etag, keep_alive)
+                    else:
+                        await self._send(writer, HTTPStatus.OK, build(), etag, keep_alive)
+                except APIError as error:
+                    await self._send(writer, error.status, _json_bytes({"error": str(error)}),
+                                     keep_alive=keep_alive)
+                except Exception as error:
+                    # A bug in a handler fails the request, not the server. A
+                    # streamed response may be cut short, so close afterwards.
+                    await self._send(writer, HTTPStatus.INTERNAL_SERVER_ERROR,
+                                     _json_bytes({"error": f"Internal error: {error}"}), keep_alive=False)
+                    break
+
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _send(writer, status, content, etag=None, keep_alive=True):
+        """Write a response, streaming iterators with chunked encoding"""
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive" if keep_alive else "close"
+        }
+        if etag is not None:
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"  # Revalidate with the ETag
+
+        streamed = content is not None and not isinstance(content, bytes)
+        if streamed:
+            headers["Transfer-Encoding"] = "chunked"
+        else:
+            headers["Content-Length"] = str(len(content or b""))
+
+        status = HTTPStatus(status)
+        head = f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write((head + "\r\n").encode("latin-1"))
+
+        if streamed:
+            for chunk in content:
+                writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                await writer.drain()
+            writer.write(b"0\r\n\r\n")
+        elif content:
+            writer.write(content)
+        await writer.drain()
+
+async def start_api_server(api=None, host="127.0.0.1", port=8000):
+    """
+    Start serving the API
+
+    Args:
+        api (BenchmarkAPI, optional): The API to serve
+        host (str): Interface to listen on
+        port (int): Port to listen on, 0 for any free port
+
+    Returns:
+        asyncio.Server: The running server
+    """
+    api = api or BenchmarkAPI()
+    return await asyncio.start_server(api.handle_connection, host, port)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve benchmark results and pricing as JSON")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = await start_api_server(host=args.host, port=args.port)
+        print(f"Serving on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
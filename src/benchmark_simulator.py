@@ -1,7 +1,27 @@
 import time
-import random
+import numpy as np
+import pandas as pd
 import streamlit as st
 
+from .providers import provider_hourly_rates
+from .workloads import load_workload_registry
+
+# Pricing data (per hour), by provider and GPU
+HOURLY_RATES = provider_hourly_rates()
+
+def get_workload_multiplier(workload_type):
+    """
+    Get the pricing multiplier applied to a workload type
+    
+    Args:
+        workload_type (str): Type of workload
+        
+    Returns:
+        float: Multiplier applied to the hourly rate
+    """
+    spec = load_workload_registry().get(workload_type)
+    return spec["Cost_Multiplier"] if spec else 1.0  # Default
+
 def simulate_benchmark_run():
     """
     Simulate a benchmark run with a progress bar and status updates
@@ -32,7 +52,8 @@ def simulate_benchmark_run():
     time.sleep(0.5)
     return True
 
-def calculate_workload_cost(provider, workload_type, duration_minutes, instance_type=None):
+def calculate_workload_cost(provider, workload_type, duration_minutes, instance_type=None, gpu_count=1,
+                            rng=None):
     """
     Calculate the cost of running a workload based on provider pricing
     
@@ -41,52 +62,72 @@ def calculate_workload_cost(provider, workload_type, duration_minutes, instance_
         workload_type (str): Type of workload
         duration_minutes (float): Duration in minutes
         instance_type (str, optional): Instance type
+        gpu_count (int): Number of GPUs billed for the duration
+        rng (numpy.random.Generator, optional): Generator of the price
+            jitter, e.g. a RunContext stream; unseeded by default
         
     Returns:
         float: Estimated cost in dollars
     """
-    # Sample pricing data (per hour)
-    hourly_rates = {
-        "AWS": {
-            "NVIDIA A100": 3.60,
-            "NVIDIA T4": 0.95,
-            "NVIDIA V100": 3.06
-        },
-        "GCP": {
-            "NVIDIA A100": 3.35,
-            "NVIDIA T4": 0.89,
-            "NVIDIA L4": 1.35
-        },
-        "Azure": {
-            "NVIDIA A100": 3.67,
-            "NVIDIA T4": 0.99,
-            "NVIDIA K80": 0.71
-        },
-        "FlexAI": {
-            "NVIDIA A100": 2.89,
-            "NVIDIA H100": 5.76,
-            "NVIDIA T4": 0.76
-        }
-    }
-    
     # Default to A100 if instance_type is not provided
     gpu_type = instance_type if instance_type else "NVIDIA A100"
     
     # Get the hourly rate
-    hourly_rate = hourly_rates.get(provider, {}).get(gpu_type, 0)
+    hourly_rate = HOURLY_RATES.get(provider, {}).get(gpu_type, 0)
     
     # Apply workload-specific multipliers
-    if "LLM" in workload_type:
-        multiplier = 1.2  # LLM fine-tuning is more expensive
-    elif "Inference" in workload_type:
-        multiplier = 0.8  # Inference might be cheaper
-    else:
-        multiplier = 1.0  # Default
+    multiplier = get_workload_multiplier(workload_type)
     
     # Calculate cost
-    cost = (duration_minutes / 60) * hourly_rate * multiplier
+    cost = (duration_minutes / 60) * hourly_rate * multiplier * gpu_count
     
     # Add randomness to make it realistic
-    cost *= random.uniform(0.95, 1.05)
+    rng = rng or np.random.default_rng()
+    cost *= rng.uniform(0.95, 1.05)
+    
+    return round(cost, 2)
+
+def calculate_workload_costs(df, jitter=True, rng=None):
+    """
+    Price many workload runs at once
+    
+    Vectorized counterpart of calculate_workload_cost: hourly rates and
+    workload multipliers are looked up with dict-backed maps over whole
+    columns instead of per row.
+    
+    Args:
+        df (pandas.DataFrame): Runs with "Provider", "Workload" and
+            "Execution Time (min)" columns, and optionally "GPU"
+            (defaults to "NVIDIA A100")
+        jitter (bool): Apply the same ±5% randomness as calculate_workload_cost
+        rng (numpy.random.Generator, optional): Generator of the jitter,
+            unseeded by default
+        
+    Returns:
+        pandas.Series: Estimated cost in dollars of each run
+    """
+    gpus = df["GPU"] if "GPU" in df.columns else pd.Series("NVIDIA A100", index=df.index)
+    
+    rate_lookup = {
+        (provider, gpu): rate
+        for provider, rates in HOURLY_RATES.items()
+        for gpu, rate in rates.items()
+    }
+    multipliers = {
+        workload: spec["Cost_Multiplier"]
+        for workload, spec in load_workload_registry().items()
+    }
+    
+    hourly_rate = pd.Series(
+        [rate_lookup.get(key, 0) for key in zip(df["Provider"], gpus)],
+        index=df.index
+    )
+    multiplier = df["Workload"].map(multipliers).fillna(1.0)
+    
+    cost = (df["Execution Time (min)"] / 60) * hourly_rate * multiplier
+    
+    if jitter:
+        rng = rng or np.random.default_rng()
+        cost *= rng.uniform(0.95, 1.05, size=len(df))
     
-    return round(cost, 2)
\ No newline at end of file
+    return cost.round(2)
@@ -0,0 +1,253 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+
+import plotly.io as pio
+
+from .visualizations import create_platform_comparison_charts, create_radar_charts
+
+try:
+    import kaleido
+except ImportError:  # Headless renderer is optional
+    kaleido = None
+
+# Metrics exported as bar charts for every workload
+EXPORT_METRICS = [
+    "Execution Time (min)",
+    "Cost ($)",
+    "Throughput",
+    "GPU Utilization (%)",
+    "Memory Usage (%)"
+]
+
+def headless_renderer_available():
+    """
+    Check whether the Kaleido headless renderer is installed
+
+    Returns:
+        bool: True if figures can be rendered with Kaleido
+    """
+    return kaleido is not None
+
+def chart_file_name(workload, chart_name, file_format):
+    """
+    Build a file name for an exported chart
+
+    Args:
+        workload (str): The workload the chart belongs to
+        chart_name (str): Metric name, or "radar" for the radar chart
+        file_format (str): Image format (e.g., "png", "svg")
+
+    Returns:
+        str: File name such as "llm-fine-tuning-llama-3-8b__cost.png"
+    """
+    def slugify(text):
+        return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+    return f"{slugify(workload)}__{slugify(chart_name)}.{file_format}"
+
+def _start_renderer():
+    """Start a Kaleido server in a pool worker so it stays warm across batches"""
+    kaleido.start_sync_server(silence_warnings=True)
+
+def _render_batch(figures, paths):
+    """Render a batch of figure dicts with the worker's warm Kaleido server"""
+    pio.write_images(figures, paths)
+    return paths
+
+class ChartRendererPool:
+    """
+    Pool of worker processes that each keep a headless renderer running
+
+    Starting the renderer is by far the most expensive part of an image
+    export, so workers start it once and then render batches of figures.
+    The pool can be reused for several exports and should be closed with
+    close() or used as a context manager.
+
+    Args:
+        workers (int, optional): Number of renderer processes
+        batch_size (int): Number of figures sent to a worker at a time
+    """
+
+    def __init__(self, workers=None, batch_size=20):
+        if not headless_renderer_available():
+            raise RuntimeError("Kaleido is not installed, install it with `pip install kaleido`")
+
+        self.batch_size = batch_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers or min(4, os.cpu_count() or 1),
+            initializer=_start_renderer
+        )
+
+    def render(self, figures, paths):
+        """
+        Render figures to image files, inferring the format from each path
+
+        Args:
+            figures (list): Figures (or figure dicts) to render
+            paths (list): Output path for each figure
+
+        Returns:
+            list: Paths of the written files
+        """
+        # Plain dicts are much cheaper to send to worker processes
+        figures = [fig if isinstance(fig, dict) else fig.to_dict() for fig in figures]
+
+        futures = [
+            self._executor.submit(
+                _render_batch,
+                figures[i:i + self.batch_size],
+                paths[i:i + self.batch_size]
+            )
+            for i in range(0, len(figures), self.batch_size)
+        ]
+
+        written = []
+        for future in futures:
+            written.extend(future.result())
+        return written
+
+    def close(self):
+        """Shut down the renderer processes"""
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def render_bar_chart_svg(fig, width=700, height=500):
+    """
+    Render a plotly bar chart to SVG without a headless browser
+
+    Only the parts of the figure used by the retro bar charts are drawn:
+    the title, the bars with their colors and value labels, the category
+    labels and the pixel-style border.
+
+    Args:
+        fig (plotly.graph_objects.Figure): Bar chart to render
+        width (int): Image width in pixels
+        height (int): Image height in pixels
+
+    Returns:
+        str: The SVG document
+    """
+    layout = fig.layout
+    theme = layout.template.layout  # Styling the figure takes from its template
+    background = layout.paper_bgcolor or theme.paper_bgcolor or "#ffffff"
+    font_family = layout.font.family or theme.font.family or "monospace"
+    font_color = layout.font.color or theme.font.color or "#000000"
+    title = layout.title.text or ""
+    title_color = layout.title.font.color or theme.title.font.color or font_color
+
+    # Collect every bar across traces (one trace per provider)
+    bars = []
+    for trace in fig.data:
+        if trace.type != "bar":
+            raise ValueError("Only bar charts can be rendered without Kaleido")
+        color = trace.marker.color if isinstance(trace.marker.color, str) else "#0066cc"
+        for x, y in zip(trace.x, trace.y):
+            bars.append((str(x), float(y), color))
+
+    left, right, top, bottom = 60, 20, 60, 50
+    plot_width = width - left - right
+    plot_height = height - top - bottom
+    max_value = max([y for _, y, _ in bars] + [0]) or 1
+    slot = plot_width / max(len(bars), 1)
+    bar_width = slot * 0.7
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="{escape(font_family)}">',
+        f'<rect width="100%" height="100%" fill="{background}"/>',
+        f'<text x="{width / 2}" y="{top / 2}" text-anchor="middle" font-size="20" '
+        f'fill="{title_color}">{escape(title)}</text>',
+        f'<line x1="{left}" y1="{top + plot_height}" x2="{left + plot_width}" '
+        f'y2="{top + plot_height}" stroke="{font_color}"/>'
+    ]
+
+    for i, (label, value, color) in enumerate(bars):
+        bar_height = value / max_value * (plot_height - 20)
+        x = left + i * slot + (slot - bar_width) / 2
+        y = top + plot_height - bar_height
+        parts.append(
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_width:.1f}" '
+            f'height="{bar_height:.1f}" fill="{color}"/>'
+        )
+        parts.append(
+            f'<text x="{x + bar_width / 2:.1f}" y="{y - 5:.1f}" text-anchor="middle" '
+            f'font-size="14" fill="{title_color}">{value:g}</text>'
+        )
+        parts.append(
+            f'<text x="{x + bar_width / 2:.1f}" y="{top + plot_height + 20}" '
+            f'text-anchor="middle" font-size="12" fill="{font_color}">{escape(label)}</text>'
+        )
+
+    # Pixel-style border
+    parts.append(
+        f'<rect x="1.5" y="1.5" width="{width - 3}" height="{height - 3}" '
+        f'fill="none" stroke="#ff66b2" stroke-width="3"/>'
+    )
+    parts.append("</svg>")
+
+    return "\n".join(parts)
+
+def export_run_charts(df, output_dir, formats=("png", "svg"), metrics=None, pool=None):
+    """
+    Export every chart of a benchmark run (every workload x metric) to files
+
+    Bar charts are built for each workload and metric, plus one radar chart
+    per workload. With Kaleido installed all charts are rendered through a
+    ChartRendererPool (pass `pool` to reuse warm renderers across exports).
+    Without it, bar charts are written as SVG by render_bar_chart_svg and
+    the remaining charts are skipped.
+
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        output_dir (str): Directory the images are written to
+        formats (tuple): Image formats to export (e.g., "png", "svg")
+        metrics (list, optional): Metrics to chart, defaults to EXPORT_METRICS
+        pool (ChartRendererPool, optional): Pool of warm renderers to use
+
+    Returns:
+        tuple: (list of written paths, list of skipped paths)
+    """
+    if pool is None and headless_renderer_available():
+        with ChartRendererPool() as own_pool:
+            return export_run_charts(df, output_dir, formats, metrics, own_pool)
+
+    metrics = metrics or EXPORT_METRICS
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Build every figure once, in one pass over the workloads, then write
+    # it in each requested format
+    bar_charts = create_platform_comparison_charts(df, metrics)
+    charts = []
+    for workload, radar_chart in create_radar_charts(df).items():
+        for metric in metrics:
+            charts.append((bar_charts[(workload, metric)], workload, metric, True))
+        charts.append((radar_chart, workload, "radar", False))
+
+    written, skipped = [], []
+    figures, paths = [], []
+
+    for fig, workload, chart_name, is_bar_chart in charts:
+        for file_format in formats:
+            path = os.path.join(output_dir, chart_file_name(workload, chart_name, file_format))
+
+            if pool is not None:
+                figures.append(fig)
+                paths.append(path)
+            elif is_bar_chart and file_format == "svg":
+                with open(path, "w") as f:
+                    f.write(render_bar_chart_svg(fig))
+                written.append(path)
+            else:
+                skipped.append(path)
+
+    if pool is not None:
+        written.extend(pool.render(figures, paths))
+
+    return written, skipped
@@ -0,0 +1,220 @@
+import heapq
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from .benchmark_simulator import HOURLY_RATES
+from .data_generator import PROVIDER_FACTOR_RANGES, load_hardware_configs
+from .workloads import get_workload_spec, load_workload_registry
+
+SCHEDULING_POLICIES = ["fifo", "sjf", "binpack"]
+
+def generate_job_trace(n_jobs, jobs_per_hour=20, workloads=None, gpu_choices=(1, 2, 4, 8),
+                       seed=None):
+    """
+    Generate a stream of workload jobs submitted to a shared cluster
+
+    Arrivals follow a Poisson process. Each job runs a registered workload
+    on a number of GPUs and its reference duration is the workload's base
+    time with ±20% jitter.
+
+    Args:
+        n_jobs (int): Number of jobs
+        jobs_per_hour (float): Average arrival rate
+        workloads (list, optional): Workloads to draw from, defaults to all
+        gpu_choices (tuple): GPU counts jobs can request
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself (e.g. a RunContext stream)
+
+    Returns:
+        pandas.DataFrame: Jobs sorted by arrival time
+    """
+    rng = np.random.default_rng(seed)
+    workloads = np.array(workloads or list(load_workload_registry()))
+    base_times = np.array([get_workload_spec(workload)["Base_Time"] for workload in workloads])
+
+    workload_index = rng.integers(len(workloads), size=n_jobs)
+    arrivals = np.cumsum(rng.exponential(60 / jobs_per_hour, size=n_jobs))
+
+    return pd.DataFrame({
+        "Job ID": np.arange(n_jobs),
+        "Arrival (min)": arrivals,
+        "Workload": workloads[workload_index],
+        "GPUs": rng.choice(gpu_choices, size=n_jobs),
+        "Duration (min)": base_times[workload_index] * rng.uniform(0.8, 1.2, size=n_jobs)
+    })
+
+def _first_fit(free, gpus):
+    """Index of the first node with enough free GPUs, or -1"""
+    for node, available in enumerate(free):
+        if available >= gpus:
+            return node
+    return -1
+
+def _best_fit(free, gpus):
+    """Index of the node left with the fewest free GPUs after placement, or -1"""
+    best, best_free = -1, None
+    for node, available in enumerate(free):
+        if available >= gpus and (best_free is None or available < best_free):
+            best, best_free = node, available
+    return best
+
+def simulate_cluster(trace, n_nodes, gpus_per_node=8, policy="fifo", speed_factor=1.0,
+                     lookahead=64):
+    """
+    Simulate a job trace on a shared cluster with a discrete-event simulation
+
+    Completions are kept in a heap-based event queue and arrivals are read
+    in order from the trace, so each job costs a few heap operations.
+    Jobs run on a single node.
+
+    Policies:
+        fifo: jobs start in arrival order, a job that does not fit blocks
+            the queue; placed on the first node that fits
+        sjf: the shortest waiting job starts first; first-fit placement
+        binpack: the first `lookahead` waiting jobs are scanned in arrival
+            order and every job that fits starts (backfilling), on the node
+            it fills the most
+
+    Args:
+        trace (pandas.DataFrame): Output of generate_job_trace
+        n_nodes (int): Number of nodes in the cluster
+        gpus_per_node (int): GPUs per node
+        policy (str): Scheduling policy, one of SCHEDULING_POLICIES
+        speed_factor (float): Multiplier on the reference job durations
+        lookahead (int): Jobs scanned per scheduling pass by binpack
+
+    Returns:
+        dict: Per-job waits (numpy.ndarray), makespan and utilization
+    """
+    if policy not in SCHEDULING_POLICIES:
+        raise ValueError(f"Unknown scheduling policy: {policy}")
+    if trace["GPUs"].max() > gpus_per_node:
+        raise ValueError("Jobs cannot request more GPUs than a node has")
+
+    arrivals = trace["Arrival (min)"].tolist()
+    gpus = trace["GPUs"].tolist()
+    durations = (trace["Duration (min)"] * speed_factor).tolist()
+    n_jobs = len(arrivals)
+
+    free = [gpus_per_node] * n_nodes
+    waits = [0.0] * n_jobs
+    completions = []  # (end time, node, gpus)
+    busy_gpu_minutes = 0.0
+    now = 0.0
+
+    if policy == "sjf":
+        waiting = []  # heap of (duration, job)
+    else:
+        waiting = deque()
+
+    def start(job, node):
+        nonlocal busy_gpu_minutes
+        free[node] -= gpus[job]
+        waits[job] = now - arrivals[job]
+        heapq.heappush(completions, (now + durations[job], node, gpus[job]))
+        busy_gpu_minutes += gpus[job] * durations[job]
+
+    next_job = 0
+    while next_job < n_jobs or completions:
+        # Process the next event: a completion or an arrival, whichever is first
+        if completions and (next_job == n_jobs or completions[0][0] <= arrivals[next_job]):
+            now, node, released = heapq.heappop(completions)
+            free[node] += released
+        else:
+            now = arrivals[next_job]
+            if policy == "sjf":
+                heapq.heappush(waiting, (durations[next_job], next_job))
+            else:
+                waiting.append(next_job)
+            next_job += 1
+
+        # Start every job the policy allows
+        if policy == "fifo":
+            while waiting:
+                node = _first_fit(free, gpus[waiting[0]])
+                if node < 0:
+                    break
+                start(waiting.popleft(), node)
+        elif policy == "sjf":
+            while waiting:
+                node = _first_fit(free, gpus[waiting[0][1]])
+                if node < 0:
+                    break
+                start(heapq.heappop(waiting)[1], node)
+        else:
+            max_free = max(free)
+            if max_free == 0:
+                continue
+            skipped = []
+            scanned = 0
+            while waiting and scanned < lookahead:
+                job = waiting.popleft()
+                scanned += 1
+                node = _best_fit(free, gpus[job]) if gpus[job] <= max_free else -1
+                if node < 0:
+                    skipped.append(job)
+                    continue
+                start(job, node)
+                max_free = max(free)
+                if max_free == 0:
+                    break
+            waiting.extendleft(reversed(skipped))
+
+    makespan = now - arrivals[0] if n_jobs else 0.0
+    capacity = n_nodes * gpus_per_node * makespan
+
+    return {
+        "waits": np.array(waits),
+        "makespan": makespan,
+        "utilization": busy_gpu_minutes / capacity if capacity > 0 else 0.0
+    }
+
+def compare_cluster_schedulers(trace, n_nodes, providers=None, policies=None,
+                               gpu_type="NVIDIA A100"):
+    """
+    Compare scheduling policies on a cluster of the same size at each provider
+
+    Each provider's cluster uses its GPUs per node from the hardware configs
+    and runs jobs at its expected speed. The cluster is billed for every GPU
+    over the whole makespan.
+
+    Args:
+        trace (pandas.DataFrame): Output of generate_job_trace
+        n_nodes (int): Number of nodes in each cluster
+        providers (list, optional): Providers to compare, defaults to all
+            providers offering `gpu_type`
+        policies (list, optional): Policies to compare, defaults to all
+        gpu_type (str): GPU the clusters are built from
+
+    Returns:
+        pandas.DataFrame: Queue wait, utilization and cost per provider and policy
+    """
+    hardware_configs = load_hardware_configs()
+    if providers is None:
+        providers = [provider for provider, rates in HOURLY_RATES.items() if gpu_type in rates]
+    policies = policies or SCHEDULING_POLICIES
+
+    rows = []
+    for provider in providers:
+        gpus_per_node = hardware_configs[provider].get("GPUs_Per_Node", 8)
+        speed_factor = sum(PROVIDER_FACTOR_RANGES[provider]["time"]) / 2
+
+        for policy in policies:
+            result = simulate_cluster(trace, n_nodes, gpus_per_node, policy, speed_factor)
+            total_gpus = n_nodes * gpus_per_node
+            cost = total_gpus * HOURLY_RATES[provider][gpu_type] * result["makespan"] / 60
+
+            rows.append({
+                "Provider": provider,
+                "Policy": policy,
+                "Mean Wait (min)": result["waits"].mean(),
+                "P95 Wait (min)": np.percentile(result["waits"], 95),
+                "Utilization (%)": result["utilization"] * 100,
+                "Makespan (h)": result["makespan"] / 60,
+                "Cost ($)": cost,
+                "Cost per Job ($)": cost / len(trace)
+            })
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from .benchmark_simulator import HOURLY_RATES, get_workload_multiplier
+from .data_generator import PROVIDER_FACTOR_RANGES, get_workload_base_params
+from .providers import get_baseline_provider
+
+# Per-run price jitter applied by calculate_workload_cost
+PRICE_JITTER_RANGE = (0.95, 1.05)
+
+def _uniform_moments(low, high):
+    """
+    Mean and variance of a uniform distribution
+
+    Args:
+        low (float): Lower bound
+        high (float): Upper bound
+
+    Returns:
+        tuple: (mean, variance)
+    """
+    return (low + high) / 2, (high - low) ** 2 / 12
+
+def project_monthly_spend(workload_mix, gpu_by_provider=None, providers=None,
+                          baseline_provider=None, days_per_month=30,
+                          n_simulations=100000, percentiles=(5, 50, 95), seed=None,
+                          hourly_rates=None):
+    """
+    Project monthly spend and savings per provider with a Monte Carlo simulation
+
+    Each simulation draws the number of jobs submitted in the month (Poisson)
+    for every entry of the workload mix, then the total runtime and price
+    jitter of those jobs. Totals over many jobs are drawn from their normal
+    approximation, so the cost of a simulation does not depend on the job
+    count and 100k+ simulations run in well under a second. Job counts are
+    shared across providers so that savings are computed on paired draws.
+
+    Args:
+        workload_mix (list): Dicts with "Workload", "Jobs per Day" and an
+            optional "GPU" (defaults to "NVIDIA A100")
+        gpu_by_provider (dict, optional): GPU used by each provider, overrides
+            the GPU of the workload mix entries
+        providers (list, optional): Providers to project, defaults to all
+        baseline_provider (str, optional): Provider savings are measured
+            against, the registry's baseline by default
+        days_per_month (int): Number of billable days in the month
+        n_simulations (int): Number of Monte Carlo simulations
+        percentiles (tuple): Percentiles reported for each band
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself (e.g. a RunContext stream)
+        hourly_rates (dict, optional): Rates by provider and GPU, defaults
+            to HOURLY_RATES
+
+    Returns:
+        pandas.DataFrame: One row per provider with mean and percentile bands
+            of the monthly spend and of the savings against the baseline
+    """
+    hourly_rates = hourly_rates or HOURLY_RATES
+    baseline_provider = baseline_provider or get_baseline_provider()
+    if providers is None:
+        providers = list(hourly_rates.keys())
+    if baseline_provider not in providers:
+        providers = [baseline_provider] + list(providers)
+
+    rng = np.random.default_rng(seed)
+    jitter_mean, jitter_var = _uniform_moments(*PRICE_JITTER_RANGE)
+
+    # Job counts are drawn once per mix entry and shared by every provider
+    job_counts = [
+        rng.poisson(entry["Jobs per Day"] * days_per_month, size=n_simulations).astype(float)
+        for entry in workload_mix
+    ]
+
+    spend = {}
+    for provider in providers:
+        total = np.zeros(n_simulations)
+        factor_ranges = PROVIDER_FACTOR_RANGES[provider]
+
+        for entry, n_jobs in zip(workload_mix, job_counts):
+            if gpu_by_provider and provider in gpu_by_provider:
+                gpu = gpu_by_provider[provider]
+            else:
+                gpu = entry.get("GPU", "NVIDIA A100")
+
+            hourly_rate = hourly_rates[provider].get(gpu)
+            if hourly_rate is None:
+                raise ValueError(f"{provider} does not offer {gpu}")
+
+            base_time, _ = get_workload_base_params(entry["Workload"])
+            time_mean, time_var = _uniform_moments(*factor_ranges["time"])
+
+            # Sum of n_jobs runtimes and mean price jitter over those jobs
+            safe_jobs = np.maximum(n_jobs, 1)
+            runtime = rng.normal(n_jobs * time_mean, np.sqrt(n_jobs * time_var)) * base_time
+            jitter = rng.normal(jitter_mean, np.sqrt(jitter_var / safe_jobs))
+
+            rate = hourly_rate * get_workload_multiplier(entry["Workload"])
+            total += np.maximum(runtime, 0) / 60 * rate * jitter
+
+        spend[provider] = total
+
+    baseline = spend[baseline_provider]
+    rows = []
+    for provider in providers:
+        savings = spend[provider] - baseline
+        row = {
+            "Provider": provider,
+            "Mean Monthly Spend ($)": spend[provider].mean()
+        }
+        for p, value in zip(percentiles, np.percentile(spend[provider], percentiles)):
+            row[f"P{p} Monthly Spend ($)"] = value
+        row["Mean Savings ($)"] = savings.mean()
+        for p, value in zip(percentiles, np.percentile(savings, percentiles)):
+            row[f"P{p} Savings ($)"] = value
+        rows.append(row)
+
+    return pd.DataFrame(rows)
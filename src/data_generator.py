@@ -1,118 +1,150 @@
+import numpy as np
 import pandas as pd
-import random
 
-def generate_sample_data():
+from .derived_metrics import add_derived_metrics
+from .providers import load_provider_registry, provider_factor_ranges, provider_hardware
+from .run_context import RunContext
+from .scaling import instance_gpu_count, relative_execution_time
+from .workloads import calculate_throughput, get_workload_spec, load_workload_registry
+
+# Cloud providers, in the order of the provider registry
+PROVIDERS = list(load_provider_registry())
+
+# Run-to-run spread of each provider, as (min, max) multipliers on a
+# workload's base execution time and cost
+PROVIDER_FACTOR_RANGES = provider_factor_ranges()
+
+def get_workload_base_params(workload):
+    """
+    Get the reference execution time and cost of a workload
+    
+    Args:
+        workload (str): The workload name
+        
+    Returns:
+        tuple: (base time in minutes, base cost in dollars)
+    """
+    spec = get_workload_spec(workload)
+    return spec["Base_Time"], spec["Base_Cost"]
+
+def generate_benchmark_row(provider, workload, instance_type=None, rng=None):
+    """
+    Simulate one benchmark trial of a workload on a provider
+    
+    Args:
+        provider (str): Cloud provider name
+        workload (str): The workload name
+        instance_type (str, optional): Instance type; multi-GPU instances
+            (e.g., "p3.16xlarge") apply the workload's scaling model
+        rng (numpy.random.Generator, optional): Generator of the random
+            draws, e.g. a RunContext stream; unseeded by default
+        
+    Returns:
+        dict: Benchmark result with the measured columns of
+            generate_sample_data; see derive_row for the derived metrics
+    """
+    base_time, base_cost = get_workload_base_params(workload)
+    rng = rng or np.random.default_rng()
+    
+    # Randomize with some bias
+    factor_ranges = PROVIDER_FACTOR_RANGES[provider]
+    time_factor = rng.uniform(*factor_ranges["time"])
+    cost_factor = rng.uniform(*factor_ranges["cost"])
+    
+    execution_time = base_time * time_factor
+    cost = base_cost * cost_factor
+    
+    if instance_type is not None:
+        # Multi-GPU runs finish sooner but bill every GPU
+        n_gpus = instance_gpu_count(provider, instance_type)
+        relative_time, _ = relative_execution_time(workload, provider, [n_gpus])
+        execution_time *= float(relative_time[0])
+        cost *= n_gpus * float(relative_time[0])
+    
+    # Calculate throughput based on workload
+    throughput, throughput_unit = calculate_throughput(workload, execution_time)
+    
+    # Generate GPU utilization
+    gpu_util = rng.uniform(60, 95)
+    memory_usage = rng.uniform(70, 98)
+    
+    return {
+        "Provider": provider,
+        "Workload": workload,
+        "Execution Time (min)": round(execution_time, 2),
+        "Cost ($)": round(cost, 2),
+        "Throughput": round(throughput, 2),
+        "Throughput Unit": throughput_unit,
+        "GPU Utilization (%)": round(gpu_util, 1),
+        "Memory Usage (%)": round(memory_usage, 1)
+    }
+
+def generate_sample_data(gpu_by_provider=None, context=None, executor=None,
+                         instance_by_provider=None):
     """
     Generate sample benchmark data comparing cloud providers across different workloads.
     
+    Each result draws from the run context's stream of its provider and
+    workload, so a run gives the same results serially or in parallel.
+    
+    Args:
+        gpu_by_provider (dict, optional): GPU of each provider, used for the
+            energy metrics; each provider's first GPU by default
+        context (RunContext, optional): Random state of the run, a new run
+            by default
+        executor (concurrent.futures.Executor, optional): Executor the
+            results are generated in, serially by default
+        instance_by_provider (dict, optional): Instance type of each
+            provider; each provider's first instance type by default
+    
     Returns:
         pandas.DataFrame: DataFrame containing benchmark results
     """
-    # Cloud providers
-    providers = ["FlexAI", "AWS", "GCP", "Azure"]
-    
-    # Workload types
-    workloads = [
-        "LLM Fine-Tuning (Llama 3 8B)",
-        "Batch Inference (Stable Diffusion XL)",
-        "CV Model Training (ResNet-50)"
+    from .energy import add_energy_inputs
+    
+    context = context or RunContext()
+    if instance_by_provider is None:
+        instance_by_provider = {
+            provider: config["Instance_Types"][0] if config.get("Instance_Types") else None
+            for provider, config in load_hardware_configs().items()
+        }
+    
+    pairs = [
+        (provider, workload)
+        for workload in load_workload_registry()
+        for provider in PROVIDERS
     ]
+    providers, workloads = zip(*pairs)
+    instance_types = [instance_by_provider.get(provider) for provider in providers]
+    rngs = [context.stream(provider, workload) for provider, workload in pairs]
     
     # Generate random but sensible data
-    data = []
+    map_rows = executor.map if executor is not None else map
+    data = list(map_rows(generate_benchmark_row, providers, workloads, instance_types, rngs))
     
-    # Make FlexAI generally better but not always the best
-    # to keep things realistic
-    for workload in workloads:
-        base_time = 0
-        base_cost = 0
-        
-        if "LLM" in workload:
-            base_time = 120  # minutes
-            base_cost = 25  # dollars
-        elif "Inference" in workload:
-            base_time = 45  # minutes
-            base_cost = 12  # dollars
-        else:  # CV Model
-            base_time = 180  # minutes
-            base_cost = 35  # dollars
-        
-        for provider in providers:
-            # Randomize with some bias
-            if provider == "FlexAI":
-                time_factor = random.uniform(0.7, 0.9)  # FlexAI is generally faster
-                cost_factor = random.uniform(0.6, 0.8)  # FlexAI is generally cheaper
-            else:
-                time_factor = random.uniform(0.9, 1.3)
-                cost_factor = random.uniform(0.9, 1.4)
-            
-            execution_time = base_time * time_factor
-            cost = base_cost * cost_factor
-            
-            # Calculate throughput based on workload
-            if "LLM" in workload:
-                throughput = 5000 / execution_time  # tokens per second
-                throughput_unit = "tokens/sec"
-            elif "Inference" in workload:
-                throughput = 1000 / execution_time  # images per minute
-                throughput_unit = "images/min"
-            else:  # CV Model
-                throughput = 50000 / execution_time  # images per hour
-                throughput_unit = "images/hour"
-            
-            # Generate GPU utilization
-            gpu_util = random.uniform(60, 95)
-            memory_usage = random.uniform(70, 98)
-            
-            data.append({
-                "Provider": provider,
-                "Workload": workload,
-                "Execution Time (min)": round(execution_time, 2),
-                "Cost ($)": round(cost, 2),
-                "Throughput": round(throughput, 2),
-                "Throughput Unit": throughput_unit,
-                "GPU Utilization (%)": round(gpu_util, 1),
-                "Memory Usage (%)": round(memory_usage, 1),
-                "Cost-Performance Ratio": round(cost / throughput, 4)
-            })
-    
-    return pd.DataFrame(data)
+    return add_derived_metrics(add_energy_inputs(pd.DataFrame(data), gpu_by_provider))
 
-def load_hardware_configs(file_path="data/hardware_configs.json"):
+def load_hardware_configs(file_path=None):
     """
-    Load hardware configurations from JSON file
+    Load hardware configurations
     
     Args:
-        file_path (str): Path to the hardware configs JSON file
+        file_path (str, optional): Path to a hardware configs JSON file;
+            by default, and if the file is not found, the hardware of the
+            provider registry
         
     Returns:
         dict: Hardware configurations by provider
     """
     import json
     
+    if file_path is None:
+        return provider_hardware()
     try:
         with open(file_path, 'r') as f:
             return json.load(f)
     except FileNotFoundError:
-        # Return default configs if file not found
-        return {
-            "AWS": {
-                "GPUs": ["NVIDIA A100", "NVIDIA T4", "NVIDIA V100"],
-                "Instance_Types": ["p3.2xlarge", "p3.8xlarge", "p3.16xlarge"]
-            },
-            "GCP": {
-                "GPUs": ["NVIDIA A100", "NVIDIA T4", "NVIDIA L4"],
-                "Instance_Types": ["a2-highgpu-1g", "a2-highgpu-2g", "a2-highgpu-4g"]
-            },
-            "Azure": {
-                "GPUs": ["NVIDIA A100", "NVIDIA T4", "NVIDIA K80"],
-                "Instance_Types": ["NC_v3", "NC_A100_v4", "ND_A100_v4"]
-            },
-            "FlexAI": {
-                "GPUs": ["NVIDIA A100", "NVIDIA H100", "NVIDIA T4"],
-                "Instance_Types": ["flex-standard", "flex-performance", "flex-economy"]
-            }
-        }
+        return provider_hardware()
 
 def save_benchmark_results(df, file_path="data/benchmark_results.csv"):
     """
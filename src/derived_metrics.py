@@ -0,0 +1,159 @@
+import pandas as pd
+
+# Metrics computed from other columns of the results. Each one lists the
+# columns it is computed from, which may be other derived metrics, and a
+# function computing it from the results: whole columns of a DataFrame, or
+# the values of a single result row as a dict.
+DERIVED_METRICS = {
+    "Cost-Performance Ratio": {
+        "inputs": ["Cost ($)", "Throughput"],
+        "compute": lambda df: df["Cost ($)"] / df["Throughput"],
+        "lower_is_better": True
+    },
+    "Cost per Minute ($)": {
+        "inputs": ["Cost ($)", "Execution Time (min)"],
+        "compute": lambda df: df["Cost ($)"] / df["Execution Time (min)"],
+        "lower_is_better": True
+    },
+    "Cost per Hour ($)": {
+        "inputs": ["Cost per Minute ($)"],
+        "compute": lambda df: df["Cost per Minute ($)"] * 60,
+        "lower_is_better": True
+    },
+    # Average GPU power, linear in utilization between idle and TDP
+    "Power (W)": {
+        "inputs": ["Idle Power (W)", "TDP (W)", "GPU Utilization (%)"],
+        "compute": lambda df: (
+            df["Idle Power (W)"]
+            + (df["TDP (W)"] - df["Idle Power (W)"]) * df["GPU Utilization (%)"] / 100
+        ),
+        "lower_is_better": True
+    },
+    # Facility energy: GPU energy scaled by the data center's PUE
+    "Energy (kWh)": {
+        "inputs": ["Power (W)", "PUE", "Execution Time (min)"],
+        "compute": lambda df: df["Power (W)"] * df["PUE"] * df["Execution Time (min)"] / 60000,
+        "lower_is_better": True
+    },
+    "CO2e (kg)": {
+        "inputs": ["Energy (kWh)", "Carbon Intensity (gCO2e/kWh)"],
+        "compute": lambda df: df["Energy (kWh)"] * df["Carbon Intensity (gCO2e/kWh)"] / 1000,
+        "lower_is_better": True
+    },
+    "Throughput per Watt": {
+        "inputs": ["Throughput", "Power (W)"],
+        "compute": lambda df: df["Throughput"] / df["Power (W)"],
+        "lower_is_better": False
+    }
+}
+
+# Metrics where a lower value is better
+LOWER_IS_BETTER = ["Execution Time (min)", "Cost ($)"] + [
+    metric for metric, spec in DERIVED_METRICS.items() if spec["lower_is_better"]
+]
+
+def _computation_order(metrics):
+    """The metrics, each after the derived metrics it is computed from"""
+    order = []
+
+    def visit(metric):
+        if metric in order:
+            return
+        for column in DERIVED_METRICS[metric]["inputs"]:
+            if column in DERIVED_METRICS:
+                visit(column)
+        order.append(metric)
+
+    for metric in metrics:
+        visit(metric)
+    return order
+
+def dependent_metrics(columns):
+    """
+    Derived metrics to recompute when some columns change
+
+    Args:
+        columns (list): Changed columns, e.g. ["Cost ($)"]
+
+    Returns:
+        list: Derived metrics depending on any of the columns, directly or
+            through another derived metric, in computation order
+    """
+    changed = set(columns)
+    dependents = []
+    for metric in _computation_order(DERIVED_METRICS):
+        if changed.intersection(DERIVED_METRICS[metric]["inputs"]):
+            dependents.append(metric)
+            changed.add(metric)
+    return dependents
+
+def add_derived_metrics(df, metrics=None):
+    """
+    Compute derived metrics over whole columns
+
+    Called once when results are ingested, so the dashboard and reports
+    read the metrics instead of computing them again. Metrics whose inputs
+    are missing from the results are skipped.
+
+    Args:
+        df (pandas.DataFrame): Benchmark results
+        metrics (list, optional): Metrics to compute, all by default
+
+    Returns:
+        pandas.DataFrame: A new DataFrame with the metrics (re)computed
+    """
+    # Copy-on-write: new columns never reach the caller's DataFrame
+    result = df.copy(deep=False)
+    for metric in _computation_order(metrics or DERIVED_METRICS):
+        spec = DERIVED_METRICS[metric]
+        if all(column in result.columns for column in spec["inputs"]):
+            result[metric] = spec["compute"](result)
+    return result
+
+def ensure_derived_metrics(df):
+    """
+    Add the derived metrics the results do not have yet
+
+    Args:
+        df (pandas.DataFrame): Benchmark results
+
+    Returns:
+        pandas.DataFrame: The results themselves if nothing missing can be
+            computed
+    """
+    available = set(df.columns)
+    missing = []
+    for metric in _computation_order(DERIVED_METRICS):
+        if metric not in available and available.issuperset(DERIVED_METRICS[metric]["inputs"]):
+            missing.append(metric)
+            available.add(metric)
+    return add_derived_metrics(df, missing) if missing else df
+
+def derive_row(row):
+    """
+    Add the derived metrics to a single result row
+
+    Args:
+        row (dict): A result, e.g. from generate_benchmark_row
+
+    Returns:
+        dict: The row with every derived metric
+    """
+    row = dict(row)
+    for metric in _computation_order(DERIVED_METRICS):
+        if all(column in row for column in DERIVED_METRICS[metric]["inputs"]):
+            row[metric] = DERIVED_METRICS[metric]["compute"](row)
+    return row
+
+def append_results(df, new_rows):
+    """
+    Append results, computing derived metrics for the new rows only
+
+    Args:
+        df (pandas.DataFrame): Results with derived metrics
+        new_rows (pandas.DataFrame): Results to append
+
+    Returns:
+        pandas.DataFrame: A new DataFrame with every row
+    """
+    return pd.concat([df, add_derived_metrics(new_rows)], ignore_index=True)
@@ -0,0 +1,110 @@
+import json
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+# Grid carbon intensity of each region, in gCO2e per kWh. Used when the
+# carbon intensity file is missing.
+DEFAULT_CARBON_INTENSITY = {
+    "us-east-1": {"Location": "N. Virginia, US", "Carbon_Intensity": 379},
+    "us-central1": {"Location": "Iowa, US", "Carbon_Intensity": 430},
+    "eastus": {"Location": "Virginia, US", "Carbon_Intensity": 379},
+    "fr-par": {"Location": "Paris, France", "Carbon_Intensity": 55}
+}
+
+# Carbon intensity file shipped with the suite, resolved from the package so it
+# does not depend on the working directory
+CARBON_INTENSITY_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "carbon_intensity.json"
+)
+
+# Columns looked up from the hardware configs and carbon intensity table,
+# from which the derived energy metrics are computed
+ENERGY_INPUTS = ["GPU", "TDP (W)", "Idle Power (W)", "PUE", "Region",
+                 "Carbon Intensity (gCO2e/kWh)"]
+
+@lru_cache(maxsize=None)
+def load_carbon_intensity(file_path=CARBON_INTENSITY_FILE):
+    """
+    Load the carbon intensity of each region from a JSON file
+
+    The table is cached per file path and shared by every caller, so it
+    must not be modified.
+
+    Args:
+        file_path (str): Path to the carbon intensity JSON file
+
+    Returns:
+        dict: Location and carbon intensity (gCO2e/kWh) by region
+    """
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return DEFAULT_CARBON_INTENSITY
+
+def _power_table(hardware_configs):
+    """Power of every (Provider, GPU) of the hardware configs"""
+    return pd.DataFrame([
+        {
+            "Provider": provider,
+            "GPU": gpu,
+            "TDP (W)": power["TDP_W"],
+            "Idle Power (W)": power["Idle_W"]
+        }
+        for provider, config in hardware_configs.items()
+        for gpu, power in config.get("GPU_Power", {}).items()
+    ], columns=["Provider", "GPU", "TDP (W)", "Idle Power (W)"])
+
+def _site_table(hardware_configs, carbon_intensity):
+    """PUE, region and carbon intensity of every provider"""
+    return pd.DataFrame([
+        {
+            "Provider": provider,
+            "PUE": config.get("PUE", 1.0),
+            "Region": config.get("Region"),
+            "Carbon Intensity (gCO2e/kWh)": carbon_intensity.get(
+                config.get("Region"), {}
+            ).get("Carbon_Intensity")
+        }
+        for provider, config in hardware_configs.items()
+    ], columns=["Provider", "PUE", "Region", "Carbon Intensity (gCO2e/kWh)"])
+
+def add_energy_inputs(df, gpu_by_provider=None, hardware_configs=None, carbon_intensity=None):
+    """
+    Add the power and carbon intensity of the hardware each result ran on
+
+    Every row gets the TDP and idle power of its GPU, the PUE and region
+    of its provider and the carbon intensity of that region, in two joins.
+    Power, energy, CO2e and throughput per watt are then derived from
+    these (see DERIVED_METRICS). Rows on unknown hardware get NaN.
+
+    Args:
+        df (pandas.DataFrame): Benchmark results
+        gpu_by_provider (dict, optional): GPU of each provider, for results
+            without a "GPU" column; each provider's first GPU by default
+        hardware_configs (dict, optional): Output of load_hardware_configs
+        carbon_intensity (dict, optional): Output of load_carbon_intensity
+
+    Returns:
+        pandas.DataFrame: A new DataFrame with the ENERGY_INPUTS columns
+    """
+    if hardware_configs is None:
+        from .data_generator import load_hardware_configs
+        hardware_configs = load_hardware_configs()
+    carbon_intensity = carbon_intensity or load_carbon_intensity()
+
+    result = df.drop(columns=[column for column in ENERGY_INPUTS[1:] if column in df.columns])
+    if "GPU" not in result.columns:
+        gpu_by_provider = gpu_by_provider or {
+            provider: config["GPUs"][0] for provider, config in hardware_configs.items()
+        }
+        result["GPU"] = result["Provider"].map(gpu_by_provider)
+
+    inputs = result[["Provider", "GPU"]].merge(
+        _power_table(hardware_configs), on=["Provider", "GPU"], how="left"
+    ).merge(_site_table(hardware_configs, carbon_intensity), on="Provider", how="left")
+    for column in ENERGY_INPUTS[1:]:
+        result[column] = inputs[column].to_numpy()
+    return result
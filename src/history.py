@@ -0,0 +1,358 @@
+import argparse
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:  # DuckDB is optional, SQLite ships with Python
+    duckdb = None
+
+# SQL column of every benchmark result column
+RESULT_COLUMNS = {
+    "Provider": "provider",
+    "Workload": "workload",
+    "GPU": "gpu",
+    "Execution Time (min)": "execution_time_min",
+    "Cost ($)": "cost",
+    "Throughput": "throughput",
+    "Throughput Unit": "throughput_unit",
+    "GPU Utilization (%)": "gpu_utilization",
+    "Memory Usage (%)": "memory_usage",
+    "Cost-Performance Ratio": "cost_performance_ratio"
+}
+
+# SQL column of every get_resource_price_table column
+PRICING_COLUMNS = {
+    "Provider": "provider",
+    "GPU": "gpu",
+    "Hourly Rate": "hourly_rate",
+    "Monthly Rate": "monthly_rate"
+}
+
+# Rows sent to the database per executemany call
+INSERT_BATCH_ROWS = 10000
+
+# Timestamps are stored as ISO-8601 UTC text, which sorts chronologically
+# in both backends
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS runs (
+        run_id INTEGER PRIMARY KEY,
+        started_at TEXT NOT NULL,
+        source TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS results (
+        run_id INTEGER NOT NULL REFERENCES runs (run_id),
+        provider TEXT NOT NULL,
+        workload TEXT NOT NULL,
+        gpu TEXT,
+        execution_time_min DOUBLE,
+        cost DOUBLE,
+        throughput DOUBLE,
+        throughput_unit TEXT,
+        gpu_utilization DOUBLE,
+        memory_usage DOUBLE,
+        cost_performance_ratio DOUBLE
+    )""",
+    """CREATE TABLE IF NOT EXISTS pricing (
+        provider TEXT NOT NULL,
+        gpu TEXT NOT NULL,
+        hourly_rate DOUBLE NOT NULL,
+        monthly_rate DOUBLE,
+        effective_from TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at)",
+    "CREATE INDEX IF NOT EXISTS results_run ON results (run_id)",
+    "CREATE INDEX IF NOT EXISTS results_workload_gpu ON results (workload, gpu)",
+    "CREATE INDEX IF NOT EXISTS results_provider_workload ON results (provider, workload)",
+    "CREATE INDEX IF NOT EXISTS pricing_provider_gpu ON pricing (provider, gpu, effective_from)"
+]
+
+# Parameterized statements, reused for every insert and query
+INSERT_RUN = "INSERT INTO runs (run_id, started_at, source) VALUES (?, ?, ?)"
+INSERT_RESULTS = (
+    f"INSERT INTO results (run_id, {', '.join(RESULT_COLUMNS.values())}) "
+    f"VALUES ({', '.join(['?'] * (len(RESULT_COLUMNS) + 1))})"
+)
+INSERT_PRICING = (
+    f"INSERT INTO pricing ({', '.join(PRICING_COLUMNS.values())}, effective_from) "
+    f"VALUES ({', '.join(['?'] * (len(PRICING_COLUMNS) + 1))})"
+)
+
+# Median cost per workload and GPU of the runs started since a timestamp.
+# Rows are ranked within each group and the middle one or two are averaged
+# (rank * 2 within [n, n + 2]), which avoids a MEDIAN aggregate SQLite lacks
+MEDIAN_COST_QUERY = """
+    WITH ranked AS (
+        SELECT results.workload, results.gpu, results.cost,
+               ROW_NUMBER() OVER (
+                   PARTITION BY results.workload, results.gpu ORDER BY results.cost
+               ) AS cost_rank,
+               COUNT(*) OVER (PARTITION BY results.workload, results.gpu) AS n
+        FROM results JOIN runs ON runs.run_id = results.run_id
+        WHERE runs.started_at >= ? AND results.cost IS NOT NULL
+    )
+    SELECT workload AS "Workload", gpu AS "GPU",
+           AVG(cost) AS "Median Cost ($)", MAX(n) AS "Runs"
+    FROM ranked
+    WHERE cost_rank * 2 BETWEEN n AND n + 2
+    GROUP BY workload, gpu
+    ORDER BY workload, gpu
+"""
+
+# Latest hourly rate of every provider and GPU
+CURRENT_PRICING_QUERY = """
+    SELECT provider AS "Provider", gpu AS "GPU",
+           hourly_rate AS "Hourly Rate", monthly_rate AS "Monthly Rate",
+           effective_from AS "Effective From"
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY provider, gpu ORDER BY effective_from DESC
+        ) AS age
+        FROM pricing
+    ) AS ranked
+    WHERE age = 1
+    ORDER BY provider, gpu
+"""
+
+def _timestamp(value=None):
+    """A datetime, date string or None (now) as stored timestamp text"""
+    if value is None:
+        value = datetime.now(timezone.utc)
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC")
+    return timestamp.strftime(TIMESTAMP_FORMAT)
+
+def _column_values(df, column):
+    """A column as Python values with missing values as None"""
+    if column not in df.columns:
+        return [None] * len(df)
+    values = df[column]
+    return values.astype(object).where(values.notna(), None).tolist()
+
+class BenchmarkHistory:
+    """
+    Benchmark runs, results and pricing in an embedded SQL database
+
+    Uses DuckDB when it is installed and SQLite otherwise; both keep the
+    whole history in one file (or in memory) and run aggregations in the
+    database instead of in pandas. Rows are inserted in batches with
+    executemany and every statement is parameterized, so the backend
+    reuses its prepared statements. The connection is shared between
+    threads, one statement at a time.
+
+    Args:
+        path (str): Database file, ":memory:" for a throwaway database
+        backend (str, optional): "duckdb" or "sqlite", DuckDB if installed
+            by default
+    """
+
+    def __init__(self, path=":memory:", backend=None):
+        if backend is None:
+            backend = "duckdb" if duckdb is not None else "sqlite"
+        if backend == "duckdb":
+            if duckdb is None:
+                raise ImportError("The duckdb backend requires the duckdb package")
+            self._connection = duckdb.connect(path)
+        elif backend == "sqlite":
+            self._connection = sqlite3.connect(
+                path, check_same_thread=False, isolation_level=None  # Explicit transactions
+            )
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self._lock = threading.Lock()
+
+        with self._transaction() as cursor:
+            for statement in SCHEMA:
+                cursor.execute(statement)
+
+    @contextmanager
+    def _transaction(self):
+        """A cursor whose statements commit together, or not at all"""
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN TRANSACTION")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+    def _insert_rows(self, cursor, statement, df, columns, batch_size, prefix=(), suffix=()):
+        """
+        executemany over a DataFrame, batch_size rows at a time
+
+        Only one batch is converted to Python values at once, so a large
+        insert never holds a second copy of the data as tuples.
+        """
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            values = [_column_values(batch, column) for column in columns]
+            cursor.executemany(statement, [prefix + row + suffix for row in zip(*values)])
+
+    def record_run(self, results, started_at=None, source="dashboard", gpu_by_provider=None,
+                   batch_size=INSERT_BATCH_ROWS):
+        """
+        Store the results of a benchmark run
+
+        Args:
+            results (pandas.DataFrame or iterable): Results with the columns
+                of generate_sample_data, or chunks of them (e.g. a
+                normalized job log)
+            started_at (datetime or str, optional): When the run started,
+                now by default
+            source (str): Where the results come from
+            gpu_by_provider (dict, optional): GPU of each provider, for
+                results without a "GPU" column
+            batch_size (int): Rows per executemany call
+
+        Returns:
+            int: The run id
+        """
+        chunks = [results] if isinstance(results, pd.DataFrame) else results
+
+        with self._transaction() as cursor:
+            cursor.execute("SELECT COALESCE(MAX(run_id), 0) + 1 FROM runs")
+            run_id = cursor.fetchone()[0]
+            cursor.execute(INSERT_RUN, (run_id, _timestamp(started_at), source))
+
+            for chunk in chunks:
+                if "GPU" not in chunk.columns and gpu_by_provider is not None:
+                    chunk = chunk.assign(GPU=chunk["Provider"].map(gpu_by_provider))
+                self._insert_rows(
+                    cursor, INSERT_RESULTS, chunk, RESULT_COLUMNS, batch_size, prefix=(run_id,)
+                )
+
+        return run_id
+
+    def import_trace(self, file_path, chunksize=100000, column_map=None):
+        """
+        Store a job log as one run, a chunk at a time
+
+        Args:
+            file_path (str): Path to a .csv or .jsonl job log
+            chunksize (int): Rows read and inserted at a time
+            column_map (dict, optional): Benchmark column name to log column name
+
+        Returns:
+            int: The run id
+        """
+        from .trace_ingest import normalize_trace_chunk, read_trace_chunks
+
+        chunks = (
+            normalize_trace_chunk(chunk)
+            for chunk in read_trace_chunks(file_path, chunksize, column_map)
+        )
+        return self.record_run(chunks, source=file_path, batch_size=chunksize)
+
+    def record_pricing(self, price_table=None, effective_from=None):
+        """
+        Store hourly rates, effective from a point in time
+
+        Args:
+            price_table (pandas.DataFrame, optional): Rates in the format of
+                get_resource_price_table, that table by default
+            effective_from (datetime or str, optional): When the rates
+                apply, now by default
+        """
+        if price_table is None:
+            from .utils import get_resource_price_table
+            price_table = get_resource_price_table()
+
+        with self._transaction() as cursor:
+            self._insert_rows(
+                cursor, INSERT_PRICING, price_table, PRICING_COLUMNS, INSERT_BATCH_ROWS,
+                suffix=(_timestamp(effective_from),)
+            )
+
+    def query(self, sql, params=()):
+        """
+        Run a parameterized query
+
+        Args:
+            sql (str): SQL with ? placeholders
+            params (sequence): Placeholder values
+
+        Returns:
+            pandas.DataFrame: The result set
+        """
+        with self._lock:
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute(sql, params)
+                columns = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        return pd.DataFrame(rows, columns=columns)
+
+    def median_cost(self, days=30, now=None):
+        """
+        Median cost per workload and GPU over recent runs
+
+        Args:
+            days (float): Length of the window, in days
+            now (datetime or str, optional): End of the window, now by default
+
+        Returns:
+            pandas.DataFrame: Workload, GPU, Median Cost ($) and Runs
+        """
+        end = pd.Timestamp(_timestamp(now))
+        since = _timestamp(end - timedelta(days=days))
+        return self.query(MEDIAN_COST_QUERY, (since,))
+
+    def current_pricing(self):
+        """
+        Latest hourly rates of every provider and GPU
+
+        Returns:
+            pandas.DataFrame: The price table with its Effective From time
+        """
+        return self.query(CURRENT_PRICING_QUERY)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the benchmark history database")
+    parser.add_argument("database", help="database file, created if missing")
+    parser.add_argument("--backend", choices=["duckdb", "sqlite"], default=None,
+                        help="database engine (default: duckdb if installed)")
+    parser.add_argument("--import-results", metavar="CSV",
+                        help="store a results CSV from save_benchmark_results as a run")
+    parser.add_argument("--import-trace", metavar="LOG", help="store a job log as a run")
+    parser.add_argument("--days", type=float, default=30,
+                        help="window of the median cost report, in days")
+    parser.add_argument("--sql", help="run this query instead of the median cost report")
+    args = parser.parse_args(argv)
+
+    with BenchmarkHistory(args.database, args.backend) as history:
+        if args.import_results:
+            history.record_run(pd.read_csv(args.import_results), source=args.import_results)
+        if args.import_trace:
+            history.import_trace(args.import_trace)
+
+        result = history.query(args.sql) if args.sql else history.median_cost(args.days)
+        print(result.to_string(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+import argparse
+import heapq
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from .data_generator import PROVIDER_FACTOR_RANGES, load_hardware_configs
+from .providers import gpu_relative_speed
+from .run_context import RunContext
+from .workloads import get_workload_spec
+
+# Offered loads of a profile, as fractions of the serving capacity at the
+# largest batch size
+LOAD_LEVELS = (0.1, 0.25, 0.5, 0.7, 0.85, 0.95)
+
+# Batches timed to estimate the serving capacity
+CAPACITY_SAMPLES = 20
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies
+
+    Values are counted in log-linear buckets: every power of two is split
+    into the same number of linear sub-buckets, so a value is recorded with
+    a bounded relative error whatever its magnitude, and memory grows with
+    the logarithm of the largest value instead of with the number of
+    values. Recording is vectorized.
+
+    Args:
+        significant_figures (int): Decimal digits every value keeps
+        unit (float): Smallest distinguishable value, in seconds
+    """
+
+    def __init__(self, significant_figures=3, unit=1e-6):
+        self.unit = unit
+        sub_bucket_count = 2 ** math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._half_count = sub_bucket_count // 2
+        self._sub_bucket_bits = int(math.log2(sub_bucket_count))
+        self.counts = np.zeros(sub_bucket_count, dtype=np.int64)
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _bucket_index(self, units):
+        """Bucket of every value, in integer units"""
+        magnitude = np.floor(np.log2(np.maximum(units, 1))).astype(np.int64)
+        shift = np.maximum(magnitude - self._sub_bucket_bits + 1, 0)
+        return shift * self._half_count + (units >> shift)
+
+    def _bucket_bounds(self, index):
+        """Lowest value and width of every bucket, in integer units"""
+        shift = np.maximum(index // self._half_count - 1, 0)
+        return (index - shift * self._half_count) << shift, 1 << shift
+
+    def record(self, values):
+        """
+        Count latencies
+
+        Args:
+            values (float or numpy.ndarray): Latencies in seconds
+        """
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        if len(values) == 0:
+            return
+        units = np.round(values / self.unit).astype(np.int64)
+        counts = np.bincount(self._bucket_index(units))
+        if len(counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(counts) - len(self.counts)))
+        self.counts[:len(counts)] += counts
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    def merge(self, other):
+        """
+        Add the counts of another histogram with the same precision
+
+        Args:
+            other (LatencyHistogram): Histogram to add
+        """
+        if (other.unit, other._half_count) != (self.unit, self._half_count):
+            raise ValueError("Histograms have different precisions")
+        size = max(len(self.counts), len(other.counts))
+        self.counts = (np.pad(self.counts, (0, size - len(self.counts)))
+                       + np.pad(other.counts, (0, size - len(other.counts))))
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def count(self):
+        """Number of recorded values"""
+        return int(self.counts.sum())
+
+    def mean(self):
+        """Mean latency in seconds, from the bucket midpoints"""
+        index = np.nonzero(self.counts)[0]
+        lowest, width = self._bucket_bounds(index)
+        midpoints = (lowest + (width - 1) / 2) * self.unit
+        return float(np.average(midpoints, weights=self.counts[index]))
+
+    def percentile(self, q):
+        """
+        Latency below which a share of the values fall
+
+        Args:
+            q (float): Percentile, from 0 to 100
+
+        Returns:
+            float: Highest latency of the bucket holding the percentile, in
+                seconds, capped at the largest value recorded
+        """
+        total = self.count
+        if total == 0:
+            return math.nan
+        rank = max(math.ceil(q / 100 * total), 1)
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        lowest, width = self._bucket_bounds(np.int64(index))
+        return min(float((lowest + width - 1) * self.unit), self.max)
+
+def batch_service_time(workload, provider, gpu="NVIDIA A100"):
+    """
+    Service time model of a workload's inference on a provider's GPU
+
+    A batch takes the workload's fixed overhead plus its time per item,
+    scaled by the GPU's relative speed and the provider's mean time factor,
+    with lognormal jitter.
+
+    Args:
+        workload (str): The workload name; its specification must have an
+            "Inference" section
+        provider (str): Cloud provider name
+        gpu (str): GPU serving the requests
+
+    Returns:
+        callable: Called with (batch size, numpy Generator), returns the
+            service time of the batch in seconds
+    """
+    inference = get_workload_spec(workload).get("Inference")
+    if inference is None:
+        raise ValueError(f"Workload {workload!r} has no inference model")
+
+    time_factor = sum(PROVIDER_FACTOR_RANGES[provider]["time"]) / 2
+    scale = time_factor / gpu_relative_speed(provider, gpu)
+    overhead = inference["Batch_Overhead_Sec"] * scale
+    per_item = inference["Per_Item_Sec"] * scale
+    cv = inference.get("Service_Time_CV", 0)
+    sigma = math.sqrt(math.log(1 + cv ** 2))
+
+    def service_time(batch_size, rng):
+        # Lognormal with a mean of 1 and the given coefficient of variation
+        return (overhead + per_item * batch_size) * rng.lognormal(-sigma ** 2 / 2, sigma)
+
+    return service_time
+
+def timed_service_time(infer_fn):
+    """
+    Service time measured by running a model locally
+
+    Args:
+        infer_fn (callable): Called with a batch size, runs one batch of
+            inference (e.g. a CPU model on random inputs)
+
+    Returns:
+        callable: A service time function for simulate_inference, which
+            times infer_fn with the wall clock
+    """
+    def service_time(batch_size, rng):
+        start = time.perf_counter()
+        infer_fn(batch_size)
+        return time.perf_counter() - start
+
+    return service_time
+
+def simulate_inference(arrival_rate, service_time_fn, n_requests=10000, max_batch_size=8,
+                       max_wait_sec=0.05, concurrency=1, seed=None):
+    """
+    Simulate a request stream served with dynamic batching
+
+    Requests arrive in an open loop (a Poisson process that does not slow
+    down when the server falls behind). Each of `concurrency` model
+    replicas takes the waiting requests as one batch as soon as it is free
+    and either `max_batch_size` requests are waiting or the oldest has
+    waited `max_wait_sec`. Batches are formed with binary searches over
+    the arrival times, so a simulation costs one step per batch.
+
+    Args:
+        arrival_rate (float): Mean requests per second
+        service_time_fn (callable): Called with (batch size, numpy
+            Generator), returns the batch's service time in seconds; see
+            batch_service_time and timed_service_time
+        n_requests (int): Number of requests
+        max_batch_size (int): Largest batch
+        max_wait_sec (float): Longest a request waits for its batch to fill
+        concurrency (int): Model replicas serving batches in parallel
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself (e.g. a RunContext stream)
+
+    Returns:
+        tuple: (LatencyHistogram of request latencies, dict with the
+            achieved throughput, mean batch size and replica utilization)
+    """
+    rng = np.random.default_rng(seed)
+    arrivals = np.cumsum(rng.exponential(1 / arrival_rate, size=n_requests))
+    latencies = np.empty(n_requests)
+    free_at = [0.0] * concurrency
+    busy_time = 0.0
+    n_batches = 0
+
+    next_request = 0
+    while next_request < n_requests:
+        replica_free = heapq.heappop(free_at)
+        oldest = arrivals[next_request]
+        start = max(replica_free, oldest)
+
+        # Dispatch once the batch is full or the oldest request's wait is up
+        last_of_full_batch = arrivals[min(next_request + max_batch_size, n_requests) - 1]
+        dispatch = max(start, min(oldest + max_wait_sec, last_of_full_batch))
+        waiting = np.searchsorted(arrivals, dispatch, side="right")
+        end = min(waiting, next_request + max_batch_size)
+
+        service = service_time_fn(end - next_request, rng)
+        finish = dispatch + service
+        latencies[next_request:end] = finish - arrivals[next_request:end]
+        heapq.heappush(free_at, finish)
+
+        busy_time += service
+        n_batches += 1
+        next_request = end
+
+    histogram = LatencyHistogram()
+    histogram.record(latencies)
+    duration = max(free_at) - arrivals[0]
+    return histogram, {
+        "Throughput (req/s)": n_requests / duration,
+        "Mean Batch Size": n_requests / n_batches,
+        "Utilization (%)": 100 * busy_time / (concurrency * duration)
+    }
+
+def profile_inference(workload="Batch Inference (Stable Diffusion XL)", gpu_by_provider=None,
+                      batch_sizes=(1, 4, 8, 16), concurrency=1, load_levels=LOAD_LEVELS,
+                      n_requests=5000, max_wait_sec=0.05, service_time_fn=None, context=None):
+    """
+    Throughput/latency curves of a workload's inference on every provider
+
+    Every provider, GPU and largest batch size is simulated at loads from a
+    light stream up to near the serving capacity at the largest of
+    `batch_sizes`, so all batch sizes of a provider face the same request
+    rates and smaller batches show where they saturate.
+
+    Args:
+        workload (str): The workload name
+        gpu_by_provider (dict, optional): GPU serving each provider's
+            requests, each provider's first GPU by default
+        batch_sizes (tuple): Largest batch sizes profiled
+        concurrency (int): Model replicas per provider
+        load_levels (tuple): Offered loads, as fractions of the capacity
+        n_requests (int): Requests simulated per point
+        max_wait_sec (float): Longest a request waits for its batch to fill
+        service_time_fn (callable, optional): Called with (provider, GPU),
+            returns a service time function; batch_service_time of the
+            workload by default
+        context (RunContext, optional): Random state of the run, a new run
+            by default; every point draws from its own stream
+
+    Returns:
+        pandas.DataFrame: One row per provider, GPU, batch size and load,
+            with the offered load, achieved throughput, mean batch size,
+            utilization and latency percentiles in seconds
+    """
+    context = context or RunContext()
+    if gpu_by_provider is None:
+        gpu_by_provider = {
+            provider: config["GPUs"][0] for provider, config in load_hardware_configs().items()
+        }
+    if service_time_fn is None:
+        def service_time_fn(provider, gpu):
+            return batch_service_time(workload, provider, gpu)
+
+    rows = []
+    for provider, gpu in gpu_by_provider.items():
+        service_time = service_time_fn(provider, gpu)
+
+        # Capacity: replicas always busy with full batches of mean service time
+        largest = max(batch_sizes)
+        rng = context.stream(provider, gpu, "capacity")
+        mean_service = np.mean([service_time(largest, rng) for _ in range(CAPACITY_SAMPLES)])
+        capacity = concurrency * largest / mean_service
+
+        for batch_size in batch_sizes:
+            for level, load in enumerate(load_levels):
+                histogram, stats = simulate_inference(
+                    load * capacity, service_time, n_requests, batch_size, max_wait_sec,
+                    concurrency, seed=context.stream(provider, gpu, batch_size, level)
+                )
+                rows.append({
+                    "Provider": provider,
+                    "GPU": gpu,
+                    "Max Batch Size": batch_size,
+                    "Concurrency": concurrency,
+                    "Offered Load (req/s)": load * capacity,
+                    **stats,
+                    **{
+                        f"P{q} Latency (s)": histogram.percentile(q)
+                        for q in LATENCY_PERCENTILES
+                    }
+                })
+
+    return pd.DataFrame(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Profile inference throughput and latency percentiles per provider"
+    )
+    parser.add_argument("--workload", default="Batch Inference (Stable Diffusion XL)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16],
+                        help="largest batch sizes to profile")
+    parser.add_argument("--concurrency", type=int, default=1, help="model replicas per provider")
+    parser.add_argument("--requests", type=int, default=5000, help="requests simulated per point")
+    parser.add_argument("--max-wait", type=float, default=0.05,
+                        help="longest a request waits for its batch to fill, in seconds")
+    parser.add_argument("--run-id", help="run id of an earlier profile to regenerate")
+    parser.add_argument("--output", help="write the profile to this CSV")
+    args = parser.parse_args(argv)
+
+    context = RunContext.from_run_id(args.run_id) if args.run_id else RunContext()
+    profile = profile_inference(
+        args.workload, batch_sizes=tuple(args.batch_sizes), concurrency=args.concurrency,
+        n_requests=args.requests, max_wait_sec=args.max_wait, context=context
+    )
+    if args.output:
+        profile.to_csv(args.output, index=False)
+
+    print(f"Run id: {context.run_id}")
+    print(profile.to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+
+if __name__ == "__main__":
+    main()
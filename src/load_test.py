@@ -0,0 +1,423 @@
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+import pandas as pd
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+from .utils import markdown_table
+from .workloads import load_workload_registry
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Controls of app.py driven by every simulated session
+WORKLOAD_SELECT_LABEL = "SELECT WORKLOAD:"
+RUN_BUTTON_LABEL = "▶ RUN BENCHMARK"
+RESULTS_TABS_KEY = "results_tab"
+
+# Latency percentiles reported per interaction
+LATENCY_PERCENTILES = (50, 95, 99)
+
+class DashboardSession:
+    """
+    A browser session on a running dashboard, over the Streamlit websocket
+
+    Like the frontend, the session sends the state of every widget it has
+    seen with each rerun request and waits for the script to finish, so the
+    latency of an interaction is what a user would wait for. Widgets are
+    addressed by their label, or by their key for widgets without one.
+    """
+
+    def __init__(self, url, timeout=120):
+        self._websocket = connect(
+            url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream",
+            subprotocols=["streamlit"],
+            max_size=None
+        )
+        self._timeout = timeout
+        self._widgets = {}  # label -> (widget id, fragment id)
+        self._states = {}  # widget id -> WidgetState
+        self.tab_labels = []
+        self.errors = []
+
+    def _rerun(self, trigger=None, fragment_id=""):
+        """Request a rerun, wait for it to finish and return its latency"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.fragment_id = fragment_id
+        states = list(self._states.values()) + ([trigger] if trigger is not None else [])
+        msg.rerun_script.widget_states.widgets.extend(states)
+
+        start = time.perf_counter()
+        self._websocket.send(msg.SerializeToString())
+        while True:
+            forward_msg = ForwardMsg()
+            forward_msg.ParseFromString(self._websocket.recv(timeout=self._timeout))
+            kind = forward_msg.WhichOneof("type")
+            if kind == "delta":
+                self._read_delta(forward_msg.delta)
+            elif kind == "script_finished":
+                return time.perf_counter() - start
+
+    def _read_delta(self, delta):
+        """Record the widgets, tabs and exceptions of a delta"""
+        if delta.WhichOneof("type") == "new_element":
+            element_type = delta.new_element.WhichOneof("type")
+            element = getattr(delta.new_element, element_type)
+            if element_type == "exception":
+                self.errors.append(element.message)
+            elif getattr(element, "id", "") and getattr(element, "label", ""):
+                self._widgets[element.label] = (element.id, delta.fragment_id)
+        elif delta.WhichOneof("type") == "add_block":
+            block_type = delta.add_block.WhichOneof("type")
+            if block_type == "tab_container" and delta.add_block.id:
+                # Widget ids end with the widget's key
+                key = delta.add_block.id.rsplit("-", 1)[-1]
+                self._widgets[key] = (delta.add_block.id, delta.fragment_id)
+                self.tab_labels = []
+            elif block_type == "tab" and delta.add_block.tab.label not in self.tab_labels:
+                self.tab_labels.append(delta.add_block.tab.label)
+
+    def open(self):
+        """
+        Load the page
+
+        Returns:
+            float: Seconds until the page finished rendering
+        """
+        return self._rerun()
+
+    def select(self, label, value):
+        """
+        Pick an option of a select box, or a tab by its label
+
+        Args:
+            label (str): Label or key of the widget
+            value (str): Option to pick
+
+        Returns:
+            float: Seconds until the page finished rerendering
+        """
+        widget_id, fragment_id = self._widgets[label]
+        self._states[widget_id] = WidgetState(id=widget_id, string_value=value)
+        return self._rerun(fragment_id=fragment_id)
+
+    def click(self, label):
+        """
+        Click a button
+
+        Args:
+            label (str): Label of the button
+
+        Returns:
+            float: Seconds until the page finished rerendering
+        """
+        widget_id, fragment_id = self._widgets[label]
+        return self._rerun(WidgetState(id=widget_id, trigger_value=True), fragment_id)
+
+    def close(self):
+        """Close the websocket, ending the session on the server"""
+        self._websocket.close()
+
+    def __enter__(self):
+        self._websocket.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._websocket.__exit__(*exc_info)
+
+def run_session(url, workload, session_id=0):
+    """
+    Drive one session through the main flow of the dashboard
+
+    The session opens the page, picks a workload, runs the benchmark and
+    then opens every results tab.
+
+    Args:
+        url (str): Base URL of the dashboard
+        workload (str): Workload to pick
+        session_id (int): Identifier recorded with every interaction
+
+    Returns:
+        list: One dict per interaction with its latency and errors
+    """
+    records = []
+
+    def record(session, interaction, action, *args):
+        n_errors = len(session.errors)
+        try:
+            latency = action(*args)
+        except Exception as exc:  # A timeout or a dropped connection
+            latency = np.nan
+            session.errors.append(str(exc))
+        records.append({
+            "Session": session_id,
+            "Interaction": interaction,
+            "Latency (s)": latency,
+            "Errors": len(session.errors) - n_errors
+        })
+
+    with DashboardSession(url) as session:
+        record(session, "Open", session.open)
+        record(session, "Select Workload", session.select, WORKLOAD_SELECT_LABEL, workload)
+        record(session, "Run Benchmark", session.click, RUN_BUTTON_LABEL)
+        for tab in session.tab_labels[1:] + session.tab_labels[:1]:
+            record(session, f"Open Tab {tab}", session.select, RESULTS_TABS_KEY, tab)
+
+    return records
+
+def _process_usage(pid):
+    """CPU seconds and resident memory in bytes of a process"""
+    if psutil is not None:
+        process = psutil.Process(pid)
+        cpu_times = process.cpu_times()
+        return cpu_times.user + cpu_times.system, process.memory_info().rss
+
+    with open(f"/proc/{pid}/stat") as f:
+        # Fields after the command name, which may contain spaces
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    with open(f"/proc/{pid}/statm") as f:
+        rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu_seconds, rss
+
+class ResourceSampler:
+    """
+    Sample the CPU and memory use of a process in a background thread
+
+    Uses psutil when installed, /proc otherwise.
+    """
+
+    def __init__(self, pid, interval=0.25):
+        self._pid = pid
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self.samples = []  # (time, CPU seconds, RSS bytes)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.samples.append((time.perf_counter(), *_process_usage(self._pid)))
+            self._stop.wait(self._interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.samples.append((time.perf_counter(), *_process_usage(self._pid)))
+
+    def summary(self):
+        """
+        Summarize the samples
+
+        Returns:
+            dict: Mean and peak CPU use (% of one core) and start, peak and
+                end resident memory (MB)
+        """
+        times, cpu, rss = np.array(self.samples).T
+        cpu_percent = np.diff(cpu) / np.diff(times) * 100
+        return {
+            "Mean CPU (%)": (cpu[-1] - cpu[0]) / (times[-1] - times[0]) * 100,
+            "Peak CPU (%)": cpu_percent.max() if len(cpu_percent) else 0.0,
+            "Start RSS (MB)": rss[0] / 2**20,
+            "Peak RSS (MB)": rss.max() / 2**20,
+            "End RSS (MB)": rss[-1] / 2**20
+        }
+
+def _free_port():
+    """An unused local TCP port"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_dashboard_server(app_path="app.py", port=None, timeout=60):
+    """
+    Start the dashboard in a headless Streamlit server
+
+    Args:
+        app_path (str): Path to the Streamlit app
+        port (int, optional): Port to listen on, defaults to a free port
+        timeout (float): Seconds to wait for the server to be healthy
+
+    Returns:
+        tuple: (server process, base URL)
+    """
+    port = port or _free_port()
+    url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app_path,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.address", "127.0.0.1", "--browser.gatherUsageStats", "false"],
+        cwd=os.path.dirname(os.path.abspath(app_path)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1):
+                return server, url
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+
+    server.kill()
+    raise RuntimeError(f"Dashboard server did not start on port {port}")
+
+def summarize_latencies(interactions_df, percentiles=LATENCY_PERCENTILES):
+    """
+    Summarize interaction latencies
+
+    Args:
+        interactions_df (pandas.DataFrame): Records of run_session
+        percentiles (tuple): Latency percentiles to report
+
+    Returns:
+        pandas.DataFrame: Count, errors, mean, percentiles and max latency
+            per interaction, in the order interactions happen
+    """
+    grouped = interactions_df.groupby("Interaction", sort=False)
+    summary = pd.DataFrame({
+        "Count": grouped.size(),
+        "Errors": grouped["Errors"].sum(),
+        "Mean (s)": grouped["Latency (s)"].mean()
+    })
+    for p in percentiles:
+        summary[f"P{p} (s)"] = grouped["Latency (s)"].quantile(p / 100)
+    summary["Max (s)"] = grouped["Latency (s)"].max()
+
+    return summary.reset_index()
+
+def run_load_test(n_sessions, concurrency=None, url=None, app_path="app.py", workloads=None):
+    """
+    Drive simulated sessions through the dashboard and measure the server
+
+    Sessions run on `concurrency` threads, each one going through the main
+    flow of run_session with workloads assigned in turn. Without a URL the
+    dashboard is started in a local server for the test, and its CPU and
+    memory use are sampled throughout.
+
+    Args:
+        n_sessions (int): Number of sessions
+        concurrency (int, optional): Sessions running at once, defaults to all
+        url (str, optional): Base URL of an already running dashboard
+        app_path (str): Path to the Streamlit app started when `url` is None
+        workloads (list, optional): Workloads sessions pick, defaults to all
+
+    Returns:
+        tuple: (per-interaction records, latency summary, run summary dict)
+    """
+    workloads = workloads or list(load_workload_registry())
+    concurrency = concurrency or n_sessions
+
+    server = None
+    if url is None:
+        server, url = start_dashboard_server(app_path)
+
+    try:
+        sampler = ResourceSampler(server.pid) if server is not None else nullcontext()
+        start = time.perf_counter()
+        with sampler, ThreadPoolExecutor(concurrency) as executor:
+            futures = [
+                executor.submit(run_session, url, workloads[i % len(workloads)], i)
+                for i in range(n_sessions)
+            ]
+            records = [record for future in futures for record in future.result()]
+        duration = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    interactions = pd.DataFrame(records)
+    run_summary = {
+        "Sessions": n_sessions,
+        "Concurrency": concurrency,
+        "Duration (s)": duration,
+        "Interactions per Second": len(interactions) / duration,
+        "Errors": int(interactions["Errors"].sum())
+    }
+    if server is not None:
+        run_summary.update(sampler.summary())
+
+    return interactions, summarize_latencies(interactions), run_summary
+
+def save_load_test_report(latency_summary, run_summary, output_path):
+    """
+    Save a load test report as Markdown, or JSON for a .json path
+
+    Args:
+        latency_summary (pandas.DataFrame): Latency summary of run_load_test
+        run_summary (dict): Run summary of run_load_test
+        output_path (str): Path of the report
+
+    Returns:
+        str: Path of the report
+    """
+    if output_path.endswith(".json"):
+        content = json.dumps({
+            "run": run_summary,
+            "latency": latency_summary.to_dict(orient="records")
+        }, indent=2, default=float)
+    else:
+        run_table = pd.DataFrame({
+            "Measure": list(run_summary),
+            "Value": [f"{value:.2f}" if isinstance(value, float) else value
+                      for value in run_summary.values()]
+        })
+        content = "\n".join([
+            "# Dashboard Load Test",
+            "",
+            "## Run",
+            "",
+            markdown_table(run_table),
+            "",
+            "## Interaction Latency",
+            "",
+            markdown_table(latency_summary.round(3)),
+            ""
+        ])
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return output_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the benchmark dashboard")
+    parser.add_argument("--sessions", type=int, default=20, help="number of simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="sessions running at once (default: all)")
+    parser.add_argument("--url", default=None,
+                        help="base URL of a running dashboard (default: start one)")
+    parser.add_argument("--app", default="app.py", help="Streamlit app started without --url")
+    parser.add_argument("--output", default="load_test_report.md",
+                        help="report path, .md or .json")
+    args = parser.parse_args(argv)
+
+    _, latency_summary, run_summary = run_load_test(
+        args.sessions, args.concurrency, args.url, args.app
+    )
+    print(save_load_test_report(latency_summary, run_summary, args.output))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import json
+import os
+from functools import lru_cache
+from importlib.metadata import entry_points
+
+# Entry point group through which installed packages register providers.
+# Each entry point loads a provider specification, a list of them, or a
+# function returning either.
+ENTRY_POINT_GROUP = "flexai_benchmark.providers"
+
+# Billable hours in a month, for monthly rates
+HOURS_PER_MONTH = 720
+
+# Spot market of providers that do not define one: no discount, never
+# interrupted
+NO_SPOT_MARKET = {"Discount": 0.0, "Interruptions_Per_Hour": 0.0}
+
+# Directory of the provider plug-in files shipped with the suite, resolved
+# from the package so it does not depend on the working directory.
+# A provider specification has:
+#   Pricing: on-demand "Hourly_Rates" per GPU and an optional "Spot" market
+#     (discount on the on-demand rate, interruptions per hour of runtime)
+#   Hardware: GPUs, instance types, node layout, GPU power, region and PUE,
+#     as returned by load_hardware_configs
+#   Performance: run-to-run spread of execution time and cost, as (min, max)
+#     multipliers on a workload's base values, and the inference speed of
+#     each GPU relative to an NVIDIA A100
+#   Order (optional): position among the providers, by name when missing
+#   Color (optional): chart color, assigned from a palette when missing
+#   Baseline (optional): the provider others are compared against, the
+#     first one in order when no provider sets it
+PROVIDERS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "providers")
+
+# Fields every provider specification must have, by section
+REQUIRED_FIELDS = {
+    "Pricing": ["Hourly_Rates"],
+    "Hardware": ["GPUs"],
+    "Performance": ["Time_Factor", "Cost_Factor"]
+}
+
+def validate_provider(spec):
+    """
+    Check that a provider specification has every required field
+
+    Args:
+        spec (dict): Provider specification
+
+    Raises:
+        ValueError: If a field is missing or a GPU has no hourly rate
+    """
+    name = spec.get("Name")
+    if not name:
+        raise ValueError(f"Provider specification without a Name: {spec!r}")
+
+    missing = [
+        f"{section}.{field}"
+        for section, fields in REQUIRED_FIELDS.items()
+        for field in fields
+        if field not in spec.get(section, {})
+    ]
+    if missing:
+        raise ValueError(f"Provider {name!r} is missing {', '.join(missing)}")
+
+    unpriced = [gpu for gpu in spec["Hardware"]["GPUs"] if gpu not in spec["Pricing"]["Hourly_Rates"]]
+    if unpriced:
+        raise ValueError(f"Provider {name!r} has no hourly rate for {', '.join(unpriced)}")
+
+def _entry_point_providers():
+    """Provider specifications registered by installed packages"""
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        specs = entry_point.load()
+        if callable(specs):
+            specs = specs()
+        yield from ([specs] if isinstance(specs, dict) else specs)
+
+@lru_cache(maxsize=None)
+def load_provider_registry(config_dir=PROVIDERS_DIR):
+    """
+    Load every provider plug-in
+
+    Providers come from the entry points of the ENTRY_POINT_GROUP group
+    and from the JSON files of the config directory, one specification per
+    file; a file overrides an entry point of the same name. The registry is
+    cached per directory and shared by every caller, so it must not be
+    modified.
+
+    Args:
+        config_dir (str): Directory of provider JSON files; it may be missing
+            when entry points register the providers
+
+    Returns:
+        dict: Provider specification by provider name, in provider order
+
+    Raises:
+        ValueError: If a specification is invalid or no provider is registered
+    """
+    providers = {spec["Name"]: spec for spec in _entry_point_providers()}
+
+    try:
+        file_names = sorted(os.listdir(config_dir))
+    except FileNotFoundError:
+        file_names = []
+    for file_name in file_names:
+        if file_name.endswith(".json"):
+            with open(os.path.join(config_dir, file_name), 'r') as f:
+                spec = json.load(f)
+            providers[spec.get("Name")] = spec
+
+    if not providers:
+        raise ValueError(
+            f"No provider registered: add provider files to {config_dir!r} "
+            f"or install a package with {ENTRY_POINT_GROUP!r} entry points"
+        )
+    for spec in providers.values():
+        validate_provider(spec)
+
+    order = sorted(providers, key=lambda name: (providers[name].get("Order", float("inf")), name))
+    return {name: providers[name] for name in order}
+
+def get_baseline_provider(registry=None):
+    """
+    Provider the others are compared against
+
+    Args:
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        str: The provider whose plug-in sets "Baseline", else the first one
+    """
+    registry = registry or load_provider_registry()
+    return next((name for name, spec in registry.items() if spec.get("Baseline")), next(iter(registry)))
+
+def provider_factor_ranges(registry=None):
+    """
+    Run-to-run spread of every provider
+
+    Args:
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        dict: {"time": (min, max), "cost": (min, max)} multipliers on a
+            workload's base values, by provider
+    """
+    registry = registry or load_provider_registry()
+    return {
+        name: {
+            "time": tuple(spec["Performance"]["Time_Factor"]),
+            "cost": tuple(spec["Performance"]["Cost_Factor"])
+        }
+        for name, spec in registry.items()
+    }
+
+def provider_hourly_rates(registry=None):
+    """
+    On-demand hourly rates of every provider
+
+    Args:
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        dict: Hourly rate by GPU, by provider
+    """
+    registry = registry or load_provider_registry()
+    return {name: dict(spec["Pricing"]["Hourly_Rates"]) for name, spec in registry.items()}
+
+def provider_hardware(registry=None):
+    """
+    Hardware of every provider
+
+    Args:
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        dict: Hardware configuration by provider
+    """
+    registry = registry or load_provider_registry()
+    return {name: spec["Hardware"] for name, spec in registry.items()}
+
+def provider_spot_markets(registry=None):
+    """
+    Spot market of every provider
+
+    Args:
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        dict: Discount and interruptions per hour by provider
+    """
+    registry = registry or load_provider_registry()
+    return {name: spec["Pricing"].get("Spot", NO_SPOT_MARKET) for name, spec in registry.items()}
+
+def gpu_relative_speed(provider, gpu, registry=None):
+    """
+    Inference speed of a provider's GPU relative to an NVIDIA A100
+
+    Args:
+        provider (str): Cloud provider name
+        gpu (str): GPU name
+        registry (dict, optional): Output of load_provider_registry
+
+    Returns:
+        float: Relative speed, 1.0 when the provider does not define it
+    """
+    registry = registry or load_provider_registry()
+    return registry[provider]["Performance"].get("GPU_Speed", {}).get(gpu, 1.0)
@@ -0,0 +1,193 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from html import escape
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from .chart_export import EXPORT_METRICS, chart_file_name, render_bar_chart_svg
+from .derived_metrics import ensure_derived_metrics
+from .providers import get_baseline_provider
+from .utils import calculate_savings, format_currency, get_winner, markdown_table
+from .visualizations import create_platform_comparison_charts, create_radar_charts
+
+# Metrics used to pick the champion of each workload
+CHAMPION_METRICS = ["Execution Time (min)", "Cost ($)", "Throughput",
+                    "GPU Utilization (%)", "Memory Usage (%)"]
+
+def build_report_tables(df, workload, baseline_provider=None):
+    """
+    Build the tables of a workload section
+
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        workload (str): The workload to report on
+        baseline_provider (str, optional): Provider savings are measured
+            against, the registry's baseline by default
+
+    Returns:
+        dict: Table title to formatted pandas.DataFrame
+    """
+    baseline_provider = baseline_provider or get_baseline_provider()
+    filtered_df = df[df["Workload"] == workload]
+
+    # Cost breakdown
+    cost_table = ensure_derived_metrics(filtered_df)[
+        ["Provider", "Cost ($)", "Execution Time (min)", "Cost per Minute ($)"]
+    ].sort_values(by="Cost per Minute ($)")
+    cost_table = cost_table.assign(**{
+        "Cost ($)": cost_table["Cost ($)"].map(format_currency),
+        "Cost per Minute ($)": cost_table["Cost per Minute ($)"].map(
+            lambda x: format_currency(x, precision=4)
+        )
+    }).rename(columns={"Cost per Minute ($)": "Cost per Minute"})
+
+    tables = {"Detailed Cost Breakdown": cost_table}
+
+    # Savings against every other provider
+    baseline = filtered_df[filtered_df["Provider"] == baseline_provider]
+    if len(baseline) > 0:
+        baseline_cost = baseline["Cost ($)"].values[0]
+        savings_rows = []
+        for provider, provider_cost in zip(filtered_df["Provider"], filtered_df["Cost ($)"]):
+            if provider == baseline_provider:
+                continue
+            savings, savings_pct = calculate_savings(baseline_cost, provider_cost)
+            savings_rows.append({
+                "Provider": provider,
+                f"{baseline_provider} Savings": format_currency(savings),
+                "Savings (%)": f"{savings_pct:.1f}%"
+            })
+        tables[f"Estimated Cost Savings with {baseline_provider}"] = pd.DataFrame(savings_rows)
+
+    # Champion table
+    _, rankings = get_winner(df, workload, CHAMPION_METRICS)
+    points_df = pd.DataFrame(
+        [{"Provider": provider, "Points": points} for provider, points in rankings.items()]
+    ).sort_values(by="Points", ascending=False, kind="stable")
+    points_df.insert(0, "Rank", range(1, len(points_df) + 1))
+    tables["Overall Champion"] = points_df
+
+    return tables
+
+def _build_workload_section(df, workload, report_format, metrics):
+    """
+    Build the text of a workload section and the chart assets it references
+
+    Runs in a worker process, so it only receives the workload's rows.
+
+    Returns:
+        tuple: (section text, list of (asset file name, asset contents))
+    """
+    bar_charts = create_platform_comparison_charts(df, metrics)
+    figures = [(metric, bar_charts[(workload, metric)]) for metric in metrics]
+    tables = build_report_tables(df, workload)
+    winner, points = tables["Overall Champion"].iloc[0][["Provider", "Points"]]
+
+    parts, assets = [], []
+
+    if report_format == "html":
+        parts.append(f"<section><h2>{escape(workload)}</h2>")
+        figures.append(("radar", create_radar_charts(df)[workload]))
+        for _, fig in figures:
+            parts.append(fig.to_html(full_html=False, include_plotlyjs=False))
+        for title, table in tables.items():
+            parts.append(f"<h3>{escape(title)}</h3>")
+            parts.append(table.to_html(index=False, classes="dataframe", escape=True))
+        parts.append(
+            f"<p class='champion'>&#128081; {escape(winner)} with "
+            f"{points} total points</p></section>"
+        )
+    else:
+        parts.append(f"## {workload}\n")
+        for metric, fig in figures:
+            file_name = chart_file_name(workload, metric, "svg")
+            assets.append((file_name, render_bar_chart_svg(fig)))
+            parts.append(f"![{metric} Comparison for {workload}](assets/{file_name})\n")
+        for title, table in tables.items():
+            parts.append(f"### {title}\n\n{markdown_table(table)}\n")
+        parts.append(f"**Champion:** {winner} with {points} total points\n")
+
+    return "\n".join(parts) + "\n", assets
+
+def generate_report(df, output_path, report_format="html", metrics=None, workers=None,
+                    title="FlexAI vs Cloud Providers: Benchmark Report"):
+    """
+    Generate a self-contained report bundle for one benchmark run
+
+    Every workload gets its charts, cost breakdown, savings against each
+    provider and champion table. Workload sections are built in parallel by
+    worker processes and written to the file as soon as they are ready, in
+    workload order. Only a few sections are in flight at a time, so memory
+    stays bounded however many workloads the run covers.
+
+    HTML reports embed plotly.js and are a single file. Markdown reports
+    write the bar charts as SVG files to an "assets" directory next to the
+    report.
+
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        output_path (str): Path of the report file
+        report_format (str): "html" or "markdown"
+        metrics (list, optional): Metrics to chart, defaults to EXPORT_METRICS
+        workers (int, optional): Number of worker processes, 1 builds inline
+        title (str): Report title
+
+    Returns:
+        str: Path of the written report
+    """
+    if report_format not in ("html", "markdown"):
+        raise ValueError(f"Unknown report format: {report_format}")
+
+    metrics = metrics or EXPORT_METRICS
+    workers = workers or os.cpu_count() or 1
+    workloads = list(df["Workload"].unique())
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    assets_dir = os.path.join(os.path.dirname(os.path.abspath(output_path)), "assets")
+    if report_format == "markdown":
+        os.makedirs(assets_dir, exist_ok=True)
+
+    with open(output_path, "w") as f:
+        if report_format == "html":
+            f.write(f"<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>{escape(title)}</title>\n")
+            f.write(f"<script type='text/javascript'>{get_plotlyjs()}</script>\n")
+            f.write("<style>body { background-color: #ffe6f2; font-family: 'Space Mono', monospace; }"
+                    " h1, h2, h3 { color: #0066cc; }</style>\n</head><body>\n")
+            f.write(f"<h1>{escape(title)}</h1>\n<p>Generated {generated_at} "
+                    f"for {len(workloads)} workloads</p>\n")
+        else:
+            f.write(f"# {title}\n\nGenerated {generated_at} for {len(workloads)} workloads\n\n")
+
+        def write_section(section):
+            text, assets = section
+            for file_name, contents in assets:
+                with open(os.path.join(assets_dir, file_name), "w") as asset_file:
+                    asset_file.write(contents)
+            f.write(text)
+
+        if workers == 1:
+            for workload in workloads:
+                workload_df = df[df["Workload"] == workload]
+                write_section(_build_workload_section(workload_df, workload, report_format, metrics))
+        else:
+            grouped = df.groupby("Workload", sort=False)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Keep a bounded window of sections in flight and write in order
+                pending = deque()
+                for workload in workloads:
+                    pending.append(executor.submit(
+                        _build_workload_section,
+                        grouped.get_group(workload), workload, report_format, metrics
+                    ))
+                    if len(pending) >= workers * 2:
+                        write_section(pending.popleft().result())
+                while pending:
+                    write_section(pending.popleft().result())
+
+        if report_format == "html":
+            f.write("</body></html>\n")
+
+    return output_path
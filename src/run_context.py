@@ -0,0 +1,69 @@
+import hashlib
+
+import numpy as np
+
+class RunContext:
+    """
+    Random state of one benchmark run
+
+    Every random draw of a run comes from a numpy Generator seeded from the
+    run's entropy, so the run id alone regenerates identical results on any
+    machine. Draws that may run in parallel use a stream of their own,
+    spawned from the run's seed under a stable key (e.g. the provider and
+    workload of a result), so results do not depend on the order in which
+    workers run or on how many there are.
+
+    Args:
+        seed (int, optional): Entropy of the run, fresh entropy by default
+    """
+
+    def __init__(self, seed=None):
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+    @classmethod
+    def from_run_id(cls, run_id):
+        """
+        Context of an earlier run
+
+        Args:
+            run_id (str): RunContext.run_id of the run
+
+        Returns:
+            RunContext: A context drawing the same values as the run's
+        """
+        return cls(int(run_id, 16))
+
+    @property
+    def run_id(self):
+        """Hexadecimal entropy of the run, enough to regenerate it"""
+        return format(self.seed_sequence.entropy, "x")
+
+    def stream(self, *key):
+        """
+        Independent random stream of one part of the run
+
+        The same key always gives the same stream, whichever worker asks
+        for it and whenever it does.
+
+        Args:
+            *key: Strings or non-negative ints naming the part of the run,
+                e.g. ("AWS", "LLM Fine-Tuning (Llama 3 8B)")
+
+        Returns:
+            numpy.random.Generator: A new generator for that part
+        """
+        spawn_key = tuple(_key_word(part) for part in key)
+        return np.random.default_rng(
+            np.random.SeedSequence(self.seed_sequence.entropy, spawn_key=spawn_key)
+        )
+
+    def __repr__(self):
+        return f"RunContext(run_id={self.run_id!r})"
+
+def _key_word(part):
+    """Stream key word of a key part: ints as is, strings by a stable hash"""
+    if isinstance(part, (int, np.integer)):
+        return int(part)
+    # Python's hash() is salted per process, so it cannot key streams
+    return int.from_bytes(hashlib.blake2b(str(part).encode(), digest_size=8).digest(), "little")
@@ -0,0 +1,146 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from .adaptive_trials import t_critical_value
+from .derived_metrics import DERIVED_METRICS, LOWER_IS_BETTER, ensure_derived_metrics
+from .report import CHAMPION_METRICS
+
+# Columns two runs are aligned on
+DIFF_KEYS = ["Provider", "Workload", "GPU"]
+
+# Status of a (Provider, Workload, GPU) in the diff, by merge indicator
+DIFF_STATUS = {"both": "Matched", "left_only": "Removed", "right_only": "Added"}
+
+def _run_statistics(df, metrics):
+    """
+    Mean, variance, count and rank of every metric per key, in long format
+
+    Ranks are taken among the keys of the same workload, 1 being the best.
+    """
+    if "GPU" not in df.columns:
+        df = df.assign(GPU="NVIDIA A100")
+    grouped = df.groupby(DIFF_KEYS, sort=False, dropna=False)[metrics]
+    means = grouped.mean()
+
+    # Negate higher-is-better metrics so that rank 1 is always the best
+    signs = np.where([metric in LOWER_IS_BETTER for metric in metrics], 1, -1)
+    ranks = (means * signs).groupby(level="Workload", dropna=False).rank(method="min")
+
+    stats = pd.DataFrame({
+        "Mean": means.stack(),
+        "Variance": grouped.var().stack(),
+        "Runs": grouped.count().stack(),
+        "Rank": ranks.stack()
+    })
+    stats.index.names = DIFF_KEYS + ["Metric"]
+    return stats.reset_index()
+
+def diff_runs(before, after, metrics=None, confidence=0.95):
+    """
+    Compare every metric of two benchmark runs
+
+    Each run is reduced to per-(Provider, Workload, GPU) statistics, and
+    the two are aligned with one hash join, so diffing runs of millions of
+    rows costs two group-bys and a merge. A change is significant when a
+    Welch t-test rejects equal means at the given confidence; this needs at
+    least two results per key in both runs.
+
+    Args:
+        before (pandas.DataFrame): Results of the earlier run
+        after (pandas.DataFrame): Results of the later run
+        metrics (list, optional): Metrics compared, by default the champion
+            metrics and the derived metrics both runs have
+        confidence (float): Confidence level of the significance test
+
+    Returns:
+        pandas.DataFrame: One row per (Provider, Workload, GPU, Metric) with
+            the mean before and after, absolute and relative (%) delta,
+            significance, ranks within the workload, rank change (positive
+            when moving up) and status (Matched, Added or Removed)
+    """
+    before = ensure_derived_metrics(before)
+    after = ensure_derived_metrics(after)
+    if metrics is None:
+        metrics = [
+            metric for metric in CHAMPION_METRICS + list(DERIVED_METRICS)
+            if metric in before.columns and metric in after.columns
+        ]
+    missing = [
+        metric for metric in metrics
+        if metric not in before.columns or metric not in after.columns
+    ]
+    if missing:
+        raise ValueError(f"Metrics missing from a run: {', '.join(missing)}")
+
+    diff = pd.merge(
+        _run_statistics(before, metrics), _run_statistics(after, metrics),
+        on=DIFF_KEYS + ["Metric"], how="outer", suffixes=(" Before", " After"),
+        indicator="Status"
+    )
+
+    delta = diff["Mean After"] - diff["Mean Before"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Welch's t-test on the per-key means
+        var_before = diff["Variance Before"] / diff["Runs Before"]
+        var_after = diff["Variance After"] / diff["Runs After"]
+        se_squared = var_before + var_after
+        dof = se_squared ** 2 / (
+            var_before ** 2 / (diff["Runs Before"] - 1) + var_after ** 2 / (diff["Runs After"] - 1)
+        )
+        t = delta.abs() / np.sqrt(se_squared)
+        significant = (t > t_critical_value(confidence, dof)) & (delta != 0)
+
+    return pd.DataFrame({
+        **{key: diff[key] for key in DIFF_KEYS},
+        "Metric": diff["Metric"],
+        "Before": diff["Mean Before"],
+        "After": diff["Mean After"],
+        "Delta": delta,
+        "Delta (%)": 100 * delta / diff["Mean Before"].abs(),
+        "Significant": significant.fillna(False).astype(bool),
+        "Rank Before": diff["Rank Before"],
+        "Rank After": diff["Rank After"],
+        "Rank Change": diff["Rank Before"] - diff["Rank After"],
+        "Status": diff["Status"].astype(str).map(DIFF_STATUS)
+    })
+
+def changed_rows(diff):
+    """
+    Rows of a diff worth reviewing
+
+    Args:
+        diff (pandas.DataFrame): Output of diff_runs
+
+    Returns:
+        pandas.DataFrame: Significant changes, rank changes and keys only
+            one run has
+    """
+    return diff[
+        diff["Significant"] | (diff["Rank Change"].fillna(0) != 0) | (diff["Status"] != "Matched")
+    ]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff the results of two benchmark runs")
+    parser.add_argument("before", help="results CSV of the earlier run")
+    parser.add_argument("after", help="results CSV of the later run")
+    parser.add_argument("--metrics", nargs="+", help="metrics to compare (default: all)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="confidence level of the significance test")
+    parser.add_argument("--all", action="store_true",
+                        help="show unchanged rows too, not only changes")
+    parser.add_argument("--output", help="write the full diff to this CSV")
+    args = parser.parse_args(argv)
+
+    diff = diff_runs(
+        pd.read_csv(args.before), pd.read_csv(args.after), args.metrics, args.confidence
+    )
+    if args.output:
+        diff.to_csv(args.output, index=False)
+
+    shown = diff if args.all else changed_rows(diff)
+    print(shown.to_string(index=False, float_format=lambda value: f"{value:.4g}"))
+
+if __name__ == "__main__":
+    main()
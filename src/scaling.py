@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from .benchmark_simulator import HOURLY_RATES
+from .providers import provider_factor_ranges, provider_hardware
+from .workloads import calculate_throughput, get_workload_spec
+
+def _linear_scaling(scaling, n_gpus, n_nodes, internode_penalty):
+    """Perfectly parallel workload: time shrinks with the GPU count"""
+    return 1 / n_gpus
+
+def _amdahl_scaling(scaling, n_gpus, n_nodes, internode_penalty):
+    """
+    Amdahl's law plus a communication term
+
+    The serial fraction never speeds up. Gradient synchronization costs
+    `Communication_Overhead` of the single-GPU time at scale (ring
+    all-reduce: the (n - 1) / n bandwidth term), scaled up by the provider's
+    internode penalty once the job spans several nodes, plus a latency term
+    growing with log2 of the GPU count.
+    """
+    serial = scaling.get("Serial_Fraction", 0)
+    overhead = scaling.get("Communication_Overhead", 0)
+
+    bandwidth = overhead * (n_gpus - 1) / n_gpus * np.where(n_nodes > 1, internode_penalty, 1)
+    latency = overhead * 0.1 * np.log2(n_gpus)
+    return serial + (1 - serial) / n_gpus + bandwidth + latency
+
+# Relative execution time models, looked up by a workload's "Scaling" "Model".
+# Each returns T(n) / T(1) for arrays of GPU and node counts.
+SCALING_MODELS = {
+    "linear": _linear_scaling,
+    "amdahl": _amdahl_scaling
+}
+
+def instance_gpu_count(provider, instance_type, hardware_configs=None):
+    """
+    Get the number of GPUs of a provider's instance type
+
+    Args:
+        provider (str): Cloud provider name
+        instance_type (str): Instance type (e.g., "p3.16xlarge")
+        hardware_configs (dict, optional): Output of load_hardware_configs
+
+    Returns:
+        int: GPUs per instance
+    """
+    hardware_configs = hardware_configs or provider_hardware()
+    return hardware_configs[provider].get("Instance_GPUs", {}).get(instance_type, 1)
+
+def relative_execution_time(workload, provider, gpu_counts, hardware_configs=None):
+    """
+    Execution time on several GPUs relative to a single GPU
+
+    Args:
+        workload (str): The workload name
+        provider (str): Cloud provider name
+        gpu_counts (numpy.ndarray): GPU counts
+        hardware_configs (dict, optional): Output of load_hardware_configs
+
+    Returns:
+        tuple: (relative execution times, node counts), as numpy arrays
+    """
+    hardware_configs = hardware_configs or provider_hardware()
+    provider_config = hardware_configs[provider]
+
+    gpu_counts = np.asarray(gpu_counts, dtype=float)
+    n_nodes = np.ceil(gpu_counts / provider_config.get("GPUs_Per_Node", 8))
+
+    scaling = get_workload_spec(workload).get("Scaling", {"Model": "linear"})
+    model = SCALING_MODELS[scaling["Model"]]
+    relative_time = model(scaling, gpu_counts, n_nodes, provider_config.get("Internode_Penalty", 1))
+
+    return relative_time, n_nodes
+
+def simulate_scaling(workload, provider, gpu_type="NVIDIA A100", gpu_counts=None,
+                     hardware_configs=None):
+    """
+    Simulate a workload on a provider across GPU and node counts
+
+    The single-GPU execution time is the workload's base time scaled by the
+    provider's expected time factor. Everything is computed on whole arrays,
+    so the default sweep over 1 to 1024 GPUs is a handful of numpy operations.
+
+    Args:
+        workload (str): The workload name
+        provider (str): Cloud provider name
+        gpu_type (str): GPU the job runs on
+        gpu_counts (array-like, optional): GPU counts, defaults to 1..1024
+        hardware_configs (dict, optional): Output of load_hardware_configs
+
+    Returns:
+        pandas.DataFrame: Execution time, throughput, cost, speedup and
+            scaling efficiency for every GPU count
+    """
+    if gpu_counts is None:
+        gpu_counts = np.arange(1, 1025)
+    gpu_counts = np.asarray(gpu_counts)
+
+    spec = get_workload_spec(workload)
+    time_range = provider_factor_ranges()[provider]["time"]
+    single_gpu_time = spec["Base_Time"] * sum(time_range) / 2
+
+    relative_time, n_nodes = relative_execution_time(workload, provider, gpu_counts, hardware_configs)
+    execution_time = single_gpu_time * relative_time
+    throughput, _ = calculate_throughput(workload, execution_time)
+
+    hourly_rate = HOURLY_RATES[provider][gpu_type] * spec["Cost_Multiplier"]
+    cost = gpu_counts * hourly_rate * execution_time / 60
+
+    speedup = 1 / relative_time
+
+    return pd.DataFrame({
+        "Provider": provider,
+        "Workload": workload,
+        "GPU": gpu_type,
+        "GPUs": gpu_counts,
+        "Nodes": n_nodes.astype(int),
+        "Execution Time (min)": execution_time,
+        "Throughput": throughput,
+        "Cost ($)": cost,
+        "Speedup": speedup,
+        "Scaling Efficiency": speedup / gpu_counts
+    })
+
+def find_scaling_limit(scaling_df, min_efficiency=0.5):
+    """
+    Find the largest GPU count that still scales efficiently
+
+    Past this point each added GPU returns less than `min_efficiency` of a
+    GPU's worth of speedup on average, so adding GPUs stops paying off.
+
+    Args:
+        scaling_df (pandas.DataFrame): Output of simulate_scaling
+        min_efficiency (float): Lowest acceptable scaling efficiency
+
+    Returns:
+        pandas.Series: The row of the largest efficient GPU count
+    """
+    efficient = scaling_df[scaling_df["Scaling Efficiency"] >= min_efficiency]
+    if len(efficient) == 0:
+        return scaling_df.iloc[0]
+    return efficient.loc[efficient["GPUs"].idxmax()]
+
+def compare_provider_scaling(workload, providers=None, gpu_type="NVIDIA A100",
+                             min_efficiency=0.5, gpu_counts=None, gpu_by_provider=None):
+    """
+    Compare where adding GPUs stops paying off on each provider
+
+    Args:
+        workload (str): The workload name
+        providers (list, optional): Providers to compare, defaults to all
+            providers offering `gpu_type`
+        gpu_type (str): GPU the job runs on
+        min_efficiency (float): Lowest acceptable scaling efficiency
+        gpu_counts (array-like, optional): GPU counts, defaults to 1..1024
+        gpu_by_provider (dict, optional): GPU of each provider, overrides
+            `providers` and `gpu_type`
+
+    Returns:
+        pandas.DataFrame: The scaling limit of each provider
+    """
+    if gpu_by_provider is None:
+        if providers is None:
+            providers = [provider for provider, rates in HOURLY_RATES.items() if gpu_type in rates]
+        gpu_by_provider = {provider: gpu_type for provider in providers}
+
+    hardware_configs = provider_hardware()
+    limits = [
+        find_scaling_limit(
+            simulate_scaling(workload, provider, gpu, gpu_counts, hardware_configs),
+            min_efficiency
+        )
+        for provider, gpu in gpu_by_provider.items()
+    ]
+    return pd.DataFrame(limits).reset_index(drop=True)
@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+
+from .derived_metrics import LOWER_IS_BETTER
+from .report import CHAMPION_METRICS
+
+try:
+    from scipy.stats import qmc
+except ImportError:  # scipy is optional, Latin hypercube sampling is the fallback
+    qmc = None
+
+# Perturbations ranked at a time, bounding memory to a few tens of MB
+SENSITIVITY_BATCH_SIZE = 25000
+
+SAMPLING_METHODS = ["monte_carlo", "sobol"]
+
+def rank_points(values, lower_is_better):
+    """
+    Points of every provider on every metric, as awarded by get_winner
+
+    Args:
+        values (numpy.ndarray): Metric values shaped (..., providers, metrics)
+        lower_is_better (numpy.ndarray): One bool per metric
+
+    Returns:
+        numpy.ndarray: Points shaped like values, the number of providers
+            for the best provider down to 1 for the worst
+    """
+    keys = np.where(lower_is_better, values, -values)
+    ranks = np.argsort(np.argsort(keys, axis=-2, kind="stable"), axis=-2, kind="stable")
+    return values.shape[-2] - ranks
+
+def batch_winners(values, lower_is_better):
+    """
+    Vectorized get_winner over many sets of metric values
+
+    Args:
+        values (numpy.ndarray): Metric values shaped (samples, providers, metrics)
+        lower_is_better (numpy.ndarray): One bool per metric
+
+    Returns:
+        tuple: (index of the winning provider per sample, total points
+            shaped (samples, providers))
+    """
+    points = rank_points(values, lower_is_better)
+    totals = points.sum(axis=-1)
+    # Like get_winner, a tie goes to the provider ranked higher on the first metric
+    n_providers = values.shape[-2]
+    return np.argmax(totals * (n_providers + 1) + points[..., 0], axis=-1), totals
+
+def _workload_matrix(df, workload, metrics):
+    """Providers of a workload and their metric values, shaped (providers, metrics)"""
+    rows = df[df["Workload"] == workload]
+    if len(rows) == 0:
+        raise ValueError(f"No results for workload: {workload}")
+    return rows["Provider"].tolist(), rows[metrics].to_numpy(dtype=float)
+
+def _unit_samples(n_samples, n_inputs, method, rng):
+    """Points of the unit hypercube, shaped (samples, inputs)"""
+    if method == "monte_carlo":
+        return rng.random((n_samples, n_inputs))
+    if method != "sobol":
+        raise ValueError(f"Unknown sampling method: {method}")
+
+    if qmc is not None:
+        return qmc.Sobol(n_inputs, scramble=True, seed=rng).random(n_samples)
+
+    # Latin hypercube: every input's range is split into n_samples strata,
+    # each sampled exactly once
+    strata = rng.permuted(np.tile(np.arange(n_samples), (n_inputs, 1)), axis=1).T
+    return (strata + rng.random((n_samples, n_inputs))) / n_samples
+
+def analyze_sensitivity(df, workload, metrics=None, n_samples=100000, rel_range=0.05,
+                        method="monte_carlo", seed=None):
+    """
+    How stable the overall champion is when metrics and prices move
+
+    Every sample scales each provider's value of each metric (cost being
+    the price) by an independent factor within ±rel_range, and the
+    champion is recomputed with the points of get_winner, in batches of
+    vectorized rankings. Inputs that flip the champion are those whose
+    perturbation is most correlated with a different champion.
+
+    Args:
+        df (pandas.DataFrame): Benchmark results
+        workload (str): The workload to analyze
+        metrics (list, optional): Metrics ranked, CHAMPION_METRICS by default
+        n_samples (int): Number of perturbations
+        rel_range (float): Largest relative change of an input (0.05 = ±5%)
+        method (str): "monte_carlo", or "sobol" for quasi-random sampling
+            (Latin hypercube sampling without scipy)
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself (e.g. a RunContext stream)
+
+    Returns:
+        tuple: (DataFrame of each provider's share of wins, DataFrame of
+            the correlation of every (provider, metric) input's change with
+            the champion flipping, strongest first; positive when raising
+            the input flips it)
+    """
+    metrics = metrics or CHAMPION_METRICS
+    providers, base = _workload_matrix(df, workload, metrics)
+    lower_is_better = np.array([metric in LOWER_IS_BETTER for metric in metrics])
+    baseline = batch_winners(base[np.newaxis], lower_is_better)[0][0]
+
+    rng = np.random.default_rng(seed)
+    deltas = (2 * _unit_samples(n_samples, base.size, method, rng) - 1) * rel_range
+
+    wins = np.zeros(len(providers), dtype=np.int64)
+    flipped = np.empty(n_samples, dtype=bool)
+    for start in range(0, n_samples, SENSITIVITY_BATCH_SIZE):
+        batch = deltas[start:start + SENSITIVITY_BATCH_SIZE]
+        values = base * (1 + batch.reshape(len(batch), *base.shape))
+        winners, _ = batch_winners(values, lower_is_better)
+        wins += np.bincount(winners, minlength=len(providers))
+        flipped[start:start + len(batch)] = winners != baseline
+
+    win_shares = pd.DataFrame({
+        "Provider": providers,
+        "Wins": wins,
+        "Win Share (%)": 100 * wins / n_samples,
+        "Baseline Champion": [i == baseline for i in range(len(providers))]
+    }).sort_values("Wins", ascending=False, ignore_index=True)
+
+    # Point-biserial correlation of each input's change with a flip
+    flip_rate = flipped.mean()
+    if 0 < flip_rate < 1:
+        centered = deltas - deltas.mean(axis=0)
+        covariance = centered[flipped].sum(axis=0) / n_samples
+        correlation = covariance / (deltas.std(axis=0) * np.sqrt(flip_rate * (1 - flip_rate)))
+    else:
+        correlation = np.zeros(base.size)
+
+    effects = pd.DataFrame({
+        "Provider": np.repeat(providers, len(metrics)),
+        "Metric": np.tile(metrics, len(providers)),
+        "Flip Correlation": correlation
+    })
+    effects = effects.iloc[effects["Flip Correlation"].abs().argsort()[::-1]].reset_index(drop=True)
+
+    return win_shares, effects
+
+def flip_thresholds(df, workload, metrics=None, max_change=0.5, levels=201):
+    """
+    Smallest change of each single input that flips the overall champion
+
+    Each (provider, metric) input is swept over a grid of relative changes
+    while every other input keeps its value; all sweeps are ranked in one
+    vectorized batch.
+
+    Args:
+        df (pandas.DataFrame): Benchmark results
+        workload (str): The workload to analyze
+        metrics (list, optional): Metrics ranked, CHAMPION_METRICS by default
+        max_change (float): Largest relative change tried (0.5 = ±50%)
+        levels (int): Grid points from -max_change to +max_change
+
+    Returns:
+        pandas.DataFrame: Per input, the smallest change (%) that flips the
+            champion and the new champion, NaN if none does; inputs that
+            flip it soonest first
+    """
+    metrics = metrics or CHAMPION_METRICS
+    providers, base = _workload_matrix(df, workload, metrics)
+    lower_is_better = np.array([metric in LOWER_IS_BETTER for metric in metrics])
+    baseline = batch_winners(base[np.newaxis], lower_is_better)[0][0]
+
+    # Changes ordered by size, so the first flip of a sweep is the smallest
+    changes = np.linspace(-max_change, max_change, levels)
+    changes = changes[np.argsort(np.abs(changes), kind="stable")]
+
+    # values[i, j]: every input at its value except input i changed by changes[j]
+    n_inputs = base.size
+    factors = np.ones((n_inputs, levels, n_inputs))
+    factors[np.arange(n_inputs), :, np.arange(n_inputs)] += changes
+    values = base * factors.reshape(n_inputs, levels, *base.shape)
+
+    winners, _ = batch_winners(values.reshape(-1, *base.shape), lower_is_better)
+    winners = winners.reshape(n_inputs, levels)
+    flips = winners != baseline
+    first_flip = flips.argmax(axis=1)
+    any_flip = flips.any(axis=1)
+
+    thresholds = pd.DataFrame({
+        "Provider": np.repeat(providers, len(metrics)),
+        "Metric": np.tile(metrics, len(providers)),
+        "Flip At (%)": np.where(any_flip, 100 * changes[first_flip], np.nan),
+        "New Champion": [
+            providers[winners[i, first_flip[i]]] if any_flip[i] else None
+            for i in range(n_inputs)
+        ]
+    })
+    order = thresholds["Flip At (%)"].abs().sort_values(kind="stable", na_position="last").index
+    return thresholds.loc[order].reset_index(drop=True)
@@ -0,0 +1,190 @@
+import itertools
+import threading
+import weakref
+
+# Dataset versions, unique across registries and private session results
+_versions = itertools.count(1)
+
+class SharedResultsRegistry:
+    """
+    Process-wide registry of read-only benchmark datasets
+
+    Every viewer session holds a DatasetHandle instead of its own copy of the
+    results, so memory stays flat as the number of sessions grows. Datasets
+    are reference counted: an unpinned dataset is dropped when its last
+    handle is released. DataFrames published here are shared between
+    sessions and must never be modified in place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._datasets = {}  # key -> {"data", "refs", "pinned", "version"}
+
+    def publish(self, key, df, pinned=False):
+        """
+        Publish a dataset under a key, replacing any dataset with that key
+
+        Args:
+            key (str): Dataset key
+            df (pandas.DataFrame): The results, shared read-only from now on
+            pinned (bool): Keep the dataset even when no handle refers to it
+        """
+        with self._lock:
+            refs = self._datasets.get(key, {}).get("refs", 0)
+            self._datasets[key] = {
+                "data": df, "refs": refs, "pinned": pinned, "version": next(_versions)
+            }
+
+    def unpin(self, key):
+        """
+        Let a pinned dataset go once no handle refers to it
+
+        Args:
+            key (str): Dataset key
+        """
+        with self._lock:
+            entry = self._datasets.get(key)
+            if entry is None:
+                return
+            entry["pinned"] = False
+            if entry["refs"] <= 0:
+                del self._datasets[key]
+
+    def acquire(self, key):
+        """
+        Get a handle on a published dataset
+
+        Args:
+            key (str): Dataset key
+
+        Returns:
+            DatasetHandle: Handle sharing the dataset
+        """
+        with self._lock:
+            if key not in self._datasets:
+                raise KeyError(f"No dataset published under {key!r}")
+            self._datasets[key]["refs"] += 1
+        return DatasetHandle(self, key)
+
+    def release(self, key):
+        """
+        Release one reference to a dataset
+
+        Args:
+            key (str): Dataset key
+        """
+        with self._lock:
+            entry = self._datasets.get(key)
+            if entry is None:
+                return
+            entry["refs"] -= 1
+            if entry["refs"] <= 0 and not entry["pinned"]:
+                del self._datasets[key]
+
+    def get(self, key):
+        """
+        Get a published dataset without taking a reference
+
+        Args:
+            key (str): Dataset key
+
+        Returns:
+            pandas.DataFrame: The shared, read-only dataset
+        """
+        with self._lock:
+            return self._datasets[key]["data"]
+
+    def version(self, key):
+        """
+        Get the version of a published dataset
+
+        The version changes every time a dataset is published, so it can key
+        caches of anything derived from the dataset.
+
+        Args:
+            key (str): Dataset key
+
+        Returns:
+            int: Dataset version
+        """
+        with self._lock:
+            return self._datasets[key]["version"]
+
+    def stats(self):
+        """
+        Get the reference count of every dataset
+
+        Returns:
+            dict: Number of handles per dataset key
+        """
+        with self._lock:
+            return {key: entry["refs"] for key, entry in self._datasets.items()}
+
+class DatasetHandle:
+    """
+    A session's view of the benchmark results, copy-on-write
+
+    The handle reads the shared dataset until the session needs its own
+    results (replace) or wants to modify them (mutable). Either way the
+    session detaches: it releases its shared reference and keeps a private
+    DataFrame. The shared reference is also released when the handle is
+    garbage collected, e.g. when the session's state is dropped.
+    """
+
+    def __init__(self, registry, key):
+        self._registry = registry
+        self._key = key
+        self._private = None
+        self._private_version = None
+        self._finalizer = weakref.finalize(self, registry.release, key)
+
+    @property
+    def data(self):
+        """pandas.DataFrame: The session's results; read-only while shared"""
+        if self._private is not None:
+            return self._private
+        return self._registry.get(self._key)
+
+    @property
+    def version(self):
+        """int: Version of the session's results, changes whenever they do"""
+        if self._private is not None:
+            return self._private_version
+        return self._registry.version(self._key)
+
+    @property
+    def is_shared(self):
+        """bool: True while the handle reads the shared dataset"""
+        return self._private is None
+
+    def replace(self, df):
+        """
+        Give the session its own results, e.g. after running a benchmark
+
+        Args:
+            df (pandas.DataFrame): The session's results
+        """
+        self._private = df
+        self._private_version = next(_versions)
+        self._finalizer()  # Release the shared dataset (runs at most once)
+
+    def mutable(self):
+        """
+        Get results the session may modify, copying the shared dataset first
+
+        Every call bumps the version, since the caller may change the results
+        in place; caches keyed on the old version then miss.
+
+        Returns:
+            pandas.DataFrame: The session's private results
+        """
+        if self._private is None:
+            self.replace(self._registry.get(self._key).copy())
+        else:
+            self._private_version = next(_versions)
+        return self._private
+
+    def close(self):
+        """Release the shared dataset and any private results"""
+        self._private = None
+        self._finalizer()
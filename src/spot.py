@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+
+from .benchmark_simulator import HOURLY_RATES
+from .data_generator import PROVIDER_FACTOR_RANGES
+from .providers import provider_spot_markets
+from .utils import get_resource_price_table
+from .workloads import get_workload_spec
+
+# Spot/preemptible market of each provider: discount on the on-demand rate
+# and average number of interruptions per hour of runtime
+SPOT_MARKET = provider_spot_markets()
+
+def get_spot_price_table():
+    """
+    Get the pricing table with spot rates and interruption rates
+
+    Returns:
+        pandas.DataFrame: get_resource_price_table with spot columns added
+    """
+    price_table = get_resource_price_table()
+    discount = price_table["Provider"].map(lambda p: SPOT_MARKET[p]["Discount"])
+
+    price_table["Spot Hourly Rate"] = (price_table["Hourly Rate"] * (1 - discount)).round(2)
+    price_table["Spot Discount (%)"] = discount * 100
+    price_table["Interruptions per Hour"] = price_table["Provider"].map(
+        lambda p: SPOT_MARKET[p]["Interruptions_Per_Hour"]
+    )
+    return price_table
+
+def simulate_spot_runs(provider, workload, gpu_type="NVIDIA A100", n_runs=10000,
+                       checkpoint_interval_min=30, checkpoint_cost_min=1,
+                       restart_overhead_min=5, max_rounds=100, seed=None, hourly_rates=None):
+    """
+    Simulate many runs of a workload on spot and on-demand capacity
+
+    Interruptions follow a Poisson process over the runtime. Each one costs
+    the restart overhead plus the work done since the last checkpoint
+    (uniform over the checkpoint interval), and that extra runtime is itself
+    exposed to interruptions. All runs advance together, one round of
+    interruptions at a time, so thousands of runs take a few numpy calls per
+    round.
+
+    Args:
+        provider (str): Cloud provider name
+        workload (str): The workload name
+        gpu_type (str): GPU the job runs on
+        n_runs (int): Number of simulated runs
+        checkpoint_interval_min (float): Minutes of work between checkpoints
+        checkpoint_cost_min (float): Minutes spent writing each checkpoint
+        restart_overhead_min (float): Minutes to get capacity back and
+            restore the last checkpoint after an interruption
+        max_rounds (int): Maximum rounds of interruptions simulated
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself (e.g. a RunContext stream)
+        hourly_rates (dict, optional): On-demand rates by provider and GPU,
+            defaults to HOURLY_RATES
+
+    Returns:
+        pandas.DataFrame: Execution time, cost and interruptions of every
+            run, in both on-demand and spot mode
+    """
+    rng = np.random.default_rng(seed)
+    spec = get_workload_spec(workload)
+    market = SPOT_MARKET[provider]
+    hourly_rates = hourly_rates or HOURLY_RATES
+    hourly_rate = hourly_rates[provider][gpu_type] * spec["Cost_Multiplier"]
+
+    # Useful work of each run, drawn like generate_sample_data does
+    work = spec["Base_Time"] * rng.uniform(*PROVIDER_FACTOR_RANGES[provider]["time"], size=n_runs)
+
+    # Spot runs checkpoint regularly
+    runtime = work + np.floor(work / checkpoint_interval_min) * checkpoint_cost_min
+    interruptions = np.zeros(n_runs, dtype=int)
+
+    exposed = runtime.copy()
+    for _ in range(max_rounds):
+        new_interruptions = rng.poisson(market["Interruptions_Per_Hour"] * exposed / 60)
+        total = new_interruptions.sum()
+        if total == 0:
+            break
+
+        # Lost work of every interruption, summed per run
+        lost = rng.uniform(0, checkpoint_interval_min, size=total)
+        run_index = np.repeat(np.arange(n_runs), new_interruptions)
+        lost_per_run = np.bincount(run_index, weights=lost, minlength=n_runs)
+
+        exposed = new_interruptions * restart_overhead_min + lost_per_run
+        runtime += exposed
+        interruptions += new_interruptions
+
+    return pd.DataFrame({
+        "Provider": provider,
+        "Workload": workload,
+        "On-Demand Time (min)": work,
+        "On-Demand Cost ($)": work / 60 * hourly_rate,
+        "Spot Time (min)": runtime,
+        "Spot Cost ($)": runtime / 60 * hourly_rate * (1 - market["Discount"]),
+        "Interruptions": interruptions
+    })
+
+def summarize_spot_runs(runs_df, percentiles=(5, 50, 95)):
+    """
+    Summarize the cost and time distributions of simulated runs
+
+    Args:
+        runs_df (pandas.DataFrame): Output of simulate_spot_runs
+        percentiles (tuple): Percentiles to report
+
+    Returns:
+        pandas.DataFrame: One row per pricing mode with mean and percentiles
+    """
+    rows = []
+    for mode in ["On-Demand", "Spot"]:
+        row = {"Mode": mode}
+        for quantity, column in [("Time", f"{mode} Time (min)"), ("Cost", f"{mode} Cost ($)")]:
+            row[f"Mean {quantity}"] = runs_df[column].mean()
+            for p, value in zip(percentiles, np.percentile(runs_df[column], percentiles)):
+                row[f"P{p} {quantity}"] = value
+        row["Mean Interruptions"] = runs_df["Interruptions"].mean() if mode == "Spot" else 0.0
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+def compare_spot_pricing(workload, gpu_by_provider, n_runs=5000, seed=None, hourly_rates=None,
+                         **kwargs):
+    """
+    Compare expected spot and on-demand cost and time across providers
+
+    Args:
+        workload (str): The workload name
+        gpu_by_provider (dict): GPU used by each provider
+        n_runs (int): Number of simulated runs per provider
+        seed (int or numpy.random.Generator, optional): Seed for the random
+            generator, or the generator itself; each provider is simulated
+            with an independent stream spawned from it
+        hourly_rates (dict, optional): On-demand rates by provider and GPU,
+            defaults to HOURLY_RATES
+        **kwargs: Checkpoint and restart settings of simulate_spot_runs
+
+    Returns:
+        pandas.DataFrame: One row per provider
+    """
+    rows = []
+    streams = np.random.default_rng(seed).spawn(len(gpu_by_provider))
+    for (provider, gpu_type), stream in zip(gpu_by_provider.items(), streams):
+        runs = simulate_spot_runs(provider, workload, gpu_type, n_runs, seed=stream,
+                                  hourly_rates=hourly_rates, **kwargs)
+        rows.append({
+            "Provider": provider,
+            "On-Demand Cost ($)": runs["On-Demand Cost ($)"].mean(),
+            "Spot Cost ($)": runs["Spot Cost ($)"].mean(),
+            "P95 Spot Cost ($)": np.percentile(runs["Spot Cost ($)"], 95),
+            "On-Demand Time (min)": runs["On-Demand Time (min)"].mean(),
+            "Spot Time (min)": runs["Spot Time (min)"].mean(),
+            "P95 Spot Time (min)": np.percentile(runs["Spot Time (min)"], 95),
+            "Interruptions": runs["Interruptions"].mean()
+        })
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+from .benchmark_simulator import calculate_workload_costs
+from .derived_metrics import DERIVED_METRICS, add_derived_metrics
+from .energy import ENERGY_INPUTS, add_energy_inputs
+from .workloads import load_workload_registry
+
+# Log column names, keyed by the name used in the benchmark schema
+DEFAULT_COLUMN_MAP = {
+    "Start": "start",
+    "End": "end",
+    "GPU": "gpu_type",
+    "Provider": "provider",
+    "Workload": "workload",
+    "Tokens Processed": "tokens_processed",
+    "Images Processed": "images_processed",
+    "GPU Utilization (%)": "gpu_utilization",
+    "Memory Usage (%)": "memory_usage",
+    "Cost ($)": "cost"
+}
+
+# Throughput unit -> (counter it is computed from, seconds per time unit)
+THROUGHPUT_UNITS = {
+    "tokens/sec": ("Tokens Processed", 1),
+    "images/min": ("Images Processed", 60),
+    "images/hour": ("Images Processed", 3600)
+}
+
+# Metrics averaged per (Provider, Workload, GPU) by summarize_trace
+SUMMARY_METRICS = ["Execution Time (min)", "Cost ($)", "Throughput",
+                   "GPU Utilization (%)", "Memory Usage (%)"]
+
+def read_trace_chunks(file_path, chunksize=100000, column_map=None):
+    """
+    Read a CSV or JSONL job log in chunks
+
+    Args:
+        file_path (str): Path to a .csv or .jsonl file (optionally compressed)
+        chunksize (int): Rows per chunk
+        column_map (dict, optional): Benchmark column name to log column name
+
+    Yields:
+        pandas.DataFrame: Raw log rows, renamed to benchmark column names
+    """
+    column_map = column_map or DEFAULT_COLUMN_MAP
+    rename = {log_name: name for name, log_name in column_map.items()}
+
+    base_name = file_path.lower()
+    for suffix in (".gz", ".bz2", ".zip", ".xz", ".zst"):
+        base_name = base_name.removesuffix(suffix)
+
+    if base_name.endswith(".csv"):
+        reader = pd.read_csv(file_path, chunksize=chunksize)
+    elif base_name.endswith((".jsonl", ".ndjson", ".json")):
+        reader = pd.read_json(file_path, lines=True, chunksize=chunksize)
+    else:
+        raise ValueError(f"Unsupported trace format: {file_path}")
+
+    with reader:
+        for chunk in reader:
+            yield chunk.rename(columns=rename)
+
+def _to_timestamp(column):
+    """Convert epoch seconds or date strings to UTC timestamps"""
+    if pd.api.types.is_numeric_dtype(column):
+        return pd.to_datetime(column, unit="s", utc=True)
+    return pd.to_datetime(column, utc=True)
+
+def normalize_trace_chunk(chunk):
+    """
+    Normalize raw job log rows into the benchmark schema
+
+    Execution time comes from the start and end times, throughput from the
+    tokens or images processed in the workload's throughput unit, and cost
+    from the logged cost or, when missing, the provider pricing.
+
+    Args:
+        chunk (pandas.DataFrame): Output of read_trace_chunks
+
+    Returns:
+        pandas.DataFrame: Rows with the columns of generate_sample_data
+    """
+    registry = load_workload_registry()
+    duration_sec = (_to_timestamp(chunk["End"]) - _to_timestamp(chunk["Start"])).dt.total_seconds()
+
+    df = pd.DataFrame({
+        "Provider": chunk["Provider"],
+        "Workload": chunk["Workload"],
+        "GPU": chunk["GPU"],
+        "Execution Time (min)": duration_sec / 60
+    })
+
+    # Throughput in each workload's own unit
+    units = df["Workload"].map({name: spec["Throughput_Unit"] for name, spec in registry.items()})
+    throughput = pd.Series(np.nan, index=df.index)
+    for unit, (counter, seconds_per_unit) in THROUGHPUT_UNITS.items():
+        rows = units == unit
+        if rows.any() and counter in chunk.columns:
+            throughput[rows] = chunk.loc[rows, counter] / (duration_sec[rows] / seconds_per_unit)
+    df["Throughput"] = throughput
+    df["Throughput Unit"] = units
+
+    for column in ["GPU Utilization (%)", "Memory Usage (%)"]:
+        df[column] = chunk[column] if column in chunk.columns else np.nan
+
+    if "Cost ($)" in chunk.columns:
+        df["Cost ($)"] = chunk["Cost ($)"].fillna(calculate_workload_costs(df, jitter=False))
+    else:
+        df["Cost ($)"] = calculate_workload_costs(df, jitter=False)
+
+    return add_derived_metrics(add_energy_inputs(df))
+
+def summarize_trace(file_path, chunksize=100000, column_map=None):
+    """
+    Compute benchmark metrics from a job log in one streaming pass
+
+    Only per-group running sums and counts are kept between chunks, so
+    memory depends on the chunk size and the number of (Provider, Workload,
+    GPU) groups, not on the size of the log.
+
+    Args:
+        file_path (str): Path to a .csv or .jsonl job log
+        chunksize (int): Rows read at a time
+        column_map (dict, optional): Benchmark column name to log column name
+
+    Returns:
+        pandas.DataFrame: Mean metrics per (Provider, Workload, GPU) in the
+            benchmark schema, with the number of runs
+    """
+    keys = ["Provider", "Workload", "GPU"]
+    sums = None
+    counts = None
+
+    for chunk in read_trace_chunks(file_path, chunksize, column_map):
+        df = normalize_trace_chunk(chunk)
+        grouped = df.groupby(keys)[SUMMARY_METRICS]
+
+        chunk_sums, chunk_counts = grouped.sum(), grouped.count()
+        chunk_counts["Runs"] = grouped.size()
+        sums = chunk_sums if sums is None else sums.add(chunk_sums, fill_value=0)
+        counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+
+    if sums is None:
+        return pd.DataFrame(columns=keys + SUMMARY_METRICS)
+
+    summary = (sums / counts[SUMMARY_METRICS]).reset_index()
+    summary["Runs"] = counts["Runs"].astype(int).values
+    summary["Throughput Unit"] = summary["Workload"].map(
+        {name: spec["Throughput_Unit"] for name, spec in load_workload_registry().items()}
+    )
+    # Derived from the mean metrics, not averaged per run
+    summary = add_derived_metrics(add_energy_inputs(summary))
+
+    return summary[keys + [
+        "Execution Time (min)", "Cost ($)", "Throughput", "Throughput Unit",
+        "GPU Utilization (%)", "Memory Usage (%)", *ENERGY_INPUTS[1:], *DERIVED_METRICS, "Runs"
+    ]]
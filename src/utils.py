@@ -1,3 +1,5 @@
+from .derived_metrics import LOWER_IS_BETTER
+
 def format_currency(amount, precision=2, currency="$"):
     """
     Format a number as currency
@@ -12,6 +14,39 @@ def format_currency(amount, precision=2, currency="$"):
     """
     return f"{currency}{amount:.{precision}f}"
 
+def join_names(names):
+    """
+    Join names into an English list
+    
+    Args:
+        names (list): Names to join, e.g. providers
+    
+    Returns:
+        str: "A", "A and B" or "A, B, and C"
+    """
+    names = list(names)
+    if len(names) < 3:
+        return " and ".join(names)
+    return f"{', '.join(names[:-1])}, and {names[-1]}"
+
+def markdown_table(df):
+    """
+    Render a DataFrame as a Markdown table
+    
+    Args:
+        df (pandas.DataFrame): Table to render
+    
+    Returns:
+        str: Markdown table
+    """
+    lines = [
+        "| " + " | ".join(str(col) for col in df.columns) + " |",
+        "| " + " | ".join("---" for _ in df.columns) + " |"
+    ]
+    for row in df.itertuples(index=False):
+        lines.append("| " + " | ".join(str(value) for value in row) + " |")
+    return "\n".join(lines)
+
 def calculate_savings(base_cost, comparison_cost):
     """
     Calculate savings and percentage
@@ -50,7 +85,7 @@ def get_winner(data_df, workload, metrics):
     
     for metric in metrics:
         # Determine if lower is better
-        ascending = True if metric in ["Execution Time (min)", "Cost ($)"] else False
+        ascending = metric in LOWER_IS_BETTER
         
         # Get sorted providers
         sorted_providers = filtered_df.sort_values(by=metric, ascending=ascending)["Provider"].tolist()
@@ -76,21 +111,14 @@ def get_resource_price_table():
         pandas.DataFrame: DataFrame with pricing information
     """
     import pandas as pd
+    from .providers import HOURS_PER_MONTH, provider_hourly_rates
     
-    # Sample pricing data
+    # Pricing data of every registered provider
     pricing_data = [
-        {"Provider": "AWS", "GPU": "NVIDIA A100", "Hourly Rate": 3.60, "Monthly Rate": 2592.00},
-        {"Provider": "AWS", "GPU": "NVIDIA T4", "Hourly Rate": 0.95, "Monthly Rate": 684.00},
-        {"Provider": "AWS", "GPU": "NVIDIA V100", "Hourly Rate": 3.06, "Monthly Rate": 2203.20},
-        {"Provider": "GCP", "GPU": "NVIDIA A100", "Hourly Rate": 3.35, "Monthly Rate": 2412.00},
-        {"Provider": "GCP", "GPU": "NVIDIA T4", "Hourly Rate": 0.89, "Monthly Rate": 640.80},
-        {"Provider": "GCP", "GPU": "NVIDIA L4", "Hourly Rate": 1.35, "Monthly Rate": 972.00},
-        {"Provider": "Azure", "GPU": "NVIDIA A100", "Hourly Rate": 3.67, "Monthly Rate": 2642.40},
-        {"Provider": "Azure", "GPU": "NVIDIA T4", "Hourly Rate": 0.99, "Monthly Rate": 712.80},
-        {"Provider": "Azure", "GPU": "NVIDIA K80", "Hourly Rate": 0.71, "Monthly Rate": 511.20},
-        {"Provider": "FlexAI", "GPU": "NVIDIA A100", "Hourly Rate": 2.89, "Monthly Rate": 2080.80},
-        {"Provider": "FlexAI", "GPU": "NVIDIA H100", "Hourly Rate": 5.76, "Monthly Rate": 4147.20},
-        {"Provider": "FlexAI", "GPU": "NVIDIA T4", "Hourly Rate": 0.76, "Monthly Rate": 547.20}
+        {"Provider": provider, "GPU": gpu, "Hourly Rate": rate,
+         "Monthly Rate": round(rate * HOURS_PER_MONTH, 2)}
+        for provider, rates in provider_hourly_rates().items()
+        for gpu, rate in rates.items()
     ]
     
     return pd.DataFrame(pricing_data)
\ No newline at end of file
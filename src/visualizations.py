@@ -1,5 +1,128 @@
-import plotly.express as px
+import colorsys
+import hashlib
+from functools import lru_cache
+
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from .derived_metrics import LOWER_IS_BETTER, ensure_derived_metrics
+from .providers import load_provider_registry
+
+# Retro gaming theme with light pink background, shared by every figure.
+# Built once and registered as the "retro" plotly template, so a figure
+# only names it instead of carrying its own copy of the styling.
+RETRO_TEMPLATE = go.layout.Template(
+    layout=dict(
+        font=dict(family="Space Mono, monospace", color="#0a0a20"),
+        title=dict(font=dict(family="VT323, monospace", size=24, color="#0066cc")),
+        plot_bgcolor="#ffe6f2",
+        paper_bgcolor="#ffe6f2",
+        xaxis=dict(gridcolor="#ffb3d9", gridwidth=0.5, zeroline=False),
+        yaxis=dict(gridcolor="#ffb3d9", gridwidth=0.5, zeroline=False),
+        polar=dict(
+            bgcolor="#ffe6f2",
+            radialaxis=dict(gridcolor="#ffb3d9", gridwidth=0.5),
+            angularaxis=dict(gridcolor="#ffb3d9", gridwidth=0.5)
+        ),
+        legend=dict(font=dict(size=12)),
+        # Pixel-style border
+        shapes=[dict(
+            type="rect", xref="paper", yref="paper", x0=0, y0=0, x1=1, y1=1,
+            line=dict(color="#ff66b2", width=3)
+        )]
+    ),
+    data=dict(
+        # Text labels on top of bars
+        bar=[go.Bar(
+            texttemplate="%{y}",
+            textposition="outside",
+            textfont=dict(family="VT323, monospace", size=18, color="#0066cc")
+        )]
+    )
+)
+pio.templates["retro"] = RETRO_TEMPLATE
+
+# Chart colors of providers whose plug-in does not name one, in order of use
+PROVIDER_COLORS = ["#0066cc", "#ff66b2", "#33cc33", "#cc6600"]
+
+# Hue step between generated colors once the palette runs out; the golden
+# angle keeps any number of hues apart
+GOLDEN_ANGLE = 137.508
+
+@lru_cache(maxsize=None)
+def provider_color(provider):
+    """
+    Chart color of a provider
+    
+    Args:
+        provider (str): Cloud provider name
+        
+    Returns:
+        str: The "Color" of the provider's plug-in, else a palette color, or
+            a generated one past the palette, picked by the provider's
+            position in the registry (or a stable hash of the name for
+            providers outside it)
+    """
+    registry = load_provider_registry()
+    color = registry.get(provider, {}).get("Color")
+    if color:
+        return color
+    
+    if provider in registry:
+        index = list(registry).index(provider)
+    else:
+        index = int.from_bytes(hashlib.blake2b(provider.encode(), digest_size=4).digest(), "little")
+    if index < len(PROVIDER_COLORS):
+        return PROVIDER_COLORS[index]
+    red, green, blue = colorsys.hls_to_rgb((index * GOLDEN_ANGLE % 360) / 360, 0.45, 0.75)
+    return f"#{round(red * 255):02x}{round(green * 255):02x}{round(blue * 255):02x}"
+
+def provider_fill_color(provider, opacity=0.2):
+    """Translucent version of a provider's chart color, for filled areas"""
+    color = provider_color(provider).lstrip("#")
+    red, green, blue = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({red}, {green}, {blue}, {opacity})"
+
+# Radar chart axes and the metric each one is normalized from. Axes whose
+# metric is missing from the results (e.g. energy) are left out.
+RADAR_METRICS = ["Execution Time (min)", "Cost ($)", "Throughput",
+                 "GPU Utilization (%)", "Memory Usage (%)",
+                 "Throughput per Watt", "CO2e (kg)"]
+RADAR_AXES = ["Speed", "Cost", "Throughput", "GPU Utilization", "Memory Efficiency",
+              "Energy Efficiency", "Carbon"]
+
+# Layout shared by every figure of a kind, on top of the retro template
+BAR_CHART_LAYOUT = dict(template="retro", xaxis_title_text="Provider", showlegend=False)
+RADAR_CHART_LAYOUT = dict(
+    template="retro",
+    polar_radialaxis=dict(visible=True, range=[0, 1], showticklabels=False),
+    showlegend=True
+)
+
+def _comparison_chart(workload_df, workload, metric):
+    """Bar chart of one metric from the rows of a single workload"""
+    # For execution time and cost, lower is better: sort ascending.
+    # For throughput, higher is better: sort descending.
+    workload_df = workload_df.sort_values(by=metric, ascending=metric in LOWER_IS_BETTER)
+    
+    # Highlight the best provider, which comes first
+    colors = ["#0066cc"] + ["#ff66b2"] * (len(workload_df) - 1)
+    
+    # One bar trace per provider, styled by the retro template. Traces are
+    # plain dicts so the figure validates them once.
+    return go.Figure(
+        data=[
+            dict(type="bar", x=[provider], y=[value], name=provider, marker=dict(color=color))
+            for provider, value, color in zip(workload_df["Provider"], workload_df[metric], colors)
+        ],
+        layout=dict(
+            BAR_CHART_LAYOUT,
+            title_text=f"{metric} Comparison for {workload}",
+            yaxis_title_text=metric
+        )
+    )
 
 def create_platform_comparison_chart(df, workload, metric):
     """
@@ -13,96 +136,127 @@ def create_platform_comparison_chart(df, workload, metric):
     Returns:
         plotly.graph_objects.Figure: The plotly figure object
     """
-    filtered_df = df[df["Workload"] == workload]
+    return _comparison_chart(df[df["Workload"] == workload], workload, metric)
+
+def create_platform_comparison_charts(df, metrics):
+    """
+    Create the platform comparison bar charts of every workload and metric
     
-    # For execution time and cost, lower is better
-    if metric in ["Execution Time (min)", "Cost ($)"]:
-        best_provider = filtered_df.loc[filtered_df[metric].idxmin()]["Provider"]
-        # The chart will be sorted in ascending order
-        filtered_df = filtered_df.sort_values(by=metric)
-        color_scale = "Bluered_r"  # Reversed so blue (better) is for lower values
-    else:
-        # For throughput, higher is better
-        best_provider = filtered_df.loc[filtered_df[metric].idxmax()]["Provider"]
-        # The chart will be sorted in descending order
-        filtered_df = filtered_df.sort_values(by=metric, ascending=False)
-        color_scale = "Bluered"  # Blue (better) is for higher values
+    The results are split by workload once, instead of being filtered
+    again for every chart.
     
-    # Create a discrete color map that highlights the best provider
-    colors = ["#0066cc" if provider == best_provider else "#ff66b2" 
-              for provider in filtered_df["Provider"]]
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        metrics (list): The metrics to compare
+        
+    Returns:
+        dict: Figures keyed by (workload, metric), in workload order
+    """
+    return {
+        (workload, metric): _comparison_chart(workload_df, workload, metric)
+        for workload, workload_df in df.groupby("Workload", sort=False)
+        for metric in metrics
+    }
+
+def create_cost_per_hour_chart(df, workload):
+    """
+    Create a bar chart comparing the hourly cost of platforms
     
-    # Create the bar chart
-    fig = px.bar(
-        filtered_df,
-        x="Provider",
-        y=metric,
-        color="Provider",
-        color_discrete_sequence=colors,
-        title=f"{metric} Comparison for {workload}"
-    )
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        workload (str): The workload to filter by
+        
+    Returns:
+        plotly.graph_objects.Figure: The plotly figure object
+    """
+    filtered_df = ensure_derived_metrics(df[df["Workload"] == workload])
+    cost_per_hour = filtered_df["Cost per Hour ($)"]
+    order = cost_per_hour.sort_values().index
     
-    # Update layout for retro gaming style with light pink theme
-    fig.update_layout(
-        font_family="Space Mono, monospace",
-        font_color="#0a0a20",
-        title_font_family="VT323, monospace",
-        title_font_color="#0066cc",
-        title_font_size=24,
-        plot_bgcolor="#ffe6f2",
-        paper_bgcolor="#ffe6f2",
-        xaxis=dict(
-            title_font_family="Space Mono, monospace",
-            title_font_color="#0a0a20",
-            tickfont_family="Space Mono, monospace",
-            tickfont_color="#0a0a20",
-            gridcolor="#ffb3d9",
-            gridwidth=0.5,
-            zeroline=False
-        ),
-        yaxis=dict(
-            title_font_family="Space Mono, monospace",
-            title_font_color="#0a0a20",
-            tickfont_family="Space Mono, monospace",
-            tickfont_color="#0a0a20",
-            gridcolor="#ffb3d9",
-            gridwidth=0.5,
-            zeroline=False
-        ),
-        showlegend=False
+    return go.Figure(
+        data=[
+            dict(type="bar", x=[provider], y=[value], name=provider,
+                 marker=dict(color=provider_color(provider)), texttemplate="$%{y:.2f}")
+            for provider, value in zip(filtered_df.loc[order, "Provider"], cost_per_hour[order])
+        ],
+        layout=dict(
+            BAR_CHART_LAYOUT,
+            title_text="Hourly Cost Comparison",
+            yaxis_title_text="Cost per Hour ($)"
+        )
     )
+
+def create_latency_curve_chart(profile, percentile=99):
+    """
+    Create a line chart of latency against throughput for every provider
     
-    # Add pixel-style border
-    fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper",
-                yref="paper",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=1,
-                line=dict(
-                    color="#ff66b2",
-                    width=3,
-                )
-            )
-        ]
-    )
+    Args:
+        profile (pandas.DataFrame): Output of profile_inference, for one
+            batch size and concurrency
+        percentile (int): Latency percentile plotted, one of
+            LATENCY_PERCENTILES
+        
+    Returns:
+        plotly.graph_objects.Figure: The plotly figure object
+    """
+    latency = f"P{percentile} Latency (s)"
+    curves = profile.groupby(["Provider", "GPU"], sort=False)
     
-    # Add text labels on top of bars
-    fig.update_traces(
-        texttemplate='%{y}', 
-        textposition='outside',
-        textfont=dict(
-            family="VT323, monospace",
-            size=18,
-            color="#0066cc"
+    return go.Figure(
+        data=[
+            dict(type="scatter", mode="lines+markers", x=curve["Throughput (req/s)"],
+                 y=curve[latency], name=f"{provider} ({gpu})",
+                 line=dict(color=provider_color(provider), width=3))
+            for (provider, gpu), curve in curves
+        ],
+        layout=dict(
+            template="retro",
+            title_text=f"P{percentile} Latency vs Throughput",
+            xaxis_title_text="Throughput (requests/s)",
+            yaxis_title_text=f"P{percentile} Latency (s)",
+            yaxis_type="log"
         )
     )
+
+def _normalize_radar_metrics(df):
+    """
+    Scale every radar metric to 0-1 within each workload, 1 being best
     
-    return fig
+    Time, cost and carbon are inverted since lower is better. A metric that
+    is the same for every provider scores 1 if lower is better and 0
+    otherwise.
+    """
+    metrics = [metric for metric in RADAR_METRICS if metric in df.columns]
+    inverted = [metric for metric in metrics if metric in LOWER_IS_BETTER]
+    
+    grouped = df.groupby("Workload", sort=False)[metrics]
+    min_val = grouped.transform("min")
+    spread = grouped.transform("max") - min_val
+    
+    normalized = ((df[metrics] - min_val) / spread.where(spread > 0)).fillna(0)
+    normalized[inverted] = 1 - normalized[inverted]
+    return normalized
+
+def _radar_chart(providers, normalized, workload):
+    """Radar chart from the providers and normalized metrics of one workload"""
+    axes = [RADAR_AXES[RADAR_METRICS.index(metric)] for metric in normalized.columns]
+    traces = []
+    for provider, row in zip(providers, normalized.itertuples(index=False)):
+        traces.append(dict(
+            type="scatterpolar",
+            r=list(row) + [row[0]],  # Close the loop
+            theta=axes + axes[:1],
+            name=provider,
+            line=dict(color=provider_color(provider), width=3),
+            fill='toself',
+            fillcolor=provider_fill_color(provider)
+        ))
+    
+    # Create the radar chart, styled by the retro template
+    return go.Figure(
+        data=traces,
+        layout=dict(RADAR_CHART_LAYOUT, title_text=f"Performance Radar for {workload}")
+    )
 
 def create_radar_chart(df, workload):
     """
@@ -116,115 +270,81 @@ def create_radar_chart(df, workload):
         plotly.graph_objects.Figure: The plotly figure object
     """
     filtered_df = df[df["Workload"] == workload]
+    return _radar_chart(filtered_df["Provider"], _normalize_radar_metrics(filtered_df), workload)
+
+def create_radar_charts(df):
+    """
+    Create the radar chart of every workload
     
-    # Normalize the metrics for the radar chart
-    metrics = ["Execution Time (min)", "Cost ($)", "Throughput", 
-               "GPU Utilization (%)", "Memory Usage (%)"]
-    
-    # Create a copy to avoid modifying the original dataframe
-    radar_df = filtered_df.copy()
-    
-    # For each metric, normalize to a 0-1 scale
-    # For time and cost, lower is better, so we invert those
-    for metric in metrics:
-        if metric in ["Execution Time (min)", "Cost ($)"]:
-            min_val = radar_df[metric].min()
-            max_val = radar_df[metric].max()
-            radar_df[f"{metric} (normalized)"] = 1 - ((radar_df[metric] - min_val) / (max_val - min_val) if max_val > min_val else 0)
-        else:
-            min_val = radar_df[metric].min()
-            max_val = radar_df[metric].max()
-            radar_df[f"{metric} (normalized)"] = (radar_df[metric] - min_val) / (max_val - min_val) if max_val > min_val else 0
+    The metrics of all workloads are normalized together in one pass.
     
-    # Create the radar chart
-    fig = go.Figure()
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        
+    Returns:
+        dict: Figures keyed by workload, in workload order
+    """
+    normalized = _normalize_radar_metrics(df)
+    return {
+        workload: _radar_chart(df["Provider"].iloc[rows], normalized.iloc[rows], workload)
+        for workload, rows in df.groupby("Workload", sort=False).indices.items()
+    }
+
+def create_small_multiples_chart(df, metrics=None):
+    """
+    Create a grid of bar charts comparing platforms on every workload and metric
     
-    colors = ["#0066cc", "#ff66b2", "#33cc33", "#cc6600"]
+    Rows are workloads and columns are metrics. The results are aggregated
+    once, averaging repeated runs, and every cell reads from that
+    aggregate. Providers keep the same order in every cell and the best
+    one is highlighted.
     
-    for i, provider in enumerate(radar_df["Provider"]):
-        provider_data = radar_df[radar_df["Provider"] == provider]
+    Args:
+        df (pandas.DataFrame): DataFrame containing benchmark data
+        metrics (list, optional): Metrics to compare, defaults to the
+            RADAR_METRICS of the results
         
-        fig.add_trace(go.Scatterpolar(
-            r=[
-                provider_data[f"Execution Time (min) (normalized)"].values[0],
-                provider_data[f"Cost ($) (normalized)"].values[0],
-                provider_data[f"Throughput (normalized)"].values[0],
-                provider_data[f"GPU Utilization (%) (normalized)"].values[0],
-                provider_data[f"Memory Usage (%) (normalized)"].values[0],
-                provider_data[f"Execution Time (min) (normalized)"].values[0],  # Close the loop
-            ],
-            theta=[
-                "Speed",
-                "Cost",
-                "Throughput",
-                "GPU Utilization",
-                "Memory Efficiency",
-                "Speed"  # Close the loop
-            ],
-            name=provider,
-            line=dict(color=colors[i], width=3),
-            fill='toself',
-            fillcolor='rgba(0, 102, 204, 0.2)' if i == 0 else 
-                      'rgba(255, 102, 178, 0.2)' if i == 1 else
-                      'rgba(51, 204, 51, 0.2)' if i == 2 else
-                      'rgba(204, 102, 0, 0.2)'  # Proper rgba format
-        ))
+    Returns:
+        plotly.graph_objects.Figure: The plotly figure object
+    """
+    metrics = metrics or [metric for metric in RADAR_METRICS if metric in df.columns]
+    summary = df.groupby(["Workload", "Provider"], sort=False)[metrics].mean()
+    workloads = summary.index.unique(level="Workload")
     
-    # Update layout for light pink theme
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 1],
-                showticklabels=False,
-                gridcolor="#ffb3d9",
-                gridwidth=0.5
-            ),
-            angularaxis=dict(
-                gridcolor="#ffb3d9",
-                gridwidth=0.5
-            ),
-            bgcolor="#ffe6f2"
-        ),
-        font_family="Space Mono, monospace",
-        font_color="#0a0a20",
-        title=dict(
-            text=f"Performance Radar for {workload}",
-            font=dict(
-                family="VT323, monospace",
-                size=24,
-                color="#0066cc"
-            )
-        ),
-        paper_bgcolor="#ffe6f2",
-        plot_bgcolor="#ffe6f2",
-        showlegend=True,
-        legend=dict(
-            font=dict(
-                family="Space Mono, monospace",
-                size=12,
-                color="#0a0a20"
-            )
-        )
+    fig = make_subplots(
+        rows=len(workloads),
+        cols=len(metrics),
+        row_titles=[workload.split(" (")[0] for workload in workloads],
+        column_titles=metrics,
+        horizontal_spacing=0.04,
+        vertical_spacing=min(0.08, 0.5 / len(workloads))
     )
     
-    # Add pixel-style border
+    traces, rows, cols = [], [], []
+    for row, workload in enumerate(workloads, start=1):
+        workload_summary = summary.loc[workload]
+        providers = workload_summary.index.tolist()
+        
+        for col, metric in enumerate(metrics, start=1):
+            values = workload_summary[metric].to_numpy()
+            best = values.argmin() if metric in LOWER_IS_BETTER else values.argmax()
+            colors = np.where(np.arange(len(values)) == best, "#0066cc", "#ff66b2")
+            
+            traces.append(dict(
+                type="bar", x=providers, y=values, name=metric,
+                marker=dict(color=colors.tolist()),
+                texttemplate="%{y:.3s}", textfont=dict(size=12)
+            ))
+            rows.append(row)
+            cols.append(col)
+    
+    # Adding every cell at once validates the grid a single time
+    fig.add_traces(traces, rows=rows, cols=cols)
     fig.update_layout(
-        shapes=[
-            dict(
-                type="rect",
-                xref="paper",
-                yref="paper",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=1,
-                line=dict(
-                    color="#ff66b2",
-                    width=3,
-                )
-            )
-        ]
+        template="retro",
+        title_text="All Workloads at a Glance",
+        height=150 + 220 * len(workloads),
+        showlegend=False
     )
     
     return fig
@@ -243,17 +363,10 @@ def create_leaderboard(df, workload, metric):
     """
     filtered_df = df[df["Workload"] == workload]
     
-    # Determine sorting order based on metric
-    ascending = True if metric in ["Execution Time (min)", "Cost ($)"] else False
-    
     # Sort and rank
-    sorted_df = filtered_df.sort_values(by=metric, ascending=ascending)
-    sorted_df["Rank"] = range(1, len(sorted_df) + 1)
-    
-    # Select columns to display
-    display_df = sorted_df[["Rank", "Provider", metric]]
-    
-    # Format for display
-    display_df["Rank"] = display_df["Rank"].apply(lambda x: f"{x}")
+    sorted_df = filtered_df.sort_values(by=metric, ascending=metric in LOWER_IS_BETTER)
     
-    return display_df
\ No newline at end of file
+    # Select columns to display, ranks formatted for display
+    return sorted_df[["Provider", metric]].assign(
+        Rank=[str(rank) for rank in range(1, len(sorted_df) + 1)]
+    )[["Rank", "Provider", metric]]
\ No newline at end of file
@@ -0,0 +1,93 @@
+from .derived_metrics import add_derived_metrics, dependent_metrics
+
+# Columns that change with prices: the cost and every metric derived from it
+COST_COLUMNS = ["Cost ($)"] + dependent_metrics(["Cost ($)"])
+
+def changed_rates(price_table, list_prices=None):
+    """
+    Hourly rates of a price table that differ from the list prices
+
+    Args:
+        price_table (pandas.DataFrame): Edited rates in the format of
+            get_resource_price_table
+        list_prices (pandas.DataFrame, optional): Reference rates,
+            get_resource_price_table by default
+
+    Returns:
+        tuple: Sorted (provider, GPU, hourly rate) of every changed rate;
+            hashable, so it can key caches, and empty at list prices
+    """
+    if list_prices is None:
+        from .utils import get_resource_price_table
+        list_prices = get_resource_price_table()
+
+    list_rates = {
+        (provider, gpu): rate
+        for provider, gpu, rate in zip(
+            list_prices["Provider"], list_prices["GPU"], list_prices["Hourly Rate"]
+        )
+    }
+    return tuple(sorted(
+        (provider, gpu, float(rate))
+        for provider, gpu, rate in zip(
+            price_table["Provider"], price_table["GPU"], price_table["Hourly Rate"]
+        )
+        if list_rates.get((provider, gpu)) != rate
+    ))
+
+def hourly_rates_with(rate_changes, hourly_rates=None):
+    """
+    Hourly rates by provider and GPU, with some rates changed
+
+    Args:
+        rate_changes (tuple): Output of changed_rates
+        hourly_rates (dict, optional): Rates by provider and GPU,
+            HOURLY_RATES by default
+
+    Returns:
+        dict: New rates by provider and GPU, in the format of HOURLY_RATES
+    """
+    if hourly_rates is None:
+        from .benchmark_simulator import HOURLY_RATES
+        hourly_rates = HOURLY_RATES
+
+    rates = {provider: dict(gpu_rates) for provider, gpu_rates in hourly_rates.items()}
+    for provider, gpu, rate in rate_changes:
+        rates.setdefault(provider, {})[gpu] = rate
+    return rates
+
+def reprice_results(df, rate_changes, hourly_rates=None):
+    """
+    Benchmark results as if they had been billed at other hourly rates
+
+    Each run's cost scales with the rate of its provider and GPU. Only the
+    cost and the metrics derived from it (COST_COLUMNS) are recomputed;
+    every other column is shared with the original results.
+
+    Args:
+        df (pandas.DataFrame): Benchmark results, run on "NVIDIA A100"
+            unless they have a "GPU" column
+        rate_changes (tuple): Output of changed_rates
+        hourly_rates (dict, optional): Rates the results were billed at,
+            HOURLY_RATES by default
+
+    Returns:
+        pandas.DataFrame: The repriced results, or df itself if no rate
+            changed
+    """
+    if not rate_changes:
+        return df
+    if hourly_rates is None:
+        from .benchmark_simulator import HOURLY_RATES
+        hourly_rates = HOURLY_RATES
+
+    factors = {
+        (provider, gpu): rate / hourly_rates[provider][gpu]
+        for provider, gpu, rate in rate_changes
+        if hourly_rates.get(provider, {}).get(gpu)
+    }
+    gpus = df["GPU"] if "GPU" in df.columns else ["NVIDIA A100"] * len(df)
+    factor = [factors.get(key, 1.0) for key in zip(df["Provider"], gpus)]
+
+    repriced = df.assign(**{"Cost ($)": df["Cost ($)"] * factor})
+    return add_derived_metrics(repriced, COST_COLUMNS[1:])
@@ -0,0 +1,79 @@
+import json
+import os
+from functools import lru_cache
+
+# Throughput formulas, looked up by a workload's "Throughput_Model".
+# Each takes the workload's "Throughput_Constant" and the execution time in
+# minutes (a float or a numpy array); a "fixed" throughput is the constant
+# whatever the execution time.
+THROUGHPUT_MODELS = {
+    "inverse_time": lambda constant, execution_time: constant / execution_time,
+    "fixed": lambda constant, execution_time: constant
+}
+
+# Workloads file shipped with the suite, resolved from the package so it does
+# not depend on the working directory
+WORKLOADS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "workloads.json")
+
+REQUIRED_FIELDS = ["Base_Time", "Base_Cost", "Throughput_Model",
+                   "Throughput_Constant", "Throughput_Unit", "Cost_Multiplier"]
+
+@lru_cache(maxsize=None)
+def load_workload_registry(file_path=WORKLOADS_FILE):
+    """
+    Load the workload registry from a JSON file
+
+    The registry is cached per file path and shared by every caller, so it
+    must not be modified.
+
+    Args:
+        file_path (str): Path to the workloads JSON file
+
+    Returns:
+        dict: Workload specification by workload name
+
+    Raises:
+        FileNotFoundError: If the workloads file is missing
+        ValueError: If a workload specification is incomplete
+    """
+    with open(file_path, 'r') as f:
+        registry = json.load(f)
+
+    for name, spec in registry.items():
+        missing = [field for field in REQUIRED_FIELDS if field not in spec]
+        if missing:
+            raise ValueError(f"Workload {name!r} is missing {', '.join(missing)}")
+        if spec["Throughput_Model"] not in THROUGHPUT_MODELS:
+            raise ValueError(f"Workload {name!r} has unknown throughput model {spec['Throughput_Model']!r}")
+
+    return registry
+
+def get_workload_spec(workload):
+    """
+    Get the specification of a registered workload
+
+    Args:
+        workload (str): The workload name
+
+    Returns:
+        dict: The workload specification
+    """
+    registry = load_workload_registry()
+    if workload not in registry:
+        raise KeyError(f"Unknown workload: {workload}")
+    return registry[workload]
+
+def calculate_throughput(workload, execution_time):
+    """
+    Calculate a workload's throughput from its execution time
+
+    Args:
+        workload (str): The workload name
+        execution_time (float or numpy.ndarray): Execution time in minutes
+
+    Returns:
+        tuple: (throughput, throughput unit)
+    """
+    spec = get_workload_spec(workload)
+    model = THROUGHPUT_MODELS[spec["Throughput_Model"]]
+    return model(spec["Throughput_Constant"], execution_time), spec["Throughput_Unit"]
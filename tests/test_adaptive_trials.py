@@ -0,0 +1,43 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adaptive_trials import confidence_interval, run_adaptive_trials, t_critical_value
+from src.run_context import RunContext
+
+class TestAdaptiveTrials(unittest.TestCase):
+    
+    def test_t_critical_value(self):
+        """Test the t critical value against tabulated values"""
+        self.assertAlmostEqual(t_critical_value(0.95, 5), 2.571, delta=0.03)
+        self.assertAlmostEqual(t_critical_value(0.95, 30), 2.042, delta=0.01)
+    
+    def test_confidence_interval(self):
+        """Test the confidence interval of a sample"""
+        mean, half_width = confidence_interval([10, 10, 10])
+        self.assertEqual(mean, 10)
+        self.assertEqual(half_width, 0)
+    
+    def test_run_adaptive_trials(self):
+        """Test that adaptive stopping saves trials without changing the winner"""
+        max_trials = 30
+        trials, summary = run_adaptive_trials(max_trials=max_trials, context=RunContext(42))
+        
+        # Every pair stops with at least the minimum number of trials
+        self.assertEqual(len(summary), 12)
+        self.assertTrue(all(summary["Trials"] >= 3))
+        self.assertEqual(len(trials), summary["Trials"].sum())
+        
+        # Far fewer trials than running every pair max_trials times
+        self.assertLess(len(trials), 0.75 * len(summary) * max_trials)
+        
+        # FlexAI remains the fastest provider on every workload
+        for _, workload_summary in summary.groupby("Workload"):
+            fastest = workload_summary.sort_values(by="Mean Execution Time (min)").iloc[0]
+            self.assertEqual(fastest["Provider"], "FlexAI")
+
+if __name__ == "__main__":
+    unittest.main()
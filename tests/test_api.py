@@ -0,0 +1,178 @@
+import unittest
+import sys
+import os
+import asyncio
+import http.client
+import json
+from urllib.parse import quote
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api import MAX_CLIENT_DATASETS, APIError, BenchmarkAPI, start_api_server
+from src.data_generator import generate_sample_data
+from src.shared_results import SharedResultsRegistry
+
+WORKLOAD = quote("LLM Fine-Tuning (Llama 3 8B)")
+
+class TestAPI(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up an API over a known dataset"""
+        self.registry = SharedResultsRegistry()
+        self.data = generate_sample_data()
+        self.registry.publish("default", self.data, pinned=True)
+        self.api = BenchmarkAPI(self.registry)
+    
+    def serve(self, client):
+        """Run the API on a free port and call client(connection) in a thread"""
+        async def scenario():
+            server = await start_api_server(self.api, port=0)
+            port = server.sockets[0].getsockname()[1]
+            
+            def run_client():
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                try:
+                    return client(connection)
+                finally:
+                    connection.close()
+            
+            try:
+                return await asyncio.to_thread(run_client)
+            finally:
+                server.close()
+                await server.wait_closed()
+        
+        return asyncio.run(scenario())
+    
+    @staticmethod
+    def get(connection, path, headers=None):
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response, response.read()
+    
+    def test_endpoints_over_one_connection(self):
+        """Test every endpoint on a single keep-alive connection"""
+        def client(connection):
+            results, body = self.get(connection, "/results")
+            self.assertEqual(results.getheader("Transfer-Encoding"), "chunked")
+            self.assertEqual(len(json.loads(body)), len(self.data))
+            
+            _, body = self.get(connection, "/pricing?provider=FlexAI")
+            self.assertEqual({row["Provider"] for row in json.loads(body)}, {"FlexAI"})
+            
+            _, body = self.get(connection, f"/winner?workload={WORKLOAD}")
+            winner = json.loads(body)
+            self.assertEqual(winner["winner"], max(winner["rankings"], key=winner["rankings"].get))
+            
+            _, body = self.get(connection, f"/savings?workload={WORKLOAD}")
+            self.assertEqual(len(json.loads(body)["savings"]), 3)
+            
+            _, body = self.get(connection, "/savings?base_cost=75&comparison_cost=100")
+            self.assertEqual(json.loads(body), {"savings": 25.0, "savings_pct": 25.0})
+            
+            missing, body = self.get(connection, "/winner?workload=Unknown")
+            self.assertEqual(missing.status, 404)
+            self.assertIn("error", json.loads(body))
+            
+            # All of the above went over the same socket
+            return connection.sock
+        
+        self.assertIsNotNone(self.serve(client))
+    
+    def test_etag_follows_dataset_version(self):
+        """Test conditional requests until a new benchmark run is published"""
+        path = f"/winner?workload={WORKLOAD}"
+        
+        def client(connection):
+            first, _ = self.get(connection, path)
+            etag = first.getheader("ETag")
+            
+            cached, body = self.get(connection, path, {"If-None-Match": etag})
+            self.assertEqual(cached.status, 304)
+            self.assertEqual(body, b"")
+            
+            connection.request("POST", "/runs", body=b"{}")
+            run = connection.getresponse()
+            self.assertEqual(run.status, 201)
+            self.assertEqual(json.loads(run.read())["rows"], len(self.data))
+            
+            fresh, _ = self.get(connection, path, {"If-None-Match": etag})
+            self.assertEqual(fresh.status, 200)
+            self.assertNotEqual(fresh.getheader("ETag"), etag)
+            
+            # Tags are compared whole, in a list
+            new_etag = fresh.getheader("ETag")
+            listed, _ = self.get(connection, path, {"If-None-Match": f'"other", W/{new_etag}'})
+            self.assertEqual(listed.status, 304)
+            prefix, _ = self.get(connection, path, {"If-None-Match": new_etag[:-2] + '"'})
+            self.assertEqual(prefix.status, 200)
+        
+        self.serve(client)
+        self.assertIsNot(self.registry.get("default"), self.data)
+    
+    def test_malformed_requests(self):
+        """Test that bad requests and handler errors get a response"""
+        self.registry.publish("broken", self.data.drop(columns="Cost ($)"), pinned=True)
+        
+        def client(connection):
+            connection.request("POST", "/runs", body=b"[]")
+            not_object = connection.getresponse()
+            self.assertEqual(not_object.status, 400)
+            self.assertIn("object", json.loads(not_object.read())["error"])
+            
+            # The connection survives a bad request, a handler error closes it
+            broken, body = self.get(connection, f"/savings?dataset=broken&workload={WORKLOAD}")
+            self.assertEqual(broken.status, 500)
+            self.assertEqual(broken.getheader("Connection"), "close")
+            self.assertIn("error", json.loads(body))
+            
+            # An unreadable length gets a 400 on a new connection
+            connection.close()
+            connection.putrequest("POST", "/runs")
+            connection.putheader("Content-Length", "abc")
+            connection.endheaders()
+            bad_length = connection.getresponse()
+            self.assertEqual(bad_length.status, 400)
+            self.assertEqual(bad_length.getheader("Connection"), "close")
+        
+        self.serve(client)
+    
+    def test_truncated_body(self):
+        """Test that a client leaving mid-body just closes the connection"""
+        class Writer:
+            closed = False
+            
+            def close(self):
+                self.closed = True
+        
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"POST /runs HTTP/1.1\r\nContent-Length: 10\r\n\r\n{}")
+            reader.feed_eof()
+            writer = Writer()
+            await self.api.handle_connection(reader, writer)
+            return writer
+        
+        self.assertTrue(asyncio.run(scenario()).closed)
+    
+    def test_client_datasets_are_bounded(self):
+        """Test that only the most recent client runs stay pinned"""
+        keys = [f"run-{i}" for i in range(MAX_CLIENT_DATASETS + 2)]
+        for key in keys:
+            _, build = self.api.route("POST", "/runs", json.dumps({"dataset": key}).encode())
+            build()
+        self.assertEqual(set(self.registry.stats()), {"default", *keys[2:]})
+        
+        # Re-running the default dataset never evicts it
+        _, build = self.api.route("POST", "/runs", b'{"dataset": "default"}')
+        build()
+        self.assertIn("default", self.registry.stats())
+        
+        for body in (b'{"dataset": 1}', b'{"dataset": ""}', b'[]'):
+            with self.assertRaises(APIError) as raised:
+                self.api.route("POST", "/runs", body)
+            self.assertEqual(raised.exception.status, 400)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_generator import generate_sample_data
+from src.visualizations import create_platform_comparison_chart, create_radar_chart
+from src.chart_export import (
+    EXPORT_METRICS, chart_file_name, export_run_charts,
+    headless_renderer_available, render_bar_chart_svg
+)
+
+class TestChartExport(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data"""
+        self.data = generate_sample_data()
+        self.workload = self.data["Workload"].iloc[0]
+    
+    def test_chart_file_name(self):
+        """Test that chart file names are filesystem friendly"""
+        name = chart_file_name("LLM Fine-Tuning (Llama 3 8B)", "Cost ($)", "svg")
+        self.assertEqual(name, "llm-fine-tuning-llama-3-8b__cost.svg")
+    
+    def test_render_bar_chart_svg(self):
+        """Test the pure-Python SVG renderer on a comparison chart"""
+        fig = create_platform_comparison_chart(self.data, self.workload, "Cost ($)")
+        svg = render_bar_chart_svg(fig)
+        
+        self.assertTrue(svg.startswith("<svg"))
+        self.assertTrue(svg.endswith("</svg>"))
+        for provider in self.data["Provider"].unique():
+            self.assertIn(f">{provider}</text>", svg)
+        
+        # Radar charts need the headless renderer
+        with self.assertRaises(ValueError):
+            render_bar_chart_svg(create_radar_chart(self.data, self.workload))
+    
+    @unittest.skipIf(headless_renderer_available(), "Kaleido is installed")
+    def test_export_run_charts_fallback(self):
+        """Test that bar charts are exported as SVG without Kaleido"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            written, skipped = export_run_charts(self.data, output_dir)
+            
+            n_workloads = self.data["Workload"].nunique()
+            self.assertEqual(len(written), n_workloads * len(EXPORT_METRICS))
+            self.assertTrue(all(path.endswith(".svg") for path in written))
+            self.assertTrue(all(os.path.exists(path) for path in written))
+            
+            # PNG versions and the radar charts are skipped
+            self.assertEqual(len(skipped), n_workloads * (len(EXPORT_METRICS) + 2))
+
+if __name__ == "__main__":
+    unittest.main()
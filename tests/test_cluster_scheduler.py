@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cluster_scheduler import (
+    SCHEDULING_POLICIES, compare_cluster_schedulers, generate_job_trace, simulate_cluster
+)
+
+class TestClusterScheduler(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a job trace"""
+        self.trace = generate_job_trace(5000, seed=1)
+    
+    def test_generate_job_trace(self):
+        """Test the generated job trace"""
+        self.assertEqual(len(self.trace), 5000)
+        self.assertTrue(self.trace["Arrival (min)"].is_monotonic_increasing)
+        self.assertTrue(all(self.trace["GPUs"].isin([1, 2, 4, 8])))
+    
+    def test_blocked_job_waits(self):
+        """Test that a job waits for a full node to free up"""
+        trace = pd.DataFrame({
+            "Arrival (min)": [0.0, 1.0, 2.0],
+            "GPUs": [8, 8, 1],
+            "Duration (min)": [10.0, 10.0, 5.0]
+        })
+        
+        fifo = simulate_cluster(trace, n_nodes=1, policy="fifo")
+        self.assertEqual(list(fifo["waits"]), [0.0, 9.0, 18.0])
+        
+        # Bin packing cannot backfill a node the first job fills completely
+        binpack = simulate_cluster(trace, n_nodes=1, policy="binpack")
+        self.assertEqual(list(binpack["waits"]), [0.0, 9.0, 18.0])
+        
+        # Shortest job first starts the 1-GPU job before the second 8-GPU job
+        sjf = simulate_cluster(trace, n_nodes=1, policy="sjf")
+        self.assertEqual(list(sjf["waits"]), [0.0, 14.0, 8.0])
+    
+    def test_policies(self):
+        """Test that every policy runs every job"""
+        for policy in SCHEDULING_POLICIES:
+            result = simulate_cluster(self.trace, n_nodes=20, policy=policy)
+            self.assertEqual(len(result["waits"]), len(self.trace))
+            self.assertTrue(all(result["waits"] >= 0))
+            self.assertTrue(0 < result["utilization"] <= 1)
+        
+        with self.assertRaises(ValueError):
+            simulate_cluster(self.trace, n_nodes=20, policy="random")
+    
+    def test_compare_cluster_schedulers(self):
+        """Test the per-provider comparison"""
+        comparison = compare_cluster_schedulers(self.trace, n_nodes=20)
+        self.assertEqual(len(comparison), 4 * len(SCHEDULING_POLICIES))
+        
+        # Backfilling never waits longer on average than strict FIFO
+        for _, provider_rows in comparison.groupby("Provider"):
+            waits = provider_rows.set_index("Policy")["Mean Wait (min)"]
+            self.assertLessEqual(waits["binpack"], waits["fifo"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cost_forecast import project_monthly_spend
+
+class TestCostForecast(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a workload mix"""
+        self.workload_mix = [
+            {"Workload": "LLM Fine-Tuning (Llama 3 8B)", "Jobs per Day": 10},
+            {"Workload": "Batch Inference (Stable Diffusion XL)", "Jobs per Day": 40, "GPU": "NVIDIA T4"}
+        ]
+    
+    def test_project_monthly_spend(self):
+        """Test that the projection returns ordered percentile bands per provider"""
+        df = project_monthly_spend(self.workload_mix, n_simulations=10000, seed=42)
+        
+        self.assertEqual(set(df["Provider"]), {"FlexAI", "AWS", "GCP", "Azure"})
+        self.assertTrue(all(df["P5 Monthly Spend ($)"] <= df["P50 Monthly Spend ($)"]))
+        self.assertTrue(all(df["P50 Monthly Spend ($)"] <= df["P95 Monthly Spend ($)"]))
+        
+        # Savings are measured against FlexAI
+        flexai = df[df["Provider"] == "FlexAI"].iloc[0]
+        self.assertEqual(flexai["Mean Savings ($)"], 0)
+        self.assertTrue(all(df["P50 Savings ($)"] >= 0))
+    
+    def test_project_monthly_spend_is_seeded(self):
+        """Test that the same seed gives the same projection"""
+        df1 = project_monthly_spend(self.workload_mix, n_simulations=1000, seed=7)
+        df2 = project_monthly_spend(self.workload_mix, n_simulations=1000, seed=7)
+        self.assertTrue(df1.equals(df2))
+    
+    def test_project_monthly_spend_unavailable_gpu(self):
+        """Test that a GPU the provider does not offer is rejected"""
+        with self.assertRaises(ValueError):
+            project_monthly_spend(self.workload_mix, gpu_by_provider={"AWS": "NVIDIA H100"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.derived_metrics import (
+    add_derived_metrics, append_results, dependent_metrics,
+    derive_row, ensure_derived_metrics
+)
+
+class TestDerivedMetrics(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up results without derived metrics"""
+        self.results = pd.DataFrame({
+            "Provider": ["FlexAI", "AWS"],
+            "Execution Time (min)": [30.0, 120.0],
+            "Cost ($)": [15.0, 90.0],
+            "Throughput": [100.0, 50.0]
+        })
+    
+    def test_add_derived_metrics(self):
+        """Test that every derived metric is computed from its inputs"""
+        df = add_derived_metrics(self.results)
+        
+        self.assertEqual(df["Cost-Performance Ratio"].tolist(), [0.15, 1.8])
+        self.assertEqual(df["Cost per Minute ($)"].tolist(), [0.5, 0.75])
+        self.assertEqual(df["Cost per Hour ($)"].tolist(), [30.0, 45.0])
+        
+        # The input results are left as they were
+        self.assertNotIn("Cost per Hour ($)", self.results.columns)
+        
+        # Metrics with missing inputs are skipped
+        df = add_derived_metrics(self.results.drop(columns="Throughput"))
+        self.assertNotIn("Cost-Performance Ratio", df.columns)
+        self.assertIn("Cost per Hour ($)", df.columns)
+    
+    def test_dependent_metrics(self):
+        """Test that dependencies are followed through derived metrics"""
+        self.assertEqual(
+            dependent_metrics(["Cost ($)"]),
+            ["Cost-Performance Ratio", "Cost per Minute ($)", "Cost per Hour ($)"]
+        )
+        self.assertEqual(
+            dependent_metrics(["GPU Utilization (%)"]),
+            ["Power (W)", "Energy (kWh)", "CO2e (kg)", "Throughput per Watt"]
+        )
+        self.assertEqual(
+            dependent_metrics(["Execution Time (min)"]),
+            ["Cost per Minute ($)", "Cost per Hour ($)", "Energy (kWh)", "CO2e (kg)"]
+        )
+        self.assertEqual(
+            dependent_metrics(["Throughput"]), ["Cost-Performance Ratio", "Throughput per Watt"]
+        )
+        self.assertEqual(dependent_metrics(["Memory Usage (%)"]), [])
+    
+    def test_append_results(self):
+        """Test that only appended rows get their metrics computed"""
+        existing = add_derived_metrics(self.results)
+        # A value that would change if existing rows were recomputed
+        existing.loc[0, "Cost per Hour ($)"] = -1.0
+        
+        df = append_results(existing, self.results.iloc[[1]])
+        
+        self.assertEqual(df["Cost per Hour ($)"].tolist(), [-1.0, 45.0, 45.0])
+        self.assertIs(ensure_derived_metrics(df), df)
+    
+    def test_derive_row(self):
+        """Test derived metrics of a single result row"""
+        row = derive_row(self.results.iloc[0].to_dict())
+        
+        self.assertEqual(row["Cost per Hour ($)"], 30.0)
+        self.assertEqual(row["Cost-Performance Ratio"], 0.15)
+
+if __name__ == "__main__":
+    unittest.main()
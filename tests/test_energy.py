@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_generator import load_hardware_configs
+from src.derived_metrics import add_derived_metrics
+from src.energy import CARBON_INTENSITY_FILE, add_energy_inputs, load_carbon_intensity
+from src.visualizations import create_radar_chart
+
+class TestEnergy(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up results on known hardware"""
+        self.results = pd.DataFrame({
+            "Provider": ["FlexAI", "AWS", "GCP"],
+            "Workload": ["Test Workload"] * 3,
+            "Execution Time (min)": [60.0, 60.0, 30.0],
+            "Cost ($)": [10.0, 12.0, 8.0],
+            "Throughput": [100.0, 90.0, 120.0],
+            "GPU Utilization (%)": [100.0, 50.0, 0.0],
+            "Memory Usage (%)": [80.0, 80.0, 80.0]
+        })
+        self.hardware_configs = load_hardware_configs("nonexistent_file.json")
+        self.carbon_intensity = load_carbon_intensity("nonexistent_file.json")
+    
+    def test_load_carbon_intensity(self):
+        """Test that the shipped carbon intensity file loads whatever the working directory"""
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(CARBON_INTENSITY_FILE, os.path.join(repo_root, "data", "carbon_intensity.json"))
+        self.assertEqual(load_carbon_intensity()["swedencentral"]["Carbon_Intensity"], 25)
+    
+    def test_add_energy_inputs(self):
+        """Test that each row gets the power of its GPU and its region's carbon intensity"""
+        df = add_energy_inputs(
+            self.results, {"FlexAI": "NVIDIA H100", "AWS": "NVIDIA T4", "GCP": "NVIDIA TPU"},
+            self.hardware_configs, self.carbon_intensity
+        )
+        
+        self.assertEqual(df["TDP (W)"].iloc[:2].tolist(), [700, 70])
+        self.assertEqual(df["Region"].tolist(), ["fr-par", "us-east-1", "us-central1"])
+        self.assertEqual(df["Carbon Intensity (gCO2e/kWh)"].tolist(), [55, 379, 430])
+        
+        # Unknown hardware has no power figures
+        self.assertTrue(pd.isna(df["TDP (W)"].iloc[2]))
+        self.assertNotIn("GPU", self.results.columns)
+    
+    def test_energy_metrics(self):
+        """Test power, energy, CO2e and throughput per watt"""
+        df = add_derived_metrics(add_energy_inputs(
+            self.results, {"FlexAI": "NVIDIA A100", "AWS": "NVIDIA A100", "GCP": "NVIDIA A100"},
+            self.hardware_configs, self.carbon_intensity
+        ))
+        
+        # Linear between idle (50 W) and TDP (400 W)
+        self.assertEqual(df["Power (W)"].tolist(), [400.0, 225.0, 50.0])
+        # One hour at 400 W with a PUE of 1.2
+        self.assertAlmostEqual(df["Energy (kWh)"].iloc[0], 0.48)
+        self.assertAlmostEqual(df["CO2e (kg)"].iloc[0], 0.48 * 55 / 1000)
+        self.assertEqual(df["Throughput per Watt"].iloc[0], 0.25)
+        
+        # Energy axes are added to the radar chart
+        fig = create_radar_chart(df, "Test Workload")
+        self.assertIn("Energy Efficiency", fig.data[0].theta)
+        self.assertIn("Carbon", fig.data[0].theta)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import sys
+import os
+import tempfile
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.history import BenchmarkHistory
+from src.utils import get_resource_price_table
+
+WORKLOAD = "LLM Fine-Tuning (Llama 3 8B)"
+
+class TestHistory(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a history of daily runs with known costs"""
+        self.history = BenchmarkHistory(backend="sqlite")
+        # Costs 1..40 on days 1..40 for the A100, twice that for the H100
+        for day in range(1, 41):
+            results = pd.DataFrame({
+                "Provider": ["AWS", "FlexAI"],
+                "Workload": [WORKLOAD, WORKLOAD],
+                "Cost ($)": [float(day), 2.0 * day],
+                "Throughput": [100.0, None]
+            })
+            self.history.record_run(
+                results, started_at=f"2025-01-{day:02d}" if day <= 31 else f"2025-02-{day - 31:02d}",
+                gpu_by_provider={"AWS": "NVIDIA A100", "FlexAI": "NVIDIA H100"}
+            )
+    
+    def tearDown(self):
+        self.history.close()
+    
+    def test_median_cost(self):
+        """Test the median over a trailing window of runs"""
+        # Runs of days 11..40: 30 runs, median of 11..40
+        median = self.history.median_cost(days=29, now="2025-02-09").set_index("GPU")
+        
+        self.assertEqual(median.loc["NVIDIA A100", "Runs"], 30)
+        self.assertEqual(median.loc["NVIDIA A100", "Median Cost ($)"], 25.5)
+        self.assertEqual(median.loc["NVIDIA H100", "Median Cost ($)"], 51.0)
+        
+        # An odd number of runs takes the middle one
+        median = self.history.median_cost(days=2, now="2025-02-09").set_index("GPU")
+        self.assertEqual(median.loc["NVIDIA A100", "Median Cost ($)"], 39.0)
+    
+    def test_missing_values_stored_as_null(self):
+        """Test that missing columns and NaNs become NULL"""
+        counts = self.history.query(
+            "SELECT COUNT(*) AS n, COUNT(throughput) AS throughput, COUNT(memory_usage) AS memory "
+            "FROM results WHERE gpu = ?", ("NVIDIA H100",)
+        ).iloc[0]
+        
+        self.assertEqual(counts.tolist(), [40, 0, 0])
+    
+    def test_current_pricing(self):
+        """Test that newer rates replace older ones"""
+        self.history.record_pricing(effective_from="2025-01-01")
+        price_table = get_resource_price_table()
+        aws_a100 = (price_table["Provider"] == "AWS") & (price_table["GPU"] == "NVIDIA A100")
+        newer = price_table[aws_a100].assign(**{"Hourly Rate": 1.0})
+        self.history.record_pricing(newer, effective_from="2025-06-01")
+        
+        pricing = self.history.current_pricing()
+        
+        self.assertEqual(len(pricing), len(price_table))
+        latest = pricing[(pricing["Provider"] == "AWS") & (pricing["GPU"] == "NVIDIA A100")]
+        self.assertEqual(latest["Hourly Rate"].tolist(), [1.0])
+    
+    def test_batches_and_persistence(self):
+        """Test chunked batch inserts into a database file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "history.db")
+            chunks = [
+                pd.DataFrame({"Provider": ["GCP"] * 5, "Workload": [WORKLOAD] * 5,
+                              "GPU": ["NVIDIA L4"] * 5, "Cost ($)": [1.0] * 5})
+                for _ in range(3)
+            ]
+            
+            with BenchmarkHistory(path, backend="sqlite") as history:
+                run_id = history.record_run(iter(chunks), batch_size=2)
+            
+            with BenchmarkHistory(path, backend="sqlite") as history:
+                stored = history.query("SELECT COUNT(*) AS n FROM results WHERE run_id = ?", (run_id,))
+            
+            self.assertEqual(stored["n"].iloc[0], 15)
+
+if __name__ == "__main__":
+    unittest.main()
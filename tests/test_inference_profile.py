@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import math
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.inference_profile import (
+    LatencyHistogram, batch_service_time, profile_inference, simulate_inference,
+    timed_service_time
+)
+from src.run_context import RunContext
+
+class TestInferenceProfile(unittest.TestCase):
+    
+    def test_latency_histogram(self):
+        """Test that percentiles keep three significant figures at any magnitude"""
+        values = np.random.default_rng(0).lognormal(0, 2, 100000)
+        histogram = LatencyHistogram()
+        histogram.record(values[:50000])
+        
+        other = LatencyHistogram()
+        other.record(values[50000:])
+        histogram.merge(other)
+        
+        self.assertEqual(histogram.count, 100000)
+        for q in (50, 95, 99, 99.9):
+            exact = np.percentile(values, q, method="inverted_cdf")
+            self.assertAlmostEqual(histogram.percentile(q), exact, delta=2e-3 * exact)
+        self.assertEqual(histogram.percentile(100), values.max())
+        
+        # Memory grows with the magnitude of the values, not their number
+        self.assertLess(len(histogram.counts), 40000)
+        self.assertTrue(math.isnan(LatencyHistogram().percentile(50)))
+    
+    def test_simulate_inference(self):
+        """Test dynamic batching against a fixed service time"""
+        def service_time(batch_size, rng):
+            return 0.1 + 0.1 * batch_size
+        
+        # A light load is served one request at a time without waiting
+        histogram, stats = simulate_inference(0.5, service_time, 2000, max_batch_size=1, seed=1)
+        self.assertAlmostEqual(histogram.percentile(50), 0.2, delta=1e-3)
+        self.assertEqual(stats["Mean Batch Size"], 1)
+        self.assertAlmostEqual(stats["Throughput (req/s)"], 0.5, delta=0.05)
+        
+        # Above the capacity of single requests (5 req/s), batching keeps up
+        histogram, stats = simulate_inference(6, service_time, 5000, max_batch_size=8, seed=1)
+        self.assertGreater(stats["Mean Batch Size"], 1.5)
+        self.assertAlmostEqual(stats["Throughput (req/s)"], 6, delta=0.3)
+        self.assertLess(histogram.percentile(99), 5)
+        
+        # Replicas share the load
+        _, stats = simulate_inference(6, service_time, 5000, max_batch_size=8, concurrency=2, seed=1)
+        self.assertLess(stats["Utilization (%)"], 75)
+        
+        # Service times can be measured by running a model
+        timed = timed_service_time(lambda batch_size: sum(range(batch_size)))
+        histogram, _ = simulate_inference(100, timed, 100, seed=1)
+        self.assertEqual(histogram.count, 100)
+    
+    def test_profile_inference(self):
+        """Test throughput/latency curves per provider and GPU"""
+        gpu_by_provider = {"FlexAI": "NVIDIA H100", "AWS": "NVIDIA T4"}
+        profile = profile_inference(
+            gpu_by_provider=gpu_by_provider, batch_sizes=(1, 8), n_requests=1000,
+            context=RunContext(3)
+        )
+        
+        self.assertEqual(len(profile), 2 * 2 * 6)
+        self.assertTrue((profile["P50 Latency (s)"] <= profile["P95 Latency (s)"]).all())
+        self.assertTrue((profile["P95 Latency (s)"] <= profile["P99 Latency (s)"]).all())
+        
+        # An H100 serves far more requests than a T4
+        max_throughput = profile.groupby("Provider")["Throughput (req/s)"].max()
+        self.assertGreater(max_throughput["FlexAI"], 5 * max_throughput["AWS"])
+        
+        # The same run id gives the same curves
+        replay = profile_inference(
+            gpu_by_provider=gpu_by_provider, batch_sizes=(1, 8), n_requests=1000,
+            context=RunContext(3)
+        )
+        pd.testing.assert_frame_equal(profile, replay)
+        
+        with self.assertRaises(ValueError):
+            batch_service_time("CV Model Training (ResNet-50)", "AWS")
+
+if __name__ == "__main__":
+    unittest.main()
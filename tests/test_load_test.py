@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.load_test import run_load_test, save_load_test_report, summarize_latencies
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+class TestLoadTest(unittest.TestCase):
+    
+    def test_summarize_latencies(self):
+        """Test percentiles per interaction, in the order they happen"""
+        interactions = pd.DataFrame({
+            "Session": [0] * 100 + [1] * 100,
+            "Interaction": ["Open"] * 100 + ["Run Benchmark"] * 100,
+            "Latency (s)": [i / 100 for i in range(1, 101)] * 2,
+            "Errors": [0] * 199 + [1]
+        })
+        
+        summary = summarize_latencies(interactions)
+        
+        self.assertEqual(summary["Interaction"].tolist(), ["Open", "Run Benchmark"])
+        self.assertEqual(summary["Count"].tolist(), [100, 100])
+        self.assertEqual(summary["Errors"].tolist(), [0, 1])
+        self.assertAlmostEqual(summary["P50 (s)"].iloc[0], 0.505)
+        self.assertLessEqual(summary["P95 (s)"].iloc[0], summary["P99 (s)"].iloc[0])
+        self.assertEqual(summary["Max (s)"].iloc[0], 1.0)
+    
+    def test_dashboard_under_load(self):
+        """Test concurrent sessions through the main flow of the dashboard"""
+        interactions, latency_summary, run_summary = run_load_test(
+            2, app_path=APP_PATH, workloads=["Batch Inference (Stable Diffusion XL)"]
+        )
+        
+        # Open, select, run and every results tab, for both sessions
+        self.assertEqual(len(interactions), 2 * 7)
+        self.assertEqual(run_summary["Errors"], 0)
+        self.assertTrue(interactions["Latency (s)"].notna().all())
+        self.assertGreater(run_summary["Peak RSS (MB)"], 0)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            markdown_path = save_load_test_report(
+                latency_summary, run_summary, os.path.join(temp_dir, "load.md")
+            )
+            with open(markdown_path, encoding="utf-8") as f:
+                self.assertIn("| Run Benchmark |", f.read())
+            
+            json_path = save_load_test_report(
+                latency_summary, run_summary, os.path.join(temp_dir, "load.json")
+            )
+            with open(json_path, encoding="utf-8") as f:
+                report = json.load(f)
+            self.assertEqual(report["run"]["Sessions"], 2)
+            self.assertEqual(len(report["latency"]), 7)
+
+if __name__ == "__main__":
+    unittest.main()
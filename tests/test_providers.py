@@ -0,0 +1,89 @@
+import unittest
+import json
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.providers import (
+    NO_SPOT_MARKET, PROVIDERS_DIR, get_baseline_provider, gpu_relative_speed,
+    load_provider_registry, provider_factor_ranges, provider_hourly_rates, provider_spot_markets
+)
+from src.visualizations import PROVIDER_COLORS, provider_color, provider_fill_color
+
+class TestProviders(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a provider plug-in for a fifth cloud with a new GPU"""
+        self.plugin = {
+            "Name": "Lambda",
+            "Pricing": {"Hourly_Rates": {"NVIDIA GH200": 3.19}},
+            "Hardware": {"GPUs": ["NVIDIA GH200"]},
+            "Performance": {"Time_Factor": [0.8, 1.0], "Cost_Factor": [0.8, 1.1]}
+        }
+
+    def test_load_provider_registry(self):
+        """Test that the shipped provider files load whatever the working directory"""
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(PROVIDERS_DIR, os.path.join(repo_root, "data", "providers"))
+
+        registry = load_provider_registry()
+        self.assertEqual(list(registry), ["FlexAI", "AWS", "GCP", "Azure"])
+        self.assertEqual(get_baseline_provider(registry), "FlexAI")
+
+        # A missing or empty directory registers nothing
+        with tempfile.TemporaryDirectory() as config_dir:
+            for empty_dir in (config_dir, os.path.join(config_dir, "missing")):
+                with self.assertRaises(ValueError):
+                    load_provider_registry(empty_dir)
+
+    def test_provider_plugin(self):
+        """Test that a plug-in file adds a provider without code changes"""
+        with tempfile.TemporaryDirectory() as config_dir:
+            for name, spec in list(load_provider_registry().items()) + [("Lambda", self.plugin)]:
+                with open(os.path.join(config_dir, f"{name.lower()}.json"), "w") as f:
+                    json.dump(spec, f)
+            registry = load_provider_registry(config_dir)
+
+        # Providers without an order come after the others
+        self.assertEqual(list(registry), ["FlexAI", "AWS", "GCP", "Azure", "Lambda"])
+        self.assertEqual(provider_hourly_rates(registry)["Lambda"], {"NVIDIA GH200": 3.19})
+        self.assertEqual(provider_factor_ranges(registry)["Lambda"]["time"], (0.8, 1.0))
+
+        # Optional sections have neutral defaults
+        self.assertEqual(provider_spot_markets(registry)["Lambda"], NO_SPOT_MARKET)
+        self.assertEqual(gpu_relative_speed("Lambda", "NVIDIA GH200", registry), 1.0)
+        self.assertEqual(gpu_relative_speed("FlexAI", "NVIDIA H100", registry), 1.9)
+
+        # The first provider is the baseline unless a plug-in sets one
+        without_flexai = {name: spec for name, spec in registry.items() if name != "FlexAI"}
+        self.assertEqual(get_baseline_provider(without_flexai), "AWS")
+
+    def test_invalid_provider(self):
+        """Test that incomplete provider specifications are rejected"""
+        del self.plugin["Performance"]
+        unpriced = dict(load_provider_registry()["AWS"], Name="Unpriced", Hardware={"GPUs": ["NVIDIA B200"]})
+
+        for spec in (self.plugin, unpriced):
+            with tempfile.TemporaryDirectory() as config_dir:
+                with open(os.path.join(config_dir, "provider.json"), "w") as f:
+                    json.dump(spec, f)
+
+                with self.assertRaises(ValueError):
+                    load_provider_registry(config_dir)
+
+    def test_provider_colors(self):
+        """Test that every provider gets a distinct, stable chart color"""
+        self.assertEqual(provider_color("FlexAI"), PROVIDER_COLORS[0])
+        self.assertEqual(provider_fill_color("FlexAI"), "rgba(0, 102, 204, 0.2)")
+
+        # Providers outside the registry still get a valid color
+        colors = {provider_color(f"Cloud {i}") for i in range(24)}
+        self.assertEqual(len(colors), 24)
+        self.assertTrue(all(color.startswith("#") and len(color) == 7 for color in colors))
+        self.assertEqual(provider_color("Cloud 0"), provider_color("Cloud 0"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_generator import generate_sample_data
+from src.report import build_report_tables, generate_report
+
+class TestReport(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up test data"""
+        self.data = generate_sample_data()
+        self.workloads = list(self.data["Workload"].unique())
+    
+    def test_build_report_tables(self):
+        """Test the cost, savings and champion tables of a workload"""
+        tables = build_report_tables(self.data, self.workloads[0])
+        
+        self.assertEqual(len(tables["Detailed Cost Breakdown"]), 4)
+        
+        # Savings are reported against every provider except FlexAI
+        savings = tables["Estimated Cost Savings with FlexAI"]
+        self.assertEqual(set(savings["Provider"]), {"AWS", "GCP", "Azure"})
+        
+        champions = tables["Overall Champion"]
+        self.assertEqual(list(champions["Rank"]), [1, 2, 3, 4])
+        self.assertTrue(champions["Points"].is_monotonic_decreasing)
+    
+    def test_generate_html_report(self):
+        """Test that the HTML report has a section per workload"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = generate_report(self.data, os.path.join(output_dir, "report.html"), workers=2)
+            
+            with open(path) as f:
+                html = f.read()
+            self.assertEqual(html.count("<section>"), len(self.workloads))
+            
+            # Sections are written in workload order
+            positions = [html.index(f"<h2>{workload}</h2>") for workload in self.workloads]
+            self.assertEqual(positions, sorted(positions))
+    
+    def test_generate_markdown_report(self):
+        """Test that the Markdown report writes its charts next to it"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = generate_report(
+                self.data, os.path.join(output_dir, "report.md"),
+                report_format="markdown", metrics=["Cost ($)"], workers=1
+            )
+            
+            with open(path) as f:
+                markdown = f.read()
+            for workload in self.workloads:
+                self.assertIn(f"## {workload}", markdown)
+            self.assertEqual(len(os.listdir(os.path.join(output_dir, "assets"))), len(self.workloads))
+
+if __name__ == "__main__":
+    unittest.main()
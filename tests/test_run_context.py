@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adaptive_trials import run_adaptive_trials
+from src.benchmark_simulator import calculate_workload_cost
+from src.data_generator import generate_sample_data
+from src.run_context import RunContext
+
+class TestRunContext(unittest.TestCase):
+    
+    def test_streams(self):
+        """Test that streams depend on their key only"""
+        context = RunContext(7)
+        first = context.stream("AWS", "Test Workload").random(5)
+        
+        context.rng.random(100)
+        self.assertEqual(list(context.stream("AWS", "Test Workload").random(5)), list(first))
+        self.assertNotEqual(list(context.stream("GCP", "Test Workload").random(5)), list(first))
+        self.assertNotEqual(list(RunContext(8).stream("AWS", "Test Workload").random(5)), list(first))
+    
+    def test_run_id_regenerates_results(self):
+        """Test that a run id alone regenerates a run's results"""
+        context = RunContext()
+        df = generate_sample_data(context=context)
+        
+        replay = generate_sample_data(context=RunContext.from_run_id(context.run_id))
+        pd.testing.assert_frame_equal(df, replay)
+        self.assertFalse(df.equals(generate_sample_data(context=RunContext())))
+        
+        cost = calculate_workload_cost("AWS", "Test Workload", 60, rng=context.stream("cost"))
+        self.assertEqual(cost, calculate_workload_cost("AWS", "Test Workload", 60,
+                                                       rng=context.stream("cost")))
+    
+    def test_parallel_matches_serial(self):
+        """Test that parallel runs give the results of a serial run"""
+        serial = generate_sample_data(context=RunContext(42))
+        
+        with ThreadPoolExecutor(4) as executor:
+            threaded = generate_sample_data(context=RunContext(42), executor=executor)
+        with ProcessPoolExecutor(2) as executor:
+            processes = generate_sample_data(context=RunContext(42), executor=executor)
+        
+        pd.testing.assert_frame_equal(serial, threaded)
+        pd.testing.assert_frame_equal(serial, processes)
+        
+        # Adaptive trials are reproducible too
+        trials, _ = run_adaptive_trials(max_trials=5, context=RunContext(42))
+        replay, _ = run_adaptive_trials(max_trials=5, context=RunContext(42))
+        pd.testing.assert_frame_equal(trials, replay)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.run_diff import changed_rows, diff_runs, main
+
+class TestRunDiff(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up two runs of one workload"""
+        self.before = pd.DataFrame({
+            "Provider": ["FlexAI", "AWS", "GCP"],
+            "Workload": ["Test Workload"] * 3,
+            "GPU": ["NVIDIA A100"] * 3,
+            "Execution Time (min)": [50.0, 60.0, 70.0],
+            "Cost ($)": [10.0, 12.0, 14.0]
+        })
+        self.after = pd.DataFrame({
+            "Provider": ["FlexAI", "AWS", "Azure"],
+            "Workload": ["Test Workload"] * 3,
+            "GPU": ["NVIDIA A100"] * 3,
+            "Execution Time (min)": [55.0, 45.0, 80.0],
+            "Cost ($)": [10.0, 12.0, 16.0]
+        })
+    
+    def test_diff_runs(self):
+        """Test deltas, rank changes and keys only one run has"""
+        diff = diff_runs(self.before, self.after).set_index(["Provider", "Metric"])
+        
+        flexai_time = diff.loc[("FlexAI", "Execution Time (min)")]
+        self.assertEqual(flexai_time["Delta"], 5.0)
+        self.assertEqual(flexai_time["Delta (%)"], 10.0)
+        self.assertEqual(flexai_time["Rank Change"], -1)
+        self.assertEqual(diff.loc[("AWS", "Execution Time (min)"), "Rank Change"], 1)
+        
+        # Derived metrics are compared too
+        self.assertEqual(diff.loc[("AWS", "Cost per Minute ($)"), "Before"], 0.2)
+        
+        self.assertEqual(diff.loc[("GCP", "Cost ($)"), "Status"], "Removed")
+        self.assertEqual(diff.loc[("Azure", "Cost ($)"), "Status"], "Added")
+        self.assertTrue(np.isnan(diff.loc[("Azure", "Cost ($)"), "Before"]))
+        
+        # Single results cannot be significant; unchanged costs are not reported
+        self.assertFalse(diff["Significant"].any())
+        changes = changed_rows(diff.reset_index())
+        self.assertNotIn(("FlexAI", "Cost ($)"), list(zip(changes["Provider"], changes["Metric"])))
+        
+        with self.assertRaises(ValueError):
+            diff_runs(self.before, self.after, ["Throughput"])
+    
+    def test_significance(self):
+        """Test that only shifts larger than the run-to-run noise are significant"""
+        rng = np.random.default_rng(0)
+        
+        def run(mean_time, n=200):
+            return pd.DataFrame({
+                "Provider": ["FlexAI"] * n,
+                "Workload": ["Test Workload"] * n,
+                "GPU": ["NVIDIA A100"] * n,
+                "Execution Time (min)": rng.normal(mean_time, 5, n),
+                "Cost ($)": rng.normal(10, 1, n)
+            })
+        
+        diff = diff_runs(run(50), run(55)).set_index("Metric")
+        self.assertTrue(diff.loc["Execution Time (min)", "Significant"])
+        self.assertFalse(diff.loc["Cost ($)", "Significant"])
+    
+    def test_cli(self):
+        """Test the command line diff of two results CSVs"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, name) for name in ["before.csv", "after.csv", "diff.csv"]]
+            self.before.to_csv(paths[0], index=False)
+            self.after.to_csv(paths[1], index=False)
+            
+            main([paths[0], paths[1], "--output", paths[2]])
+            diff = pd.read_csv(paths[2])
+        
+        self.assertEqual(set(diff["Status"]), {"Matched", "Added", "Removed"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scaling import compare_provider_scaling, find_scaling_limit, instance_gpu_count, simulate_scaling
+from src.data_generator import generate_benchmark_row, generate_sample_data
+from src.run_context import RunContext
+
+class TestScaling(unittest.TestCase):
+    
+    def test_simulate_scaling(self):
+        """Test the scaling sweep from 1 to 1024 GPUs"""
+        df = simulate_scaling("LLM Fine-Tuning (Llama 3 8B)", "AWS")
+        
+        self.assertEqual(len(df), 1024)
+        self.assertEqual(df["Scaling Efficiency"].iloc[0], 1)
+        self.assertTrue(all(df["Scaling Efficiency"] <= 1))
+        self.assertEqual(df["Nodes"].iloc[-1], 128)
+        
+        # Adding GPUs never makes the run cheaper
+        self.assertTrue(all(df["Cost ($)"] >= df["Cost ($)"].iloc[0]))
+    
+    def test_linear_scaling(self):
+        """Test that perfectly parallel workloads keep full efficiency"""
+        df = simulate_scaling("Batch Inference (Stable Diffusion XL)", "GCP", gpu_counts=[1, 16, 256])
+        self.assertTrue(np.allclose(df["Scaling Efficiency"], 1))
+    
+    def test_find_scaling_limit(self):
+        """Test the scaling limit of each provider"""
+        limits = compare_provider_scaling("LLM Fine-Tuning (Llama 3 8B)", min_efficiency=0.5)
+        
+        self.assertEqual(set(limits["Provider"]), {"FlexAI", "AWS", "GCP", "Azure"})
+        self.assertTrue(all(limits["Scaling Efficiency"] >= 0.5))
+        self.assertEqual(set(limits["GPU"]), {"NVIDIA A100"})
+        
+        # Each provider can scale on its own GPU
+        limits = compare_provider_scaling(
+            "LLM Fine-Tuning (Llama 3 8B)", gpu_by_provider={"FlexAI": "NVIDIA H100", "AWS": "NVIDIA V100"}
+        )
+        self.assertEqual(dict(zip(limits["Provider"], limits["GPU"])), {"FlexAI": "NVIDIA H100", "AWS": "NVIDIA V100"})
+        
+        df = simulate_scaling("LLM Fine-Tuning (Llama 3 8B)", "AWS")
+        limit = find_scaling_limit(df, min_efficiency=0.5)
+        beyond = df[df["GPUs"] > limit["GPUs"]]
+        self.assertTrue(all(beyond["Scaling Efficiency"] < 0.5))
+    
+    def test_multi_gpu_instance(self):
+        """Test that multi-GPU instances run faster"""
+        self.assertEqual(instance_gpu_count("AWS", "p3.16xlarge"), 8)
+        self.assertEqual(instance_gpu_count("GCP", "a2-highgpu-4g"), 4)
+        
+        row = generate_benchmark_row("AWS", "CV Model Training (ResNet-50)", "p3.16xlarge")
+        self.assertLess(row["Execution Time (min)"], 180 * 0.9)
+        
+        # Sample data runs on each provider's configured instance type
+        workload = "CV Model Training (ResNet-50)"
+        default = generate_sample_data(context=RunContext(seed=7))
+        multi_gpu = generate_sample_data(context=RunContext(seed=7), instance_by_provider={"AWS": "p3.16xlarge"})
+        default_time, multi_gpu_time = (
+            df[(df["Provider"] == "AWS") & (df["Workload"] == workload)]["Execution Time (min)"].iloc[0]
+            for df in (default, multi_gpu)
+        )
+        self.assertLess(multi_gpu_time, default_time)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.derived_metrics import LOWER_IS_BETTER
+from src.report import CHAMPION_METRICS
+from src.sensitivity import analyze_sensitivity, batch_winners, flip_thresholds
+from src.utils import get_winner
+
+class TestSensitivity(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up two providers 4% apart on cost"""
+        self.results = pd.DataFrame({
+            "Provider": ["AWS", "FlexAI"],
+            "Workload": ["Test Workload"] * 2,
+            "Cost ($)": [100.0, 104.0]
+        })
+    
+    def test_batch_winners_match_get_winner(self):
+        """Test the vectorized ranking against get_winner, ties included"""
+        rng = np.random.default_rng(0)
+        providers = ["FlexAI", "AWS", "GCP", "Azure"]
+        lower_is_better = np.array([metric in LOWER_IS_BETTER for metric in CHAMPION_METRICS])
+        
+        values = rng.random((200, len(providers), len(CHAMPION_METRICS)))
+        winners, totals = batch_winners(values, lower_is_better)
+        
+        for sample, winner, total in zip(values, winners, totals):
+            df = pd.DataFrame(sample, columns=CHAMPION_METRICS).assign(
+                Provider=providers, Workload="Test Workload"
+            )
+            expected_winner, rankings = get_winner(df, "Test Workload", CHAMPION_METRICS)
+            self.assertEqual(providers[winner], expected_winner)
+            self.assertEqual(total.tolist(), [rankings[provider] for provider in providers])
+    
+    def test_analyze_sensitivity(self):
+        """Test win shares and the inputs that flip the champion"""
+        for method in ["monte_carlo", "sobol"]:
+            win_shares, effects = analyze_sensitivity(
+                self.results, "Test Workload", ["Cost ($)"], n_samples=20000, method=method, seed=1
+            )
+            shares = win_shares.set_index("Provider")["Win Share (%)"]
+            
+            # AWS keeps the title unless FlexAI's price falls and AWS's rises
+            self.assertTrue(win_shares["Baseline Champion"].iloc[0])
+            self.assertAlmostEqual(shares.sum(), 100)
+            self.assertTrue(0 < shares["FlexAI"] < 20)
+            
+            correlation = effects.set_index("Provider")["Flip Correlation"]
+            self.assertGreater(correlation["AWS"], 0)
+            self.assertLess(correlation["FlexAI"], 0)
+        
+        # Too small a range to ever flip
+        win_shares, _ = analyze_sensitivity(
+            self.results, "Test Workload", ["Cost ($)"], n_samples=1000, rel_range=0.01, seed=1
+        )
+        self.assertEqual(win_shares["Wins"].tolist(), [1000, 0])
+    
+    def test_flip_thresholds(self):
+        """Test the smallest single change that flips the champion"""
+        thresholds = flip_thresholds(self.results, "Test Workload", ["Cost ($)"])
+        
+        self.assertEqual(thresholds["Provider"].tolist(), ["FlexAI", "AWS"])
+        for change, expected in zip(thresholds["Flip At (%)"], [-4.0, 4.5]):
+            self.assertAlmostEqual(change, expected)
+        self.assertEqual(thresholds["New Champion"].tolist(), ["FlexAI", "FlexAI"])
+        
+        thresholds = flip_thresholds(self.results, "Test Workload", ["Cost ($)"], max_change=0.02)
+        self.assertTrue(thresholds["Flip At (%)"].isna().all())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import gc
+import sys
+import os
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_generator import generate_sample_data
+from src.shared_results import SharedResultsRegistry
+
+class TestSharedResults(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a registry with a pinned default dataset"""
+        self.registry = SharedResultsRegistry()
+        self.data = generate_sample_data()
+        self.registry.publish("default", self.data, pinned=True)
+    
+    def test_sessions_share_one_dataset(self):
+        """Test that every viewer reads the same DataFrame"""
+        handles = [self.registry.acquire("default") for _ in range(100)]
+        
+        self.assertTrue(all(handle.data is self.data for handle in handles))
+        self.assertEqual(self.registry.stats()["default"], 100)
+        
+        # Dropped sessions release their reference
+        del handles
+        gc.collect()
+        self.assertEqual(self.registry.stats()["default"], 0)
+    
+    def test_copy_on_write(self):
+        """Test that a session running its own benchmark detaches"""
+        viewer = self.registry.acquire("default")
+        runner = self.registry.acquire("default")
+        
+        own_results = generate_sample_data()
+        runner.replace(own_results)
+        self.assertIs(runner.data, own_results)
+        self.assertFalse(runner.is_shared)
+        self.assertEqual(self.registry.stats()["default"], 1)
+        
+        # Modifying a private copy leaves the shared dataset untouched
+        editable = viewer.mutable()
+        editable["Cost ($)"] = 0
+        self.assertIsNot(editable, self.data)
+        self.assertTrue(all(self.data["Cost ($)"] > 0))
+        self.assertEqual(self.registry.stats()["default"], 0)
+    
+    def test_version_changes_with_results(self):
+        """Test that the dataset version keys what a session sees"""
+        first = self.registry.acquire("default")
+        second = self.registry.acquire("default")
+        self.assertEqual(first.version, second.version)
+        
+        # Running a benchmark gives the session a new version
+        shared_version = first.version
+        first.replace(generate_sample_data())
+        self.assertNotEqual(first.version, shared_version)
+        self.assertEqual(second.version, shared_version)
+        
+        # So does republishing the shared dataset
+        self.registry.publish("default", generate_sample_data(), pinned=True)
+        self.assertNotEqual(second.version, shared_version)
+        
+        # And so does every in-place edit, not only the first copy
+        edited_versions = set()
+        for cost in (1, 2):
+            second.mutable()["Cost ($)"] = cost
+            edited_versions.add(second.version)
+        self.assertEqual(len(edited_versions), 2)
+        self.assertNotIn(shared_version, edited_versions)
+    
+    def test_unpinned_dataset_is_dropped(self):
+        """Test that unpinned datasets go away with their last handle"""
+        self.registry.publish("team-run", generate_sample_data())
+        handle = self.registry.acquire("team-run")
+        handle.close()
+        handle.close()  # Releasing twice is harmless
+        
+        self.assertNotIn("team-run", self.registry.stats())
+        with self.assertRaises(KeyError):
+            self.registry.acquire("team-run")
+
+if __name__ == "__main__":
+    unittest.main()
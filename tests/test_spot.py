@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark_simulator import HOURLY_RATES
+from src.spot import compare_spot_pricing, get_spot_price_table, simulate_spot_runs, summarize_spot_runs
+from src.what_if import hourly_rates_with
+
+class TestSpot(unittest.TestCase):
+    
+    def test_get_spot_price_table(self):
+        """Test that spot rates are discounted on-demand rates"""
+        table = get_spot_price_table()
+        self.assertTrue(all(table["Spot Hourly Rate"] < table["Hourly Rate"]))
+        self.assertTrue(all(table["Interruptions per Hour"] > 0))
+    
+    def test_simulate_spot_runs(self):
+        """Test that spot runs are cheaper but never faster"""
+        runs = simulate_spot_runs("AWS", "LLM Fine-Tuning (Llama 3 8B)", n_runs=5000, seed=1)
+        
+        self.assertEqual(len(runs), 5000)
+        self.assertTrue(all(runs["Spot Time (min)"] >= runs["On-Demand Time (min)"]))
+        self.assertTrue(all(runs["Spot Cost ($)"] < runs["On-Demand Cost ($)"]))
+        self.assertGreater(runs["Interruptions"].sum(), 0)
+    
+    def test_frequent_interruptions(self):
+        """Test that longer checkpoint intervals lose more work"""
+        short = simulate_spot_runs("GCP", "CV Model Training (ResNet-50)", checkpoint_interval_min=5,
+                                   checkpoint_cost_min=0, seed=2)
+        long = simulate_spot_runs("GCP", "CV Model Training (ResNet-50)", checkpoint_interval_min=120,
+                                  checkpoint_cost_min=0, seed=2)
+        
+        lost_short = (short["Spot Time (min)"] - short["On-Demand Time (min)"]).mean()
+        lost_long = (long["Spot Time (min)"] - long["On-Demand Time (min)"]).mean()
+        self.assertGreater(lost_long, lost_short)
+    
+    def test_summaries(self):
+        """Test the distribution summaries"""
+        runs = simulate_spot_runs("Azure", "Batch Inference (Stable Diffusion XL)", n_runs=1000, seed=3)
+        summary = summarize_spot_runs(runs)
+        self.assertEqual(list(summary["Mode"]), ["On-Demand", "Spot"])
+        self.assertTrue(all(summary["P5 Cost"] <= summary["P95 Cost"]))
+        
+        comparison = compare_spot_pricing(
+            "Batch Inference (Stable Diffusion XL)",
+            {"AWS": "NVIDIA T4", "FlexAI": "NVIDIA T4"},
+            n_runs=1000, seed=3
+        )
+        self.assertEqual(list(comparison["Provider"]), ["AWS", "FlexAI"])
+        
+        # Edited rates reprice both modes of the same simulated runs
+        repriced = compare_spot_pricing(
+            "Batch Inference (Stable Diffusion XL)",
+            {"AWS": "NVIDIA T4", "FlexAI": "NVIDIA T4"},
+            n_runs=1000, seed=3,
+            hourly_rates=hourly_rates_with((("AWS", "NVIDIA T4", 2 * HOURLY_RATES["AWS"]["NVIDIA T4"]),))
+        )
+        for column in ["On-Demand Cost ($)", "Spot Cost ($)"]:
+            self.assertAlmostEqual(repriced[column][0], 2 * comparison[column][0])
+            self.assertAlmostEqual(repriced[column][1], comparison[column][1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import tempfile
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.trace_ingest import normalize_trace_chunk, read_trace_chunks, summarize_trace
+
+class TestTraceIngest(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a small job log"""
+        self.log = pd.DataFrame([
+            {"start": "2025-01-01T00:00:00Z", "end": "2025-01-01T01:00:00Z", "gpu_type": "NVIDIA A100",
+             "provider": "AWS", "workload": "LLM Fine-Tuning (Llama 3 8B)", "tokens_processed": 360000,
+             "gpu_utilization": 80, "cost": 4.0},
+            {"start": "2025-01-01T00:00:00Z", "end": "2025-01-01T00:30:00Z", "gpu_type": "NVIDIA A100",
+             "provider": "AWS", "workload": "LLM Fine-Tuning (Llama 3 8B)", "tokens_processed": 360000,
+             "gpu_utilization": 90, "cost": 2.0},
+            {"start": "2025-01-01T00:00:00Z", "end": "2025-01-01T00:10:00Z", "gpu_type": "NVIDIA T4",
+             "provider": "FlexAI", "workload": "Batch Inference (Stable Diffusion XL)", "images_processed": 600,
+             "gpu_utilization": 70, "cost": None}
+        ])
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def write_log(self, file_name):
+        path = os.path.join(self.temp_dir.name, file_name)
+        if file_name.endswith(".csv"):
+            self.log.to_csv(path, index=False)
+        else:
+            self.log.to_json(path, orient="records", lines=True)
+        return path
+    
+    def test_normalize_trace_chunk(self):
+        """Test that log rows are converted to the benchmark schema"""
+        chunk = next(read_trace_chunks(self.write_log("trace.csv")))
+        df = normalize_trace_chunk(chunk)
+        
+        self.assertEqual(list(df["Execution Time (min)"]), [60, 30, 10])
+        self.assertEqual(list(df["Throughput"]), [100, 200, 60])
+        self.assertEqual(list(df["Throughput Unit"]), ["tokens/sec", "tokens/sec", "images/min"])
+        
+        # Missing costs come from the provider pricing
+        self.assertAlmostEqual(df["Cost ($)"].iloc[2], round(10 / 60 * 0.76 * 0.8, 2))
+    
+    def test_summarize_trace(self):
+        """Test streaming aggregation with chunks smaller than the log"""
+        for file_name in ["trace.csv", "trace.jsonl"]:
+            summary = summarize_trace(self.write_log(file_name), chunksize=1)
+            aws = summary[summary["Provider"] == "AWS"].iloc[0]
+            
+            self.assertEqual(aws["Runs"], 2)
+            self.assertEqual(aws["Execution Time (min)"], 45)
+            self.assertEqual(aws["Cost ($)"], 3)
+            self.assertEqual(aws["Throughput"], 150)
+            self.assertEqual(aws["GPU Utilization (%)"], 85)
+            self.assertAlmostEqual(aws["Cost-Performance Ratio"], 0.02)
+
+if __name__ == "__main__":
+    unittest.main()
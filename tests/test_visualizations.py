@@ -7,7 +7,11 @@ import plotly.graph_objects as go
 # Add the parent directory to the path so we can import the src modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.visualizations import create_platform_comparison_chart, create_radar_chart, create_leaderboard
+from src.visualizations import (
+    RETRO_TEMPLATE, create_cost_per_hour_chart, create_leaderboard,
+    create_platform_comparison_chart, create_platform_comparison_charts,
+    create_radar_chart, create_radar_charts, create_small_multiples_chart
+)
 
 class TestVisualizations(unittest.TestCase):
     
@@ -75,6 +79,69 @@ class TestVisualizations(unittest.TestCase):
         # Check that we have the right number of traces (one per provider)
         self.assertEqual(len(fig.data), 4)
     
+    def test_batch_builders(self):
+        """Test that batch builders match the single-workload builders"""
+        other_workload = self.test_data.assign(
+            Workload="Other Workload",
+            Throughput=self.test_data["Throughput"][::-1].values
+        )
+        df = pd.concat([self.test_data, other_workload], ignore_index=True)
+        metrics = ["Execution Time (min)", "Throughput"]
+        
+        bar_charts = create_platform_comparison_charts(df, metrics)
+        self.assertEqual(list(bar_charts), [
+            ("Test Workload", "Execution Time (min)"), ("Test Workload", "Throughput"),
+            ("Other Workload", "Execution Time (min)"), ("Other Workload", "Throughput")
+        ])
+        for (workload, metric), fig in bar_charts.items():
+            self.assertEqual(fig, create_platform_comparison_chart(df, workload, metric))
+        
+        radar_charts = create_radar_charts(df)
+        self.assertEqual(list(radar_charts), ["Test Workload", "Other Workload"])
+        for workload, fig in radar_charts.items():
+            self.assertEqual(fig, create_radar_chart(df, workload))
+    
+    def test_create_small_multiples_chart(self):
+        """Test the workload x metric grid built from one aggregation"""
+        # A repeated run of every provider is averaged in
+        repeated_run = self.test_data.assign(**{"Cost ($)": self.test_data["Cost ($)"] + 10})
+        other_workload = self.test_data.assign(Workload="Other Workload")
+        df = pd.concat([self.test_data, repeated_run, other_workload], ignore_index=True)
+        metrics = ["Cost ($)", "Throughput"]
+        
+        fig = create_small_multiples_chart(df, metrics)
+        self.assertIsInstance(fig, go.Figure)
+        
+        # One bar trace per cell, each on its own axes
+        self.assertEqual(len(fig.data), 2 * 2)
+        self.assertEqual(len({trace.xaxis for trace in fig.data}), 4)
+        
+        cost = fig.data[0]
+        self.assertEqual(list(cost.x), ["FlexAI", "AWS", "GCP", "Azure"])
+        self.assertEqual(list(cost.y), [25, 35, 30, 40])
+        self.assertEqual(cost.marker.color[0], "#0066cc")  # Cheapest
+        self.assertEqual(fig.data[1].marker.color[0], "#0066cc")  # Highest throughput
+    
+    def test_retro_template(self):
+        """Test that every figure takes its styling from the retro template"""
+        figures = [
+            create_platform_comparison_chart(self.test_data, "Test Workload", "Cost ($)"),
+            create_cost_per_hour_chart(self.test_data, "Test Workload"),
+            create_radar_chart(self.test_data, "Test Workload")
+        ]
+        
+        for fig in figures:
+            self.assertEqual(fig.layout.template, RETRO_TEMPLATE)
+            # The theme is not repeated in the figure's own layout
+            self.assertIsNone(fig.layout.paper_bgcolor)
+            self.assertEqual(len(fig.layout.shapes), 0)
+        
+        # The best provider is highlighted and comes first
+        bars = figures[0].data
+        self.assertEqual(bars[0].name, "FlexAI")
+        self.assertEqual(bars[0].marker.color, "#0066cc")
+        self.assertTrue(all(bar.marker.color == "#ff66b2" for bar in bars[1:]))
+    
     def test_create_leaderboard(self):
         """Test creating a leaderboard"""
         # Test with execution time (lower is better)
@@ -92,6 +159,14 @@ class TestVisualizations(unittest.TestCase):
         
         # The first row should be the best provider (FlexAI for throughput)
         self.assertEqual(leaderboard2.iloc[0]["Provider"], "FlexAI")
+        
+        # Cost per unit of throughput is lower-is-better too
+        ratios = self.test_data.assign(**{
+            "Cost-Performance Ratio": self.test_data["Cost ($)"] / self.test_data["Throughput"]
+        })
+        leaderboard3 = create_leaderboard(ratios, "Test Workload", "Cost-Performance Ratio")
+        self.assertEqual(leaderboard3.iloc[0]["Provider"], "FlexAI")
+        self.assertEqual(leaderboard3["Rank"].tolist(), ["1", "2", "3", "4"])
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
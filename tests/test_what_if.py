@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.benchmark_simulator import HOURLY_RATES
+from src.derived_metrics import add_derived_metrics
+from src.utils import get_resource_price_table
+from src.what_if import COST_COLUMNS, changed_rates, hourly_rates_with, reprice_results
+
+class TestWhatIf(unittest.TestCase):
+
+    def setUp(self):
+        """Set up results billed at list prices"""
+        self.results = add_derived_metrics(pd.DataFrame({
+            "Provider": ["FlexAI", "AWS"],
+            "Workload": ["Test Workload"] * 2,
+            "Execution Time (min)": [60.0, 30.0],
+            "Cost ($)": [10.0, 12.0],
+            "Throughput": [100.0, 120.0],
+            "GPU Utilization (%)": [90.0, 80.0],
+            "Memory Usage (%)": [70.0, 60.0]
+        }))
+
+    def test_changed_rates(self):
+        """Test that only rates differing from the list prices are reported"""
+        price_table = get_resource_price_table()
+        self.assertEqual(changed_rates(price_table), ())
+
+        price_table.loc[price_table["Provider"] == "FlexAI", "Hourly Rate"] = 1.0
+        changes = changed_rates(price_table)
+        self.assertEqual(len(changes), 3)
+        self.assertIn(("FlexAI", "NVIDIA A100", 1.0), changes)
+
+    def test_reprice_results(self):
+        """Test that costs scale with the rate and only cost columns change"""
+        self.assertIs(reprice_results(self.results, ()), self.results)
+
+        half_rate = HOURLY_RATES["FlexAI"]["NVIDIA A100"] / 2
+        repriced = reprice_results(self.results, (("FlexAI", "NVIDIA A100", half_rate),))
+
+        self.assertEqual(repriced["Cost ($)"].tolist(), [5.0, 12.0])
+        self.assertEqual(repriced["Cost-Performance Ratio"].tolist(), [0.05, 0.1])
+        self.assertEqual(repriced["Cost per Hour ($)"].tolist(), [5.0, 24.0])
+
+        # Every other column is untouched, and so are the original results
+        other_columns = [column for column in self.results.columns if column not in COST_COLUMNS]
+        pd.testing.assert_frame_equal(repriced[other_columns], self.results[other_columns])
+        self.assertEqual(self.results["Cost ($)"].tolist(), [10.0, 12.0])
+
+    def test_hourly_rates_with(self):
+        """Test that changed rates override a copy of the hourly rates"""
+        rates = hourly_rates_with((("AWS", "NVIDIA T4", 0.5),))
+
+        self.assertEqual(rates["AWS"]["NVIDIA T4"], 0.5)
+        self.assertEqual(rates["AWS"]["NVIDIA A100"], HOURLY_RATES["AWS"]["NVIDIA A100"])
+        self.assertEqual(HOURLY_RATES["AWS"]["NVIDIA T4"], 0.95)
+
+if __name__ == "__main__":
+    unittest.main()
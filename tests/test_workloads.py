@@ -0,0 +1,60 @@
+import unittest
+import json
+import sys
+import os
+import tempfile
+import pandas as pd
+
+# Add the parent directory to the path so we can import the src modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.workloads import WORKLOADS_FILE, calculate_throughput, load_workload_registry
+from src.benchmark_simulator import calculate_workload_costs
+
+class TestWorkloads(unittest.TestCase):
+    
+    def test_load_workload_registry(self):
+        """Test that the shipped registry file loads whatever the working directory"""
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(WORKLOADS_FILE, os.path.join(repo_root, "data", "workloads.json"))
+        self.assertIn("LLM Fine-Tuning (Llama 3 8B)", load_workload_registry())
+        
+        # A missing file is an error, not a silent fallback
+        with self.assertRaises(FileNotFoundError):
+            load_workload_registry("nonexistent_file.json")
+    
+    def test_invalid_workload_registry(self):
+        """Test that incomplete workload specifications are rejected"""
+        with tempfile.TemporaryDirectory() as config_dir:
+            path = os.path.join(config_dir, "workloads.json")
+            with open(path, "w") as f:
+                json.dump({"My Workload": {"Base_Time": 10}}, f)
+            
+            with self.assertRaises(ValueError):
+                load_workload_registry(path)
+    
+    def test_calculate_throughput(self):
+        """Test the per-workload throughput formulas"""
+        throughput, unit = calculate_throughput("LLM Fine-Tuning (Llama 3 8B)", 100)
+        self.assertEqual(throughput, 50)
+        self.assertEqual(unit, "tokens/sec")
+        
+        throughput, unit = calculate_throughput("CV Model Training (ResNet-50)", 100)
+        self.assertEqual(throughput, 500)
+        self.assertEqual(unit, "images/hour")
+    
+    def test_calculate_workload_costs(self):
+        """Test pricing many runs at once"""
+        runs = pd.DataFrame([
+            {"Provider": "AWS", "Workload": "LLM Fine-Tuning (Llama 3 8B)",
+             "Execution Time (min)": 60, "GPU": "NVIDIA A100"},
+            {"Provider": "FlexAI", "Workload": "Batch Inference (Stable Diffusion XL)",
+             "Execution Time (min)": 30, "GPU": "NVIDIA T4"}
+        ])
+        costs = calculate_workload_costs(runs, jitter=False)
+        
+        self.assertAlmostEqual(costs.iloc[0], round(3.60 * 1.2, 2))
+        self.assertAlmostEqual(costs.iloc[1], round(0.5 * 0.76 * 0.8, 2))
+
+if __name__ == "__main__":
+    unittest.main()